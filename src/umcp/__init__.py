@@ -4,7 +4,7 @@ UMCP platform reference package.
 
 This package implements:
 - Tier-0 trace admission (bounded Ψ(t) ∈ [0,1]^n under a frozen contract)
-- Tier-1 kernel series (ω, F, S, C, τ_R, IC, κ)
+- Tier-1 kernel series (ω, F, S, C, τ_R, IC, κ), row-wise or columnar
 - Closures (Γ) for drift cost D_ω
 - Weld evaluation (SS1m-style compact receipt)
 - Regime classification (Stable / Watch / Collapse)
@@ -16,7 +16,10 @@ from .contract import FrozenContract
 from .closures import GammaOmegaPower, GammaNegLogOneMinusOmega
 from .eid import prime_pi, EIDCounts, eid_checksum, delta_kappa_eid
 from .kernel import Tier1Row, compute_tier1_series
-from .weld import SS1mWeld, evaluate_weld
+from .frame import Tier1Frame, compute_tier1_frame
+from .stream import Tier1Stream
+from .lazy import LazyTier1Series
+from .weld import SS1mWeld, WeldTable, evaluate_weld, evaluate_welds
 
 __all__ = [
     "FrozenContract",
@@ -28,6 +31,12 @@ __all__ = [
     "delta_kappa_eid",
     "Tier1Row",
     "compute_tier1_series",
+    "Tier1Frame",
+    "compute_tier1_frame",
+    "Tier1Stream",
+    "LazyTier1Series",
     "SS1mWeld",
     "evaluate_weld",
+    "WeldTable",
+    "evaluate_welds",
 ]
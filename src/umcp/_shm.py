@@ -0,0 +1,71 @@
+# src/umcp/_shm.py
+"""
+Shared-memory plumbing for the process-pool engines (batch, sharded).
+
+The parent creates segments with segments(); workers map them per task with
+attached(). Tier-1 outputs live in one (len(TIER1_COLUMNS), T) float64 block.
+"""
+from __future__ import annotations
+
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from umcp.frame import TIER1_COLUMNS, Tier1Frame
+
+
+NCOLS = len(TIER1_COLUMNS)
+
+
+@contextmanager
+def segments(*sizes: int) -> Iterator[List[shared_memory.SharedMemory]]:
+    """Create one segment per byte size; all are closed and unlinked on exit."""
+    made: List[shared_memory.SharedMemory] = []
+    try:
+        for size in sizes:
+            # Zero-size segments are not allowed; pad every block to >= 1 byte.
+            made.append(shared_memory.SharedMemory(create=True, size=max(int(size), 1)))
+        yield made
+    finally:
+        for shm in made:
+            shm.close()
+            shm.unlink()
+
+
+@contextmanager
+def attached(names: Sequence[str]) -> Iterator[Tuple[memoryview, ...]]:
+    """
+    Map the named segments for one task and close them when it finishes, so
+    idle workers hold no mappings. Pool workers share the parent's resource
+    tracker, and the parent unlinks every segment once its run is done.
+    Views into the buffers must be dropped before the block exits.
+    """
+    segs: List[shared_memory.SharedMemory] = []
+    try:
+        for nm in names:
+            segs.append(shared_memory.SharedMemory(name=nm))
+        yield tuple(seg.buf for seg in segs)
+    finally:
+        for seg in segs:
+            seg.close()
+
+
+def tier1_block_bytes(T: int) -> int:
+    return 8 * NCOLS * int(T)
+
+
+def tier1_block(buf, T: int) -> np.ndarray:
+    """(NCOLS, T) float64 view of a Tier-1 output block."""
+    return np.ndarray((NCOLS, int(T)), dtype=np.float64, buffer=buf)
+
+
+def frame_view(block: np.ndarray, start: int, stop: int) -> Tier1Frame:
+    """Tier1Frame whose columns are views of block[:, start:stop]."""
+    return Tier1Frame(**{name: block[k, start:stop] for k, name in enumerate(TIER1_COLUMNS)})
+
+
+def frame_copy(block: np.ndarray, start: int, stop: int) -> Tier1Frame:
+    """Tier1Frame owning a copy of block[:, start:stop] (safe after unlink)."""
+    return Tier1Frame(**{name: block[k, start:stop].copy() for k, name in enumerate(TIER1_COLUMNS)})
@@ -0,0 +1,193 @@
+# src/umcp/batch.py
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from umcp import _shm
+from umcp.closures import DriftClosure, GammaOmegaPower
+from umcp.contract import FrozenContract
+from umcp.frame import DEFAULT_BLOCK_ROWS, Tier1Frame, _fill_tier1_columns
+from umcp.regime.classify import REGIME_NAMES, classify_regimes
+from umcp.tier0.admit import admit_trace
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class BatchResult:
+    """
+    Outcome for one trace of compute_tier1_batch.
+
+    index: position of the trace in the input sequence
+    frame: Tier-1 columns (None on failure)
+    regime_codes: uint8 codes into REGIME_NAMES, one per row (None on failure)
+    oor_count: number of raw entries flagged out-of-range by admission
+    error: "ExcType: message" if the trace failed, else None
+    """
+    index: int
+    frame: Optional[Tier1Frame]
+    regime_codes: Optional[np.ndarray]
+    oor_count: int
+    error: Optional[str]
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def regimes(self) -> List[str]:
+        if self.regime_codes is None:
+            return []
+        return [REGIME_NAMES[c] for c in self.regime_codes]
+
+
+@dataclass(frozen=True, slots=True)
+class _Job:
+    index: int
+    T: int
+    n: int
+    in_offset: int  # float64 elements into the input block
+    out_offset: int  # rows into the (7, total_T) output block
+    total_T: int
+
+
+def _run_job(
+    job: _Job,
+    raw: np.ndarray,
+    cols: np.ndarray,
+    codes: np.ndarray,
+    contract: FrozenContract,
+    drift_closure: Optional[DriftClosure],
+) -> int:
+    admitted = admit_trace(raw, contract)
+    Gamma = drift_closure if drift_closure is not None else GammaOmegaPower(p=float(contract.p), epsilon=float(contract.epsilon))
+    out = _shm.frame_view(cols, 0, job.T)
+    _fill_tier1_columns(admitted.psi, out, 0, job.T, contract, Gamma, DEFAULT_BLOCK_ROWS)
+    codes[:] = classify_regimes(out, contract)
+    return int(np.count_nonzero(admitted.oor_mask))
+
+
+def _views(job: _Job, bufs) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    in_buf, out_buf, code_buf = bufs
+    raw = np.ndarray((job.T, job.n), dtype=np.float64, buffer=in_buf, offset=8 * job.in_offset)
+    block = _shm.tier1_block(out_buf, job.total_T)
+    allcodes = np.ndarray((job.total_T,), dtype=np.uint8, buffer=code_buf)
+    sl = slice(job.out_offset, job.out_offset + job.T)
+    return raw, block[:, sl], allcodes[sl]
+
+
+def _execute(
+    job: _Job,
+    bufs,
+    contract: FrozenContract,
+    drift_closure: Optional[DriftClosure],
+) -> Tuple[int, int, Optional[str]]:
+    try:
+        oor = _run_job(job, *_views(job, bufs), contract, drift_closure)
+        return job.index, oor, None
+    except Exception as exc:  # reported per trace; the batch keeps going
+        return job.index, 0, f"{type(exc).__name__}: {exc}"
+
+
+def _worker(
+    job: _Job,
+    names: Tuple[str, str, str],
+    contract: FrozenContract,
+    drift_closure: Optional[DriftClosure],
+) -> Tuple[int, int, Optional[str]]:
+    try:
+        with _shm.attached(names) as bufs:
+            return _execute(job, bufs, contract, drift_closure)
+    except Exception as exc:  # attaching failed
+        return job.index, 0, f"{type(exc).__name__}: {exc}"
+
+
+def compute_tier1_batch(
+    traces: Sequence[np.ndarray],
+    contract: FrozenContract,
+    drift_closure: Optional[DriftClosure] = None,
+    *,
+    max_workers: Optional[int] = None,
+    mp_context=None,
+) -> List[BatchResult]:
+    """
+    admit_trace → compute_tier1_frame → classify_regimes over many independent
+    traces, spread over a process pool.
+
+    Raw traces are converted straight into a shared-memory block (no interim
+    float64 copies) and workers write Tier-1 columns and regime codes straight
+    into shared output blocks, so only small job descriptors (plus the
+    contract and closure) are pickled. Results come back in input order; a
+    failing trace yields a BatchResult with .error set and does not abort the
+    others. max_workers=1 runs in-process.
+    """
+    results: List[Optional[BatchResult]] = [None] * len(traces)
+
+    def fail(i: int, exc: Exception) -> None:
+        results[i] = BatchResult(i, None, None, 0, f"{type(exc).__name__}: {exc}")
+
+    # First pass: shapes only, so no trace is copied before it is packed.
+    shapes: Dict[int, Tuple[int, int]] = {}
+    for i, tr in enumerate(traces):
+        try:
+            shape = np.shape(tr)
+            if len(shape) != 2:
+                raise ValueError(f"raw trace must be 2D array shaped (T,n); got shape={shape}")
+        except Exception as exc:
+            fail(i, exc)
+            continue
+        shapes[i] = (int(shape[0]), int(shape[1]))
+
+    total_T = sum(T for T, _ in shapes.values())
+    jobs: List[_Job] = []
+    in_off = out_off = 0
+    for i, (T, n) in shapes.items():
+        jobs.append(_Job(i, T, n, in_off, out_off, total_T))
+        in_off += T * n
+        out_off += T
+
+    with _shm.segments(8 * in_off, _shm.tier1_block_bytes(total_T), total_T) as (in_shm, out_shm, code_shm):
+        # Second pass: convert each trace straight into its slot of the input block.
+        packed = np.ndarray((in_off,), dtype=np.float64, buffer=in_shm.buf)
+        ready: List[_Job] = []
+        for job in jobs:
+            try:
+                packed[job.in_offset:job.in_offset + job.T * job.n].reshape(job.T, job.n)[...] = traces[job.index]
+            except Exception as exc:
+                fail(job.index, exc)
+                continue
+            ready.append(job)
+        jobs = ready
+
+        names = (in_shm.name, out_shm.name, code_shm.name)
+        outcomes: Dict[int, Tuple[int, Optional[str]]] = {}
+        if max_workers == 1:
+            bufs = (in_shm.buf, out_shm.buf, code_shm.buf)
+            for job in jobs:
+                idx, oor, err = _execute(job, bufs, contract, drift_closure)
+                outcomes[idx] = (oor, err)
+            del bufs
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as pool:
+                futures = [(job.index, pool.submit(_worker, job, names, contract, drift_closure)) for job in jobs]
+                for idx, fut in futures:
+                    try:
+                        _, oor, err = fut.result()
+                    except Exception as exc:  # e.g. a worker died or args failed to pickle
+                        oor, err = 0, f"{type(exc).__name__}: {exc}"
+                    outcomes[idx] = (oor, err)
+
+        block = _shm.tier1_block(out_shm.buf, total_T)
+        allcodes = np.ndarray((total_T,), dtype=np.uint8, buffer=code_shm.buf)
+        for job in jobs:
+            oor, err = outcomes[job.index]
+            if err is not None:
+                results[job.index] = BatchResult(job.index, None, None, 0, err)
+                continue
+            sl = slice(job.out_offset, job.out_offset + job.T)
+            frame = _shm.frame_copy(block, sl.start, sl.stop)
+            results[job.index] = BatchResult(job.index, frame, allcodes[sl].copy(), oor, None)
+        del packed, block, allcodes
+
+    return [r for r in results if r is not None]
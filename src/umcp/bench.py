@@ -0,0 +1,263 @@
+# src/umcp/bench.py
+"""
+Benchmark suite: scaling curves for admission, the Tier-1 kernel, τ_R,
+welds, regime classification and EID.
+
+  python -m umcp.bench --out bench.json                 # full sweep
+  python -m umcp.bench --quick --out bench.json         # CI-sized sweep
+  python -m umcp.bench --baseline base.json --out new.json --threshold 0.25
+
+With --baseline, cases whose best time grew by more than --threshold (a
+fraction) are reported as regressions and the exit status is 1.
+"""
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+from functools import partial
+import json
+import platform
+import sys
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from umcp.contract import FrozenContract
+from umcp.eid import eid_checksum, prime_pi
+from umcp.frame import Tier1Frame, compute_tier1_frame
+from umcp.kernel import Tier1Row, compute_tier1_series
+from umcp.regime.classify import classify_regime, classify_regimes
+from umcp.synthetic import synthetic_trace
+from umcp.tau import return_lags
+from umcp.tier0.admit import admit_trace
+from umcp.weld import evaluate_weld, evaluate_welds
+from umcp.wide import compute_tier1_wide
+
+
+SCHEMA_VERSION = 1
+
+
+@dataclass(frozen=True, slots=True)
+class BenchCase:
+    """
+    One timed call: fn() is run `repeats` times after one warm-up.
+
+    With setup, its (untimed) result is built just before the case runs and
+    passed as fn(data), so skipped cases never build their inputs.
+    """
+    name: str
+    params: Dict[str, Any]
+    fn: Callable[..., Any]
+    repeats: int = 3
+    setup: Optional[Callable[[], Any]] = None
+
+    @property
+    def key(self) -> str:
+        items = ",".join(f"{k}={self.params[k]}" for k in sorted(self.params))
+        return f"{self.name}[{items}]"
+
+
+@dataclass(frozen=True, slots=True)
+class BenchResult:
+    name: str
+    params: Dict[str, Any]
+    key: str
+    min_s: float
+    median_s: float
+    repeats: int
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "params": self.params,
+            "key": self.key,
+            "min_s": self.min_s,
+            "median_s": self.median_s,
+            "repeats": self.repeats,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class Regression:
+    key: str
+    baseline_s: float
+    current_s: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_s / self.baseline_s if self.baseline_s > 0 else float("inf")
+
+
+def time_case(case: BenchCase) -> BenchResult:
+    args = (case.setup(),) if case.setup is not None else ()
+    case.fn(*args)  # warm-up (imports, prime table, caches)
+    samples: List[float] = []
+    for _ in range(max(case.repeats, 1)):
+        t0 = time.perf_counter()
+        case.fn(*args)
+        samples.append(time.perf_counter() - t0)
+    del args
+    return BenchResult(
+        name=case.name,
+        params=dict(case.params),
+        key=case.key,
+        min_s=min(samples),
+        median_s=float(np.median(samples)),
+        repeats=len(samples),
+    )
+
+
+# Case inputs, built by BenchCase.setup.
+
+def _head(make: Callable[[], np.ndarray], rows: int) -> np.ndarray:
+    return make()[:rows]
+
+
+def _weld_frame(T: int, contract: FrozenContract) -> Tuple[Tier1Frame, List[Tier1Row]]:
+    frame = compute_tier1_frame(synthetic_trace("collapsing", T, 16), contract)
+    return frame, frame.rows()
+
+
+def _counts(k: int) -> np.ndarray:
+    return np.random.default_rng(k).integers(0, 1000, size=k, dtype=np.int64)
+
+
+def default_cases(quick: bool = False) -> Iterator[BenchCase]:
+    """
+    The standard sweep; quick=True shrinks every axis for CI. Inputs are
+    built by each case's setup, only when that case runs.
+    """
+    Ts = (500, 2000) if quick else (1000, 4000, 16000)
+    ns = (8, 64) if quick else (8, 64, 256)
+    lookbacks = (16, 256) if quick else (16, 256, 4096)
+    series_T = Ts[:1] if quick else Ts[:2]  # the row loop is the slow reference
+    returning = FrozenContract(tol_id=1e-6)
+
+    for T in Ts:
+        for n in ns:
+            raw = partial(synthetic_trace, "drifting", T, n, oor_rate=1e-3)
+            yield BenchCase("admit_trace", {"T": T, "n": n}, lambda x: admit_trace(x, returning), setup=raw)
+            yield BenchCase("compute_tier1_frame", {"T": T, "n": n}, lambda x: compute_tier1_frame(x, returning), setup=raw)
+
+    for T in series_T:
+        for n in ns:
+            yield BenchCase(
+                "compute_tier1_series",
+                {"T": T, "n": n, "tau_lookback": 256},
+                lambda psi: compute_tier1_series(psi, returning),
+                repeats=1,
+                setup=partial(synthetic_trace, "drifting", T, n),
+            )
+
+    for lookback in lookbacks:
+        contract = FrozenContract(tol_id=1e-6, tau_lookback=lookback)
+        for regime in ("periodic", "drifting"):
+            psi = partial(synthetic_trace, regime, Ts[-1], 16, period=max(lookback // 2, 2))
+            params = {"T": Ts[-1], "n": 16, "tau_lookback": lookback, "regime": regime}
+            yield BenchCase("return_lags", params, lambda x, c=contract: return_lags(x, c), setup=psi)
+            if lookback <= 256:
+                # The leading Ts[0] rows of the same trace.
+                yield BenchCase(
+                    "compute_tier1_series",
+                    {**params, "T": Ts[0]},
+                    lambda x, c=contract: compute_tier1_series(x, c),
+                    repeats=1,
+                    setup=partial(_head, psi, Ts[0]),
+                )
+
+    wide_n = 8192 if quick else 32768
+    wide = partial(synthetic_trace, "drifting", 256, wide_n)
+    yield BenchCase("compute_tier1_frame", {"T": 256, "n": wide_n}, lambda x: compute_tier1_frame(x, returning), setup=wide)
+    for workers in ((1, 2) if quick else (1, 2, 4, 8)):
+        yield BenchCase(
+            "compute_tier1_wide",
+            {"T": 256, "n": wide_n, "workers": workers},
+            lambda x, w=workers: compute_tier1_wide(x, returning, max_workers=w),
+            setup=wide,
+        )
+
+    contract = FrozenContract()
+    T = Ts[-1]
+    k = min(T - 1, 2000)
+    welds = partial(_weld_frame, T, returning)
+    yield BenchCase("evaluate_weld", {"pairs": k}, lambda fr: [evaluate_weld(fr[1][i], fr[1][i + 1], contract) for i in range(k)], setup=welds)
+    idx = np.arange(T - 1)
+    yield BenchCase(
+        "evaluate_welds",
+        {"pairs": int(idx.size)},
+        lambda fr: evaluate_welds(fr[0], fr[0], contract, pre_index=idx, post_index=idx + 1),
+        setup=welds,
+    )
+    yield BenchCase("classify_regime", {"rows": k}, lambda fr: [classify_regime(fr[1][i], contract) for i in range(k)], setup=welds)
+    yield BenchCase("classify_regimes", {"rows": T}, lambda fr: classify_regimes(fr[0], contract), setup=welds)
+
+    for n in ((10**5, 10**6) if quick else (10**5, 10**7, 10**10)):
+        yield BenchCase("prime_pi", {"n": n}, lambda n=n: prime_pi(n))
+    for k in ((10**4, 10**5) if quick else (10**4, 10**6, 10**7)):
+        yield BenchCase("eid_checksum", {"bins": k}, eid_checksum, setup=partial(_counts, k))
+
+
+def run_suite(cases: Sequence[BenchCase] | Iterator[BenchCase], progress: Optional[Callable[[BenchResult], None]] = None) -> Dict[str, Any]:
+    results = []
+    for case in cases:
+        res = time_case(case)
+        if progress is not None:
+            progress(res)
+        results.append(res.as_dict())
+    return {
+        "schema": SCHEMA_VERSION,
+        "meta": {
+            "python": sys.version.split()[0],
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float = 0.2) -> List[Regression]:
+    """Cases present in both runs whose min time grew by more than threshold."""
+    base = {r["key"]: float(r["min_s"]) for r in baseline.get("results", [])}
+    out: List[Regression] = []
+    for r in current.get("results", []):
+        b = base.get(r["key"])
+        if b is None:
+            continue
+        cur = float(r["min_s"])
+        if cur > b * (1.0 + threshold):
+            out.append(Regression(key=r["key"], baseline_s=b, current_s=cur))
+    return out
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m umcp.bench", description=__doc__.split("\n\n")[0])
+    ap.add_argument("--out", help="write results JSON here")
+    ap.add_argument("--baseline", help="compare against this results JSON")
+    ap.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown fraction (default 0.2)")
+    ap.add_argument("--quick", action="store_true", help="small sweep for CI")
+    ap.add_argument("--filter", default="", help="only run cases whose name contains this")
+    args = ap.parse_args(argv)
+
+    cases = (c for c in default_cases(quick=args.quick) if args.filter in c.name)
+    report = run_suite(cases, progress=lambda r: print(f"{r.min_s * 1e3:12.3f} ms  {r.key}", flush=True))
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        regressions = compare(report, baseline, threshold=args.threshold)
+        for reg in regressions:
+            print(f"REGRESSION {reg.ratio:6.2f}x  {reg.key}  ({reg.baseline_s:.4g}s -> {reg.current_s:.4g}s)")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
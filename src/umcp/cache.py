@@ -0,0 +1,412 @@
+# src/umcp/cache.py
+"""
+Opt-in, content-addressed on-disk cache for kernel, admission and weld results.
+
+Keys are blake2b digests of the input array bytes (with dtype and shape), the
+canonical JSON of the FrozenContract fields, and the closure's type and
+parameters. Entries are files under <root>/<kind>/<key>.<ext>:
+
+  tier1  store.write_tier1 columnar file (compute_tier1_series)
+  weld   store.write_welds columnar file, one per call: a whole WeldTable
+         (evaluate_welds) or a single receipt (evaluate_weld)
+  admit  .npz with ψ and the bit-packed OOR mask (admit_trace)
+
+Writers go to a temporary file in the same directory and os.replace() it
+into place, so readers never see partial entries. Recency is the file mtime
+(touched on every hit). Each handle keeps an LRU index and a running size
+total, seeded by one directory scan and updated as entries are stored and
+hit, so a store costs O(1). Only when the running total exceeds max_bytes
+is the directory rescanned (under an exclusive lock on <root>/.lock, which
+also picks up other processes' entries) and the oldest entries evicted down
+to a low-water mark, so several worker processes can share one directory.
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, fields, is_dataclass
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import Callable, Iterator, List, Optional, Union
+import zipfile
+
+import numpy as np
+
+from umcp.closures import DriftClosure
+from umcp.contract import FrozenContract
+from umcp.instrument import _ACTIVE
+from umcp.frame import TIER1_COLUMNS, Tier1Frame
+from umcp.kernel import Tier1Row, compute_tier1_series
+from umcp.store import read_tier1, read_welds, write_tier1, write_welds
+from umcp.tier0.admit import AdmittedTrace, admit_trace
+from umcp.weld import WELD_COLUMNS, SS1mWeld, WeldTable, evaluate_weld, evaluate_welds
+
+try:  # POSIX advisory locks; without them eviction is best-effort.
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX
+    fcntl = None  # type: ignore[assignment]
+
+
+PathLike = Union[str, os.PathLike]
+
+# Bumped whenever an entry's encoding or a keyed computation changes.
+CACHE_VERSION = 1
+
+DEFAULT_MAX_BYTES = 1 << 30
+
+# Eviction trims to this fraction of max_bytes, so a full cache rescans once
+# per ~10% of max_bytes written rather than on every store.
+_LOW_WATER = 0.9
+
+_DIGEST_SIZE = 20
+_HASH_CHUNK = 1 << 24
+_EXT = {"tier1": ".col", "weld": ".col", "admit": ".npz"}
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    hits: int
+    misses: int
+    bypassed: int  # closures that cannot be keyed; computed without the cache
+    stores: int
+    evictions: int
+    bytes_read: int
+    bytes_written: int
+
+    @property
+    def hit_rate(self) -> float:
+        looked_up = self.hits + self.misses
+        return self.hits / looked_up if looked_up else 0.0
+
+
+def array_digest(a: np.ndarray) -> str:
+    """blake2b of dtype, shape and C-order bytes; large arrays are hashed in chunks."""
+    x = np.ascontiguousarray(a)
+    h = hashlib.blake2b(digest_size=_DIGEST_SIZE)
+    h.update(f"{x.dtype.str}{x.shape}".encode("ascii"))
+    flat = x.reshape(-1).view(np.uint8) if x.size else np.empty(0, dtype=np.uint8)
+    for i in range(0, flat.shape[0], _HASH_CHUNK):
+        h.update(memoryview(flat[i:i + _HASH_CHUNK]))
+    return h.hexdigest()
+
+
+def contract_digest(contract: FrozenContract) -> str:
+    blob = json.dumps(asdict(contract), sort_keys=True, allow_nan=True)
+    return hashlib.blake2b(blob.encode("utf-8"), digest_size=_DIGEST_SIZE).hexdigest()
+
+
+def _json_param(v: object) -> object:
+    if isinstance(v, np.generic):
+        return v.item()
+    if isinstance(v, np.ndarray):
+        return [v.dtype.str, list(v.shape), v.tolist()]
+    raise TypeError(f"cannot key closure parameter of type {type(v).__name__}")
+
+
+def closure_digest(closure: Optional[Callable[[float], float]]) -> Optional[str]:
+    """
+    Digest of a closure's type and parameters. None (the contract default) has
+    a fixed digest; dataclass closures hash their fields (NumPy scalars and
+    arrays included). Anything else (a lambda, an object with hidden state, a
+    field JSON cannot encode) cannot be keyed safely: returns None.
+    """
+    if closure is None:
+        ident = "default"
+    elif is_dataclass(closure) and isinstance(closure, DriftClosure):
+        cls = type(closure)
+        params = {f.name: getattr(closure, f.name) for f in fields(closure)}
+        try:
+            ident = json.dumps(
+                [f"{cls.__module__}.{cls.__qualname__}", params], sort_keys=True, allow_nan=True, default=_json_param
+            )
+        except (TypeError, ValueError):
+            return None
+    else:
+        return None
+    return hashlib.blake2b(ident.encode("utf-8"), digest_size=_DIGEST_SIZE).hexdigest()
+
+
+def _frame_digest(frame: Tier1Frame) -> str:
+    """Digest of the Tier-1 columns (not the time labels)."""
+    h = hashlib.blake2b(digest_size=_DIGEST_SIZE)
+    for name in TIER1_COLUMNS:
+        h.update(array_digest(frame.column(name)).encode("ascii"))
+    return h.hexdigest()
+
+
+def _index_digest(index: Optional[np.ndarray]) -> str:
+    return "all" if index is None else array_digest(np.asarray(index, dtype=np.int64))
+
+
+def _row_array(row: Tier1Row) -> np.ndarray:
+    # row.t is only a label; the receipt does not depend on it.
+    return np.array([row.omega, row.F, row.S, row.C, row.tau_R, row.IC, row.kappa], dtype="<f8")
+
+
+class ResultCache:
+    """
+    Content-addressed result cache rooted at a local directory.
+
+    compute_tier1_series / admit_trace / evaluate_weld(s) mirror the functions of
+    the same name and return equal results, from disk when the same inputs
+    were seen before. stats() reports this process's hits and misses; under
+    an active instrument.collect() they are also counted as cache.hit /
+    cache.miss.
+    """
+
+    def __init__(self, root: PathLike, *, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        if max_bytes < 0:
+            raise ValueError(f"max_bytes must be >= 0; got {max_bytes}")
+        self.root = os.fspath(root)
+        self.max_bytes = int(max_bytes)
+        for kind in _EXT:
+            os.makedirs(os.path.join(self.root, kind), exist_ok=True)
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(("hits", "misses", "bypassed", "stores", "evictions", "bytes_read", "bytes_written"), 0)
+        self._index: "OrderedDict[str, int]" = OrderedDict()  # path -> size, least recent first
+        self._total = 0
+        self._rescan()
+
+    # -- bookkeeping -----------------------------------------------------
+
+    def _count(self, name: str, k: int = 1) -> None:
+        with self._lock:
+            self._counts[name] += k
+        collector = _ACTIVE.get()
+        if collector is not None and name in ("hits", "misses"):
+            collector.incr("cache.hit" if name == "hits" else "cache.miss", k)
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(**self._counts)
+
+    def _key(self, kind: str, *parts: str) -> str:
+        h = hashlib.blake2b(digest_size=_DIGEST_SIZE)
+        h.update(f"umcp-cache/{CACHE_VERSION}/{kind}".encode("ascii"))
+        for part in parts:
+            h.update(b"\0" + part.encode("ascii"))
+        return h.hexdigest()
+
+    def _path(self, kind: str, key: str) -> str:
+        return os.path.join(self.root, kind, key + _EXT[kind])
+
+    def _entries(self) -> Iterator[os.DirEntry]:
+        for kind in _EXT:
+            with os.scandir(os.path.join(self.root, kind)) as it:
+                for entry in it:
+                    if entry.is_file() and not entry.name.startswith("."):
+                        yield entry
+
+    def _rescan(self) -> None:
+        """Rebuild the LRU index and running total from the directory (mtime order)."""
+        stamped: List[tuple] = []
+        for entry in self._entries():
+            try:
+                st = entry.stat()
+            except FileNotFoundError:
+                continue
+            stamped.append((st.st_mtime_ns, entry.path, st.st_size))
+        stamped.sort()
+        with self._lock:
+            self._index = OrderedDict((path, size) for _, path, size in stamped)
+            self._total = sum(size for _, _, size in stamped)
+
+    def _touch(self, path: str, size: int) -> None:
+        """Record path as the most recently used entry."""
+        with self._lock:
+            self._total += size - self._index.pop(path, 0)
+            self._index[path] = size
+
+    def _forget(self, path: str) -> None:
+        with self._lock:
+            self._total -= self._index.pop(path, 0)
+
+    def size_bytes(self) -> int:
+        """Total size of all entries on disk."""
+        total = 0
+        for entry in self._entries():
+            try:
+                total += entry.stat().st_size
+            except FileNotFoundError:  # evicted by another process meanwhile
+                pass
+        return total
+
+    # -- entry I/O -------------------------------------------------------
+
+    def _load(self, kind: str, key: str, read: Callable[[str], object]) -> Optional[object]:
+        path = self._path(kind, key)
+        try:
+            value = read(path)
+            size = os.path.getsize(path)
+            os.utime(path)  # LRU recency
+        except FileNotFoundError:
+            self._forget(path)
+            self._count("misses")
+            return None
+        except (ValueError, OSError, KeyError, EOFError, zipfile.BadZipFile):
+            # Unreadable entry (e.g. a foreign file): drop it and recompute.
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            self._forget(path)
+            self._count("misses")
+            return None
+        self._touch(path, size)
+        self._count("hits")
+        self._count("bytes_read", size)
+        return value
+
+    def _save(self, kind: str, key: str, write: Callable[[str], None]) -> None:
+        path = self._path(kind, key)
+        fd, tmp = tempfile.mkstemp(prefix=".tmp-", suffix=_EXT[kind], dir=os.path.dirname(path))
+        os.close(fd)
+        try:
+            write(tmp)
+            size = os.path.getsize(tmp)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
+        self._touch(path, size)
+        self._count("stores")
+        self._count("bytes_written", size)
+        if self._total > self.max_bytes:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Rescan, then drop least-recently-used entries down to the low-water mark."""
+        with open(os.path.join(self.root, ".lock"), "a+b") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            try:
+                self._rescan()  # other processes may have stored or evicted
+                target = int(self.max_bytes * _LOW_WATER)
+                while True:
+                    with self._lock:
+                        if self._total <= target or not self._index:
+                            break
+                        path, size = self._index.popitem(last=False)
+                        self._total -= size
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        continue
+                    self._count("evictions")
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+
+    def clear(self) -> None:
+        for entry in list(self._entries()):
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass
+        with self._lock:
+            self._index.clear()
+            self._total = 0
+
+    # -- cached operations -----------------------------------------------
+
+    def compute_tier1_series(
+        self,
+        psi: np.ndarray,
+        contract: FrozenContract,
+        drift_closure: Optional[DriftClosure] = None,
+    ) -> List[Tier1Row]:
+        cd = closure_digest(drift_closure)
+        if cd is None:
+            self._count("bypassed")
+            return compute_tier1_series(psi, contract, drift_closure)
+        key = self._key("tier1", array_digest(np.asarray(psi)), contract_digest(contract), cd)
+        rows = self._load("tier1", key, lambda path: read_tier1(path).frame.rows())
+        if rows is None:
+            rows = compute_tier1_series(psi, contract, drift_closure)
+            self._save("tier1", key, lambda path: write_tier1(path, rows, contract))
+        return rows  # type: ignore[return-value]
+
+    def admit_trace(self, raw: np.ndarray, contract: FrozenContract) -> AdmittedTrace:
+        key = self._key("admit", array_digest(np.asarray(raw)), contract_digest(contract))
+        adm = self._load("admit", key, _read_admitted)
+        if adm is None:
+            adm = admit_trace(raw, contract)
+            self._save("admit", key, lambda path: _write_admitted(path, adm))
+        return adm  # type: ignore[return-value]
+
+    def evaluate_weld(
+        self,
+        pre: Tier1Row,
+        post: Tier1Row,
+        contract: FrozenContract,
+        drift_closure: Optional[DriftClosure] = None,
+    ) -> SS1mWeld:
+        """One pair; for many pairs use evaluate_welds, which stores one entry per table."""
+        cd = closure_digest(drift_closure)
+        if cd is None:
+            self._count("bypassed")
+            return evaluate_weld(pre, post, contract, drift_closure)
+        rows = np.concatenate([_row_array(pre), _row_array(post)])
+        key = self._key("weld", "pair", array_digest(rows), contract_digest(contract), cd)
+        w = self._load("weld", key, lambda path: read_welds(path).table.receipt(0))
+        if w is None:
+            w = evaluate_weld(pre, post, contract, drift_closure)
+            self._save("weld", key, lambda path: write_welds(path, [w], contract))
+        return w  # type: ignore[return-value]
+
+    def evaluate_welds(
+        self,
+        pre: Tier1Frame,
+        post: Tier1Frame,
+        contract: FrozenContract,
+        drift_closure: Optional[DriftClosure] = None,
+        *,
+        pre_index: Optional[np.ndarray] = None,
+        post_index: Optional[np.ndarray] = None,
+    ) -> WeldTable:
+        """Whole-table weld.evaluate_welds, stored as one entry per call."""
+        cd = closure_digest(drift_closure)
+        if cd is None:
+            self._count("bypassed")
+            return evaluate_welds(pre, post, contract, drift_closure, pre_index=pre_index, post_index=post_index)
+        pd = _frame_digest(pre)
+        key = self._key(
+            "weld",
+            "table",
+            pd,
+            pd if post is pre else _frame_digest(post),
+            _index_digest(pre_index),
+            _index_digest(post_index),
+            contract_digest(contract),
+            cd,
+        )
+        table = self._load("weld", key, _read_weld_table)
+        if table is None:
+            table = evaluate_welds(pre, post, contract, drift_closure, pre_index=pre_index, post_index=post_index)
+            self._save("weld", key, lambda path: write_welds(path, table, contract))
+        return table  # type: ignore[return-value]
+
+
+def _write_admitted(path: str, adm: AdmittedTrace) -> None:
+    with open(path, "wb") as fh:
+        np.savez(fh, psi=adm.psi, oor=np.packbits(adm.oor_mask, axis=None), shape=np.array(adm.oor_mask.shape))
+
+
+def _read_weld_table(path: str) -> WeldTable:
+    # Copy out of the mapping: the file may be evicted, and a miss returns
+    # writable arrays the caller owns.
+    table = read_welds(path).table
+    return WeldTable(**{name: np.array(getattr(table, name)) for name in WELD_COLUMNS})
+
+
+def _read_admitted(path: str) -> AdmittedTrace:
+    with np.load(path, allow_pickle=False) as z:
+        shape = tuple(int(v) for v in z["shape"])
+        count = int(np.prod(shape))
+        oor = np.unpackbits(z["oor"], count=count).astype(bool).reshape(shape)
+        return AdmittedTrace(psi=z["psi"], oor_mask=oor)
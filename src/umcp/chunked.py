@@ -0,0 +1,109 @@
+# src/umcp/chunked.py
+from __future__ import annotations
+
+import os
+from typing import Optional, Union
+
+import numpy as np
+
+from umcp.closures import DriftClosure, GammaOmegaPower
+from umcp.contract import FrozenContract
+from umcp.frame import DEFAULT_BLOCK_ROWS, TIER1_COLUMNS, Tier1Frame, _fill_tier1_columns, _Tier1Workspace
+from umcp.tier0.admit import _check_policies
+
+
+TraceSource = Union[str, os.PathLike, np.ndarray]
+
+DEFAULT_CHUNK_ROWS = 65536
+
+
+def open_trace(source: TraceSource, n: Optional[int] = None, dtype: np.dtype = np.float64) -> np.ndarray:
+    """
+    Open a (T,n) trace without reading it into memory.
+
+    - ndarray / np.memmap: returned as-is
+    - *.npy path: memory-mapped read-only via np.load(mmap_mode="r")
+    - any other path: raw row-major binary of `dtype`; n is required
+    """
+    if isinstance(source, np.ndarray):
+        return source
+    path = os.fspath(source)
+    if path.endswith(".npy"):
+        return np.load(path, mmap_mode="r")
+    if n is None:
+        raise ValueError("n (coordinates per row) is required for raw binary traces")
+    flat = np.memmap(path, dtype=dtype, mode="r")
+    if flat.shape[0] % int(n) != 0:
+        raise ValueError(f"raw trace of {flat.shape[0]} values is not a multiple of n={n}")
+    return flat.reshape(-1, int(n))
+
+
+def halo_rows(contract: FrozenContract) -> int:
+    """Prior rows a chunk needs: 2 for C (ω needs 1) and tau_lookback for τ_R."""
+    return max(2, int(contract.tau_lookback))
+
+
+def _output_frame(T: int, out_dir: Optional[Union[str, os.PathLike]]) -> Tier1Frame:
+    if out_dir is None:
+        return Tier1Frame.empty(T)
+    os.makedirs(out_dir, exist_ok=True)
+    cols = {
+        name: np.lib.format.open_memmap(os.path.join(out_dir, f"{name}.npy"), mode="w+", dtype=np.float64, shape=(T,))
+        for name in TIER1_COLUMNS
+    }
+    return Tier1Frame(**cols)
+
+
+def compute_tier1_chunked(
+    source: TraceSource,
+    contract: FrozenContract,
+    drift_closure: Optional[DriftClosure] = None,
+    *,
+    out_dir: Optional[Union[str, os.PathLike]] = None,
+    n: Optional[int] = None,
+    dtype: np.dtype = np.float64,
+    admit: bool = True,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    block_rows: int = DEFAULT_BLOCK_ROWS,
+) -> Tier1Frame:
+    """
+    Out-of-core Tier-1 series over a memory-mapped trace.
+
+    The trace is read in chunks of chunk_rows time indices, each preceded by a
+    halo of halo_rows(contract) rows, so peak memory is about
+    (chunk_rows + halo)·n floats regardless of T. With admit=True every chunk is
+    admitted (pre_clip to [a,b]) on the fly, i.e. the result equals
+    compute_tier1_frame(admit_trace(raw).psi) exactly; with admit=False the
+    source must already be an admitted Ψ(t).
+
+    With out_dir set, each Tier-1 column is written to <out_dir>/<symbol>.npy
+    and the returned frame holds the memory-mapped columns.
+    """
+    src = open_trace(source, n=n, dtype=dtype)
+    if src.ndim != 2:
+        raise ValueError(f"trace must be 2D array shaped (T,n); got shape={src.shape}")
+    if chunk_rows < 1:
+        raise ValueError(f"chunk_rows must be >= 1; got {chunk_rows}")
+    if admit:
+        _check_policies(contract)
+
+    Gamma = drift_closure if drift_closure is not None else GammaOmegaPower(p=float(contract.p), epsilon=float(contract.epsilon))
+
+    T = src.shape[0]
+    halo = halo_rows(contract)
+    out = _output_frame(T, out_dir)
+    ws = _Tier1Workspace(max(min(block_rows, chunk_rows, T), 1), src.shape[1])
+
+    for start in range(0, T, chunk_rows):
+        stop = min(start + chunk_rows, T)
+        lo = max(0, start - halo)
+        x = np.array(src[lo:stop], dtype=contract.float_dtype)
+        if admit:
+            np.clip(x, contract.a, contract.b, out=x)
+        _fill_tier1_columns(x, out.slice(start, stop), start - lo, stop - lo, contract, Gamma, block_rows, ws)
+
+    for name in TIER1_COLUMNS:
+        col = out.column(name)
+        if isinstance(col, np.memmap):
+            col.flush()
+    return out
@@ -3,13 +3,93 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import math
+from typing import Callable, Dict, Optional, Union
+
+import numpy as np
+
+
+OmegaLike = Union[float, np.ndarray]
+
+# Integer exponents up to this value use repeated multiplication instead of pow.
+_MAX_INT_EXPONENT = 16
+
+# Step for the default (finite-difference) DriftClosure.derivative.
+_DERIVATIVE_STEP = 1e-6
 
 
 class DriftClosure:
-    """Protocol-like base for Γ(ω) closures used to compute drift-cost D_ω."""
+    """
+    Protocol-like base for Γ(ω) closures used to compute drift-cost D_ω.
+
+    Subclasses must implement the scalar form __call__(float) -> float. Array
+    callers go through evaluate(ndarray) -> ndarray, which by default applies
+    the scalar form element by element; closures with a native array path
+    override it (and may accept ndarrays in __call__ as well).
+
+    derivative(ω) is dΓ/dω (central difference unless overridden) and
+    param_derivatives(ω) maps closure parameter names to ∂Γ/∂param (empty
+    unless overridden); both are used by umcp.sensitivity.
+    """
     def __call__(self, omega: float) -> float:  # pragma: no cover
         raise NotImplementedError
 
+    def evaluate(self, omega: np.ndarray) -> np.ndarray:
+        return _map_scalar(self, omega)
+
+    def derivative(self, omega: np.ndarray) -> np.ndarray:
+        w = np.asarray(omega, dtype=float)
+        h = _DERIVATIVE_STEP * np.maximum(np.abs(w), 1.0)
+        return (evaluate_closure(self, w + h) - evaluate_closure(self, w - h)) / (2.0 * h)
+
+    def param_derivatives(self, omega: np.ndarray) -> Dict[str, np.ndarray]:
+        return {}
+
+
+def _map_scalar(fn: Callable[[float], float], omega: np.ndarray) -> np.ndarray:
+    w = np.asarray(omega, dtype=float)
+    out = np.fromiter((float(fn(float(v))) for v in w.ravel()), dtype=float, count=w.size)
+    return out.reshape(w.shape)
+
+
+def evaluate_closure(closure: Union[DriftClosure, Callable[[float], float]], omega: np.ndarray) -> np.ndarray:
+    """
+    Γ over an array of ω for any closure.
+
+    DriftClosure subclasses use their evaluate(); plain scalar callables are
+    adapted element by element.
+    """
+    evaluate = getattr(closure, "evaluate", None)
+    if evaluate is not None:
+        return np.asarray(evaluate(omega), dtype=float)
+    return _map_scalar(closure, omega)
+
+
+def closure_derivative(closure: Union[DriftClosure, Callable[[float], float]], omega: np.ndarray) -> np.ndarray:
+    """dΓ/dω over an array of ω; plain scalar callables get a central difference."""
+    derivative = getattr(closure, "derivative", None)
+    if derivative is not None:
+        return np.asarray(derivative(omega), dtype=float)
+    return DriftClosure.derivative(closure, omega)  # type: ignore[arg-type]
+
+
+def _int_exponent(p: float) -> Optional[int]:
+    if math.isfinite(p) and p == int(p) and 1 <= p <= _MAX_INT_EXPONENT:
+        return int(p)
+    return None
+
+
+def _int_power(w: OmegaLike, k: int) -> OmegaLike:
+    # Exponentiation by squaring; k=3 is exactly w*w*w.
+    result = None
+    base = w
+    while True:
+        if k & 1:
+            result = base if result is None else result * base
+        k >>= 1
+        if not k:
+            return result
+        base = base * base
+
 
 @dataclass(frozen=True, slots=True)
 class GammaOmegaPower(DriftClosure):
@@ -17,14 +97,41 @@ class GammaOmegaPower(DriftClosure):
     Γ(ω; p, ε) = max(ω, 0)^p + ε
 
     - Monotone in ω for ω>=0
-    - Smooth enough for finite-difference sensitivity
+    - Smooth for ω > 0; closed-form dΓ/dω, ∂Γ/∂p and ∂Γ/∂ε are provided
+    - Integer p (the default p=3) is evaluated by multiplication, not pow
     """
     p: float = 3.0
     epsilon: float = 1e-8
 
-    def __call__(self, omega: float) -> float:
+    def __call__(self, omega: OmegaLike) -> OmegaLike:
+        if isinstance(omega, np.ndarray):
+            return self.evaluate(omega)
         w = omega if omega > 0.0 else 0.0
-        return (w ** self.p) + self.epsilon
+        k = _int_exponent(self.p)
+        wp = _int_power(w, k) if k is not None else w ** self.p
+        return wp + self.epsilon
+
+    def evaluate(self, omega: np.ndarray) -> np.ndarray:
+        w = np.maximum(np.asarray(omega, dtype=float), 0.0)
+        k = _int_exponent(self.p)
+        wp = _int_power(w, k) if k is not None else np.power(w, self.p)
+        return wp + self.epsilon
+
+    def derivative(self, omega: np.ndarray) -> np.ndarray:
+        # p·ω^(p-1) for ω > 0, 0 otherwise.
+        w = np.asarray(omega, dtype=float)
+        pos = w > 0.0
+        out = np.zeros_like(w)
+        out[pos] = self.p * np.power(w[pos], self.p - 1.0)
+        return out
+
+    def param_derivatives(self, omega: np.ndarray) -> Dict[str, np.ndarray]:
+        # ∂/∂p max(ω,0)^p = ω^p·ln ω (0 at ω <= 0); ∂/∂ε = 1.
+        w = np.asarray(omega, dtype=float)
+        pos = w > 0.0
+        d_p = np.zeros_like(w)
+        d_p[pos] = np.power(w[pos], self.p) * np.log(w[pos])
+        return {"p": d_p, "epsilon": np.ones_like(w)}
 
 
 @dataclass(frozen=True, slots=True)
@@ -36,8 +143,25 @@ class GammaNegLogOneMinusOmega(DriftClosure):
     """
     epsilon: float = 1e-8
 
-    def __call__(self, omega: float) -> float:
+    def __call__(self, omega: OmegaLike) -> OmegaLike:
+        if isinstance(omega, np.ndarray):
+            return self.evaluate(omega)
         x = 1.0 - omega
         if x < self.epsilon:
             x = self.epsilon
         return -math.log(x)
+
+    def evaluate(self, omega: np.ndarray) -> np.ndarray:
+        x = 1.0 - np.asarray(omega, dtype=float)
+        x = np.where(x < self.epsilon, self.epsilon, x)
+        return -np.log(x)
+
+    def derivative(self, omega: np.ndarray) -> np.ndarray:
+        # 1/(1-ω) where 1-ω >= ε; flat (0) where the floor is active.
+        x = 1.0 - np.asarray(omega, dtype=float)
+        floored = x < self.epsilon
+        return np.where(floored, 0.0, 1.0 / np.where(floored, 1.0, x))
+
+    def param_derivatives(self, omega: np.ndarray) -> Dict[str, np.ndarray]:
+        x = 1.0 - np.asarray(omega, dtype=float)
+        return {"epsilon": np.where(x < self.epsilon, -1.0 / self.epsilon, 0.0)}
@@ -4,10 +4,13 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Literal
 
+import numpy as np
+
 
 FacePolicy = Literal["pre_clip"]
 OORPolicy = Literal["clip_and_flag"]
 TauPolicy = Literal["inf_rec"]
+Precision = Literal["float64", "float32"]
 
 
 @dataclass(frozen=True, slots=True)
@@ -54,6 +57,20 @@ class FrozenContract:
     # Metadata
     tz: str = "America/Chicago"
 
+    # Storage dtype of admitted traces in the array engines. "float32" halves
+    # trace memory/bandwidth; reductions, κ and Tier-1 columns stay float64.
+    # The row-wise compute_tier1_series reference always runs in float64.
+    # Last field, so positional construction of the older fields is unchanged.
+    precision: Precision = "float64"
+
+    def __post_init__(self) -> None:
+        if self.precision not in ("float64", "float32"):
+            raise ValueError(f"unsupported precision: {self.precision}")
+
+    @property
+    def float_dtype(self) -> np.dtype:
+        return np.dtype(self.precision)
+
     def clamp(self, x: float) -> float:
         if x < self.a:
             return self.a
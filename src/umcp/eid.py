@@ -1,55 +1,91 @@
 # src/umcp/eid.py
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import math
-from typing import Iterable, List, Sequence
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from umcp.primes import first_primes, prime_count, primes_upto
 
 
 def _sieve_primes_upto(n: int) -> List[int]:
-    if n < 2:
-        return []
-    sieve = bytearray(b"\x01") * (n + 1)
-    sieve[0:2] = b"\x00\x00"
-    p = 2
-    while p * p <= n:
-        if sieve[p]:
-            step = p
-            start = p * p
-            sieve[start:n + 1:step] = b"\x00" * (((n - start) // step) + 1)
-        p += 1
-    return [i for i in range(2, n + 1) if sieve[i]]
+    return primes_upto(int(n)).tolist() if n >= 2 else []
 
 
 def prime_pi(n: int) -> int:
-    """π(n): number of primes ≤ n."""
-    return len(_sieve_primes_upto(int(n)))
+    """π(n): number of primes ≤ n (cached table; sublinear count for large n)."""
+    return prime_count(int(n))
 
 
 def _first_k_primes(k: int) -> List[int]:
     if k <= 0:
         return []
-    # Simple increasing sieve bound; sufficient for checksums and small/medium k.
-    # Upper bound for nth prime: n(log n + log log n) for n>=6
-    if k < 6:
-        bound = 15
-    else:
-        bound = int(k * (math.log(k) + math.log(math.log(k)))) + 10
-    primes: List[int] = []
-    while len(primes) < k:
-        primes = _sieve_primes_upto(bound)
-        bound *= 2
-    return primes[:k]
-
-
-@dataclass(frozen=True, slots=True)
+    return first_primes(k).tolist()
+
+
+_MASK64 = (1 << 64) - 1
+
+# Bins per vectorized pass; bounds the uint64 temporaries.
+_CHECKSUM_CHUNK = 1 << 20
+
+
+def _as_uint64(counts: Sequence[int]) -> Optional[np.ndarray]:
+    # Integer counts as uint64 (two's-complement wrap == Python's mod 2^64);
+    # None if they are not plain machine integers (floats, big ints, ...).
+    arr = np.asarray(counts)
+    if arr.ndim != 1 or arr.dtype.kind not in "iub":
+        return None
+    return arr.astype(np.uint64, copy=False)
+
+
+def _total(counts: Sequence[int]) -> int:
+    arr = np.asarray(counts)
+    if arr.ndim == 1 and arr.dtype.kind in "iub" and arr.size:
+        # int64 accumulation is exact as long as it cannot overflow.
+        bound = max(abs(int(arr.max())), abs(int(arr.min())))
+        if arr.size * bound < 2**63:
+            return int(np.sum(arr, dtype=np.int64))
+    return int(sum(int(x) for x in counts))
+
+
+@dataclass(frozen=True, slots=True, eq=False)
 class EIDCounts:
     """
     EID counts container for prime-calibrated checksum + “mass”.
 
     Intended usage: store nonnegative integer counts.
+
+    counts is copied on construction into a read-only 1D NumPy array (object
+    dtype for integers beyond int64), so it cannot change behind the cached
+    mass and checksum(). add() is the only way to change a bin; it updates
+    both caches in O(1).
+
+    Note that counts is therefore an ndarray even when a list was passed:
+    + adds elementwise and == compares elementwise. Use counts.tolist() for
+    list semantics.
     """
     counts: Sequence[int]
+    _store: np.ndarray = field(init=False, repr=False)
+    _mass: Optional[int] = field(default=None, init=False, repr=False)
+    _checksum: Optional[int] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        store = np.array(self.counts)
+        if store.ndim != 1:
+            raise ValueError(f"counts must be 1D; got shape={store.shape}")
+        view = store.view()
+        view.flags.writeable = False
+        object.__setattr__(self, "_store", store)
+        object.__setattr__(self, "counts", view)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, EIDCounts):
+            return NotImplemented
+        return bool(np.array_equal(self._store, other._store))
+
+    __hash__ = None  # type: ignore[assignment]
 
     @property
     def n(self) -> int:
@@ -57,14 +93,77 @@ class EIDCounts:
 
     @property
     def mass(self) -> int:
-        return int(sum(int(x) for x in self.counts))
+        if self._mass is None:
+            object.__setattr__(self, "_mass", _total(self.counts))
+        return self._mass
 
     @property
     def pi_n(self) -> int:
         return prime_pi(self.n)
 
     def checksum(self) -> int:
-        return eid_checksum(self.counts)
+        if self._checksum is None:
+            object.__setattr__(self, "_checksum", eid_checksum(self.counts))
+        return self._checksum
+
+    def add(self, index: int, delta: int) -> None:
+        """counts[index] += delta, keeping cached mass/checksum in step."""
+        if not 0 <= index < self.n:
+            raise IndexError(f"bin index out of range: {index}")
+        store = self._store
+        if store.dtype.kind in "iu":
+            info = np.iinfo(store.dtype)
+            if not info.min <= int(store[index]) + int(delta) <= info.max:
+                # Widen to exact Python integers rather than wrap.
+                store = np.array([int(v) for v in store.tolist()], dtype=object)
+                view = store.view()
+                view.flags.writeable = False
+                object.__setattr__(self, "_store", store)
+                object.__setattr__(self, "counts", view)
+        store[index] += delta
+        if self._mass is not None:
+            object.__setattr__(self, "_mass", self._mass + int(delta))
+        if self._checksum is not None:
+            object.__setattr__(self, "_checksum", eid_checksum_update(self._checksum, index, delta))
+
+
+def eid_partial_checksum(counts: Sequence[int], offset: int = 0) -> int:
+    """
+    Checksum contribution of a shard of bins starting at global bin `offset`:
+
+      sum_i counts[i] * p_{offset+i+1}  (mod 2^64)
+
+    The checksum is linear, so shards combine with eid_combine_checksums.
+    """
+    k = len(counts)
+    if k == 0:
+        return 0
+    primes = first_primes(offset + k)[offset:]
+    arr = _as_uint64(counts)
+    if arr is None:
+        acc = 0
+        for c, p in zip(counts, primes.tolist()):
+            acc = (acc + (int(c) * p)) & _MASK64
+        return acc
+
+    # uint64 products and sums wrap mod 2^64, which is exactly the checksum ring.
+    acc = 0
+    w = primes.astype(np.uint64, copy=False)
+    for c0 in range(0, k, _CHECKSUM_CHUNK):
+        c1 = min(c0 + _CHECKSUM_CHUNK, k)
+        acc = (acc + int(np.sum(arr[c0:c1] * w[c0:c1], dtype=np.uint64))) & _MASK64
+    return acc
+
+
+def eid_combine_checksums(*partials: int) -> int:
+    """Merge partial checksums of disjoint shards (order does not matter)."""
+    return sum(int(x) for x in partials) & _MASK64
+
+
+def eid_checksum_update(checksum: int, index: int, delta: int) -> int:
+    """Checksum after counts[index] changes by delta, in O(1)."""
+    p = int(first_primes(index + 1)[index])
+    return (int(checksum) + int(delta) * p) & _MASK64
 
 
 def eid_checksum(counts: Sequence[int]) -> int:
@@ -73,13 +172,7 @@ def eid_checksum(counts: Sequence[int]) -> int:
 
     checksum = sum_i counts[i] * p_{i+1}  (mod 2^64)
     """
-    k = len(counts)
-    primes = _first_k_primes(k)
-    acc = 0
-    mod = 2**64
-    for i, c in enumerate(counts):
-        acc = (acc + (int(c) * primes[i])) % mod
-    return acc
+    return eid_partial_checksum(counts, 0)
 
 
 def delta_kappa_eid(pre: EIDCounts | Sequence[int], post: EIDCounts | Sequence[int], eps: float = 1e-12) -> float:
@@ -90,9 +183,6 @@ def delta_kappa_eid(pre: EIDCounts | Sequence[int], post: EIDCounts | Sequence[i
 
     This is intentionally minimal and audit-friendly.
     """
-    pre_counts = pre.counts if isinstance(pre, EIDCounts) else pre
-    post_counts = post.counts if isinstance(post, EIDCounts) else post
-
-    m0 = float(sum(int(x) for x in pre_counts))
-    m1 = float(sum(int(x) for x in post_counts))
+    m0 = float(pre.mass if isinstance(pre, EIDCounts) else _total(pre))
+    m1 = float(post.mass if isinstance(post, EIDCounts) else _total(post))
     return math.log((m1 + eps) / (m0 + eps))
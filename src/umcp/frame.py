@@ -0,0 +1,245 @@
+# src/umcp/frame.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+from typing import Iterator, List, Optional
+
+import numpy as np
+
+from umcp.closures import DriftClosure, GammaOmegaPower, evaluate_closure
+from umcp.contract import FrozenContract
+from umcp.kernel import Tier1Row
+from umcp.tau import lag_projections, return_lags
+
+
+# Column order mirrors the Tier1Row field order (t is implicit: t0 + index).
+TIER1_COLUMNS = ("omega", "F", "S", "C", "tau_R", "IC", "kappa")
+
+# Rows per whole-array pass; bounds temporaries to block_rows·n floats.
+DEFAULT_BLOCK_ROWS = 4096
+
+# Max |Δ| against compute_tier1_series on the same input. The row loop and the
+# whole-array reductions sum in a different order, and NumPy's exp/power ufuncs
+# may differ from libm by an ulp; both effects stay far below this bound.
+FRAME_ABS_TOL = 1e-12
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class Tier1Frame:
+    """
+    Columnar Tier-1 series: one float array per Tier-1 symbol.
+
+    Row i corresponds to time index t = t0 + i. Tier1Row objects are built on
+    demand via row()/rows()/iteration, so the columns are the source of truth.
+    """
+    omega: np.ndarray
+    F: np.ndarray
+    S: np.ndarray
+    C: np.ndarray
+    tau_R: np.ndarray
+    IC: np.ndarray
+    kappa: np.ndarray
+    t0: int = 0
+
+    def __len__(self) -> int:
+        return int(self.omega.shape[0])
+
+    @property
+    def t(self) -> np.ndarray:
+        return np.arange(self.t0, self.t0 + len(self), dtype=np.int64)
+
+    def column(self, name: str) -> np.ndarray:
+        if name not in TIER1_COLUMNS:
+            raise KeyError(f"unknown Tier-1 column: {name!r}")
+        return getattr(self, name)
+
+    def row(self, i: int) -> Tier1Row:
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError(f"row index out of range: {i}")
+        return Tier1Row(
+            t=self.t0 + i,
+            omega=float(self.omega[i]),
+            F=float(self.F[i]),
+            S=float(self.S[i]),
+            C=float(self.C[i]),
+            tau_R=float(self.tau_R[i]),
+            IC=float(self.IC[i]),
+            kappa=float(self.kappa[i]),
+        )
+
+    def rows(self) -> List[Tier1Row]:
+        return [self.row(i) for i in range(len(self))]
+
+    def __iter__(self) -> Iterator[Tier1Row]:
+        for i in range(len(self)):
+            yield self.row(i)
+
+    def slice(self, start: int, stop: int) -> "Tier1Frame":
+        """Column views for rows [start, stop) (no copy)."""
+        start, stop, _ = slice(start, stop).indices(len(self))
+        cols = {name: getattr(self, name)[start:stop] for name in TIER1_COLUMNS}
+        return Tier1Frame(**cols, t0=self.t0 + start)
+
+    @classmethod
+    def empty(cls, T: int, t0: int = 0) -> "Tier1Frame":
+        return cls(**{name: np.empty(T, dtype=float) for name in TIER1_COLUMNS}, t0=t0)
+
+    @classmethod
+    def from_rows(cls, rows: List[Tier1Row]) -> "Tier1Frame":
+        t0 = int(rows[0].t) if rows else 0
+        cols = {name: np.array([getattr(r, name) for r in rows], dtype=float) for name in TIER1_COLUMNS}
+        return cls(**cols, t0=t0)
+
+
+class _Tier1Workspace:
+    """
+    Scratch buffers for one block of rows, reused across blocks and chunks so
+    the row kernels run allocation-free (only per-row reductions allocate).
+    Always float64, whatever the trace dtype, so reductions accumulate in float64.
+    """
+
+    __slots__ = ("rows", "n", "a", "b", "c")
+
+    def __init__(self, rows: int, n: int) -> None:
+        self.rows = rows
+        self.n = n
+        self.a = np.empty((rows, n), dtype=float)
+        self.b = np.empty((rows, n), dtype=float)
+        self.c = np.empty((rows, n), dtype=float)
+
+    def fits(self, rows: int, n: int) -> bool:
+        return rows <= self.rows and n == self.n
+
+
+def _lp_mean_norm_rows(v: np.ndarray, p: float, eps: float) -> np.ndarray:
+    # Row-wise counterpart of kernel._lp_mean_norm; v is consumed as scratch.
+    np.abs(v, out=v)
+    v += eps
+    np.power(v, p, out=v)
+    return np.mean(v, axis=1) ** (1.0 / p)
+
+
+def _binary_entropy_mean_rows(x: np.ndarray, eps: float, ws: _Tier1Workspace) -> np.ndarray:
+    # Row-wise counterpart of kernel._binary_entropy_mean, same operation order:
+    # h = -(x1*ln(x1) + (1-x1)*ln(1-x1)).
+    m = x.shape[0]
+    x1, h, y = ws.a[:m], ws.b[:m], ws.c[:m]
+    # Clip in float64: 1 - ε rounds to 1.0 in float32.
+    np.copyto(x1, x)
+    np.clip(x1, eps, 1.0 - eps, out=x1)
+    np.log(x1, out=h)
+    h *= x1
+    np.subtract(1.0, x1, out=y)
+    np.log(y, out=x1)
+    x1 *= y
+    h += x1
+    np.negative(h, out=h)
+    return np.mean(h, axis=1) / math.log(2.0)
+
+
+def _fill_tier1_columns(
+    x: np.ndarray,
+    out: Tier1Frame,
+    start: int,
+    stop: int,
+    contract: FrozenContract,
+    gamma: DriftClosure,
+    block_rows: int,
+    ws: Optional[_Tier1Workspace] = None,
+) -> None:
+    """
+    Compute rows [start, stop) of x into out (row start lands at out index 0).
+
+    x is treated as the full trace: rows 0/1 get the ω=0 / C=0 conventions and
+    τ_R only looks back within x. Callers that pass a window of a longer trace
+    must include the 2-row (C) and tau_lookback-row (τ_R) halo before start.
+    Pass ws to reuse scratch buffers across calls.
+    """
+    eps = float(contract.epsilon)
+    p = float(contract.p)
+    alpha = float(contract.alpha)
+    lam = float(contract.lam)
+
+    n = x.shape[1]
+    if ws is None or not ws.fits(min(block_rows, stop - start), n):
+        ws = _Tier1Workspace(max(min(block_rows, stop - start), 1), n)
+    block_rows = min(block_rows, ws.rows)
+
+    # τ_R pruning projections for the whole range plus its lookback, once;
+    # each block's return_lags slices them instead of re-projecting its halo.
+    proj = lag_projections(x, max(0, start - int(contract.tau_lookback)), stop) if stop > start else None
+
+    for b0 in range(start, stop, block_rows):
+        b1 = min(b0 + block_rows, stop)
+        o0, o1 = b0 - start, b1 - start
+
+        lo = max(b0, 1)
+        if b0 == 0:
+            out.omega[o0] = 0.0
+        if lo < b1:
+            d = ws.a[:b1 - lo]
+            np.subtract(x[lo:b1], x[lo - 1:b1 - 1], out=d)
+            out.omega[lo - start:o1] = _lp_mean_norm_rows(d, p=p, eps=eps)
+
+        lo = max(b0, 2)
+        out.C[o0:min(lo, b1) - start] = 0.0
+        if lo < b1:
+            # x_t - 2.0*x_{t-1} + x_{t-2}, evaluated left to right.
+            dd = ws.a[:b1 - lo]
+            np.multiply(x[lo - 1:b1 - 1], 2.0, out=dd)
+            np.subtract(x[lo:b1], dd, out=dd)
+            dd += x[lo - 2:b1 - 2]
+            out.C[lo - start:o1] = _lp_mean_norm_rows(dd, p=p, eps=eps)
+
+        out.S[o0:o1] = _binary_entropy_mean_rows(x[b0:b1], eps=eps, ws=ws)
+
+        out.tau_R[o0:o1] = return_lags(x, contract, start=b0, stop=b1, projections=proj)
+
+        omega, C, S = out.omega[o0:o1], out.C[o0:o1], out.S[o0:o1]
+        np.subtract(1.0, omega, out=out.F[o0:o1])
+        np.clip(out.F[o0:o1], 0.0, 1.0, out=out.F[o0:o1])
+
+        # κ = -((Γ(ω) + α·C) + λ·S), IC = exp(κ)
+        kappa = out.kappa[o0:o1]
+        np.copyto(kappa, evaluate_closure(gamma, omega))
+        kappa += alpha * C
+        kappa += lam * S
+        np.negative(kappa, out=kappa)
+        np.exp(kappa, out=out.IC[o0:o1])
+
+
+def compute_tier1_frame(
+    psi: np.ndarray,
+    contract: FrozenContract,
+    drift_closure: Optional[DriftClosure] = None,
+    *,
+    block_rows: int = DEFAULT_BLOCK_ROWS,
+) -> Tier1Frame:
+    """
+    Array-native Tier-1 kernel: same definitions as compute_tier1_series,
+    evaluated in whole-array passes over blocks of block_rows time indices.
+
+    Returns a columnar Tier1Frame. Values agree with compute_tier1_series to
+    within FRAME_ABS_TOL (summation order differs); τ_R is identical.
+
+    With contract.precision="float32" the trace is held in float32 and the
+    per-coordinate differences are taken in float32; everything after that
+    (powers, entropy, row means, κ) is evaluated in float64 scratch, and the
+    columns are float64. See umcp.precision.validate_precision.
+    """
+    x = np.asarray(psi, dtype=contract.float_dtype)
+    if x.ndim != 2:
+        raise ValueError(f"psi must be 2D array shaped (T,n); got shape={x.shape}")
+    if block_rows < 1:
+        raise ValueError(f"block_rows must be >= 1; got {block_rows}")
+
+    Gamma = drift_closure if drift_closure is not None else GammaOmegaPower(p=float(contract.p), epsilon=float(contract.epsilon))
+
+    T = x.shape[0]
+    out = Tier1Frame.empty(T)
+    _fill_tier1_columns(x, out, 0, T, contract, Gamma, block_rows)
+    return out
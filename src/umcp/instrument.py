@@ -0,0 +1,130 @@
+# src/umcp/instrument.py
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+import re
+import threading
+import time
+from typing import Dict, Iterator, Optional
+
+
+class Collector:
+    """
+    Opt-in counters and per-stage wall time for the kernel pipeline.
+
+    Activate with `with collect() as c: ...`; admit_trace, compute_tier1_series,
+    return_lags and evaluate_weld then record into c. With no active collector
+    each entry point pays one context-variable lookup and nothing else.
+
+    Stages (seconds + call counts):
+      admit, kernel, kernel.omega_C, kernel.entropy, kernel.tau_R, kernel.gamma, weld
+    Counters:
+      admit.rows, admit.oor, kernel.rows, tau.rows, tau.lag_comparisons,
+      tau.inf_rec, weld.evaluated, weld.passed, weld.inf_rec
+    """
+    __slots__ = ("_lock", "_seconds", "_calls", "_counters")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._seconds: Dict[str, float] = {}
+        self._calls: Dict[str, int] = {}
+        self._counters: Dict[str, int] = {}
+
+    def add_time(self, stage: str, seconds: float, calls: int = 1) -> None:
+        with self._lock:
+            self._seconds[stage] = self._seconds.get(stage, 0.0) + seconds
+            self._calls[stage] = self._calls.get(stage, 0) + calls
+
+    def incr(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + int(n)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - t0)
+
+    def seconds(self, stage: str) -> float:
+        return self._seconds.get(stage, 0.0)
+
+    def count(self, name: str) -> int:
+        return self._counters.get(name, 0)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._seconds.clear()
+            self._calls.clear()
+            self._counters.clear()
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Plain-dict copy: {"stages": {name: {"seconds", "calls"}}, "counters": {name: n}}."""
+        with self._lock:
+            return {
+                "stages": {k: {"seconds": self._seconds[k], "calls": self._calls[k]} for k in sorted(self._seconds)},
+                "counters": dict(sorted(self._counters.items())),
+            }
+
+    def prometheus(self, prefix: str = "umcp") -> str:
+        """Counters in the Prometheus text exposition format."""
+        snap = self.snapshot()
+        lines = [
+            f"# TYPE {prefix}_stage_seconds_total counter",
+            *(f'{prefix}_stage_seconds_total{{stage="{k}"}} {v["seconds"]!r}' for k, v in snap["stages"].items()),
+            f"# TYPE {prefix}_stage_calls_total counter",
+            *(f'{prefix}_stage_calls_total{{stage="{k}"}} {v["calls"]}' for k, v in snap["stages"].items()),
+        ]
+        for k, v in snap["counters"].items():
+            metric = f"{prefix}_{_metric_name(k)}_total"
+            lines += [f"# TYPE {metric} counter", f"{metric} {v}"]
+        return "\n".join(lines) + "\n"
+
+
+class _StageClock:
+    """Lap timer for sub-stages inside a row loop; flushed to a Collector once."""
+    __slots__ = ("started", "_last", "_acc")
+
+    def __init__(self) -> None:
+        self.started = self._last = time.perf_counter()
+        self._acc: Dict[str, float] = {}
+
+    def lap(self, stage: str) -> None:
+        now = time.perf_counter()
+        self._acc[stage] = self._acc.get(stage, 0.0) + (now - self._last)
+        self._last = now
+
+    def flush(self, collector: Collector, calls: int = 1) -> None:
+        for stage, seconds in self._acc.items():
+            collector.add_time(stage, seconds, calls=calls)
+        self._acc.clear()
+
+
+_ACTIVE: ContextVar[Optional[Collector]] = ContextVar("umcp_collector", default=None)
+
+
+def _metric_name(name: str) -> str:
+    return re.sub(r"[^a-zA-Z0-9_]", "_", name)
+
+
+def active_collector() -> Optional[Collector]:
+    """The collector installed by the innermost enclosing collect(), if any."""
+    return _ACTIVE.get()
+
+
+@contextmanager
+def collect(collector: Optional[Collector] = None) -> Iterator[Collector]:
+    """
+    Record instrumentation for everything run inside the block.
+
+    Scoped per thread / asyncio task (contextvars); pass an existing collector
+    to keep accumulating across blocks.
+    """
+    c = collector if collector is not None else Collector()
+    token = _ACTIVE.set(c)
+    try:
+        yield c
+    finally:
+        _ACTIVE.reset(token)
@@ -3,12 +3,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import math
+import time
 from typing import List, Optional
 
 import numpy as np
 
 from umcp.closures import DriftClosure, GammaOmegaPower
 from umcp.contract import FrozenContract
+from umcp.instrument import _ACTIVE, _StageClock
 
 
 @dataclass(frozen=True, slots=True)
@@ -70,6 +72,70 @@ def _return_lag(psi: np.ndarray, t: int, tol_id: float, lookback: int, p: float,
     return float("inf")
 
 
+def _tier1_row(
+    t: int,
+    x_t: np.ndarray,
+    x_t1: Optional[np.ndarray],
+    x_t2: Optional[np.ndarray],
+    tau_R: float,
+    Gamma: DriftClosure,
+    p: float,
+    eps: float,
+    alpha: float,
+    lam: float,
+    clock: Optional[_StageClock] = None,
+) -> Tier1Row:
+    """
+    One Tier-1 row from ψ(t), ψ(t-1), ψ(t-2) (None where t has no such history).
+
+    Shared by the batch series and the streaming kernel so both produce the
+    same floats for the same states. clock, when given, is lapped after each
+    stage (instrumented runs only).
+    """
+    if x_t1 is None:
+        omega = 0.0
+        C = 0.0
+    else:
+        omega = _lp_mean_norm(x_t - x_t1, p=p, eps=eps)
+        if x_t2 is not None:
+            C = _curvature(x_t, x_t1, x_t2, p=p, eps=eps)
+        else:
+            C = 0.0
+    if clock is not None:
+        clock.lap("kernel.omega_C")
+
+    F = 1.0 - omega
+    if F < 0.0:
+        F = 0.0
+    elif F > 1.0:
+        F = 1.0
+
+    S = _binary_entropy_mean(x_t, eps=eps)
+    if clock is not None:
+        clock.lap("kernel.entropy")
+
+    D_omega = float(Gamma(omega))
+    D_C = alpha * C
+    D_S = lam * S
+
+    # IC in (0,1], κ = ln(IC) identity by construction.
+    kappa = -(D_omega + D_C + D_S)
+    IC = math.exp(kappa)
+    if clock is not None:
+        clock.lap("kernel.gamma")
+
+    return Tier1Row(
+        t=t,
+        omega=float(omega),
+        F=float(F),
+        S=float(S),
+        C=float(C),
+        tau_R=float(tau_R),
+        IC=float(IC),
+        kappa=float(kappa),
+    )
+
+
 def compute_tier1_series(
     psi: np.ndarray,
     contract: FrozenContract,
@@ -98,48 +164,38 @@ def compute_tier1_series(
 
     Gamma = drift_closure if drift_closure is not None else GammaOmegaPower(p=p, epsilon=eps)
 
+    # umcp.tau builds on this module's norm, hence the deferred import.
+    from umcp.tau import return_lags
+
+    collector = _ACTIVE.get()
+    clock = _StageClock() if collector is not None else None
+    t_start = clock.started if clock is not None else 0.0
+
     T = x.shape[0]
     rows: List[Tier1Row] = []
+    tau_col = return_lags(x, contract)
+    if clock is not None:
+        clock.lap("kernel.tau_R")
 
     for t in range(T):
-        if t == 0:
-            omega = 0.0
-            C = 0.0
-        else:
-            omega = _lp_mean_norm(x[t] - x[t - 1], p=p, eps=eps)
-            if t >= 2:
-                C = _curvature(x[t], x[t - 1], x[t - 2], p=p, eps=eps)
-            else:
-                C = 0.0
-
-        F = 1.0 - omega
-        if F < 0.0:
-            F = 0.0
-        elif F > 1.0:
-            F = 1.0
-
-        S = _binary_entropy_mean(x[t], eps=eps)
-        tau_R = _return_lag(x, t=t, tol_id=float(contract.tol_id), lookback=int(contract.tau_lookback), p=p, eps=eps)
-
-        D_omega = float(Gamma(omega))
-        D_C = alpha * C
-        D_S = lam * S
-
-        # IC in (0,1], κ = ln(IC) identity by construction.
-        kappa = -(D_omega + D_C + D_S)
-        IC = math.exp(kappa)
-
         rows.append(
-            Tier1Row(
-                t=t,
-                omega=float(omega),
-                F=float(F),
-                S=float(S),
-                C=float(C),
-                tau_R=float(tau_R),
-                IC=float(IC),
-                kappa=float(kappa),
+            _tier1_row(
+                t,
+                x[t],
+                x[t - 1] if t >= 1 else None,
+                x[t - 2] if t >= 2 else None,
+                tau_R=tau_col[t],
+                Gamma=Gamma,
+                p=p,
+                eps=eps,
+                alpha=alpha,
+                lam=lam,
+                clock=clock,
             )
         )
 
+    if collector is not None:
+        clock.flush(collector)
+        collector.add_time("kernel", time.perf_counter() - t_start)
+        collector.incr("kernel.rows", T)
     return rows
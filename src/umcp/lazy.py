@@ -0,0 +1,188 @@
+# src/umcp/lazy.py
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import math
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from umcp.closures import DriftClosure, GammaOmegaPower
+from umcp.contract import FrozenContract
+from umcp.kernel import Tier1Row, _tier1_row
+from umcp.tau import return_lags
+
+
+# Entries kept in each of the row and τ_R caches.
+DEFAULT_CACHE_ROWS = 4096
+
+# (ω, F, S, C, IC, κ) for one row.
+_RowValues = Tuple[float, float, float, float, float, float]
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class LazyTier1Row:
+    """
+    Tier1Row whose τ_R is computed (and cached by the series) on first read.
+
+    Duck-compatible with Tier1Row, so it can be passed to evaluate_weld;
+    to_row() returns a plain Tier1Row.
+    """
+    t: int
+    omega: float
+    F: float
+    S: float
+    C: float
+    IC: float
+    kappa: float
+    series: "LazyTier1Series"
+
+    @property
+    def tau_R(self) -> float:
+        return self.series.tau_R(self.t)
+
+    def to_row(self) -> Tier1Row:
+        return Tier1Row(
+            t=self.t,
+            omega=self.omega,
+            F=self.F,
+            S=self.S,
+            C=self.C,
+            tau_R=self.tau_R,
+            IC=self.IC,
+            kappa=self.kappa,
+        )
+
+
+class LazyTier1Series:
+    """
+    Random-access Tier-1 series over an admitted trace, computed on demand.
+
+    series[t] (negative t counts from the end) and series[a:b] build only the
+    requested rows, each with the same floats as compute_tier1_series. τ_R is
+    computed separately, only when a row's tau_R is read, by return_lags over
+    the missing rows. Row values and τ_R each live in an LRU cache of at most
+    max_rows entries, so memory stays bounded whatever the trace length.
+    """
+
+    def __init__(
+        self,
+        psi: np.ndarray,
+        contract: FrozenContract,
+        drift_closure: Optional[DriftClosure] = None,
+        *,
+        max_rows: int = DEFAULT_CACHE_ROWS,
+    ) -> None:
+        x = np.asarray(psi, dtype=float)
+        if x.ndim != 2:
+            raise ValueError(f"psi must be 2D array shaped (T,n); got shape={x.shape}")
+        if max_rows < 1:
+            raise ValueError(f"max_rows must be >= 1; got {max_rows}")
+        self.contract = contract
+        self.drift_closure = drift_closure
+        self.max_rows = int(max_rows)
+        self._x = x
+        self._gamma = (
+            drift_closure
+            if drift_closure is not None
+            else GammaOmegaPower(p=float(contract.p), epsilon=float(contract.epsilon))
+        )
+        self._rows: "OrderedDict[int, _RowValues]" = OrderedDict()
+        self._tau: "OrderedDict[int, float]" = OrderedDict()
+        self._stats = {"row_hits": 0, "row_misses": 0, "tau_hits": 0, "tau_misses": 0}
+
+    def __len__(self) -> int:
+        return int(self._x.shape[0])
+
+    def _index(self, t: int) -> int:
+        T = len(self)
+        i = int(t)
+        if i < 0:
+            i += T
+        if not 0 <= i < T:
+            raise IndexError(f"row {t} out of range for T={T}")
+        return i
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[LazyTier1Row, List[LazyTier1Row]]:
+        if isinstance(key, slice):
+            return [self._row(t) for t in range(*key.indices(len(self)))]
+        return self._row(self._index(key))
+
+    def __iter__(self):
+        for t in range(len(self)):
+            yield self._row(t)
+
+    def _row(self, t: int) -> LazyTier1Row:
+        vals = self._rows.get(t)
+        if vals is not None:
+            self._rows.move_to_end(t)
+            self._stats["row_hits"] += 1
+        else:
+            self._stats["row_misses"] += 1
+            vals = self._compute_row(t)
+            self._rows[t] = vals
+            if len(self._rows) > self.max_rows:
+                self._rows.popitem(last=False)
+        omega, F, S, C, IC, kappa = vals
+        return LazyTier1Row(t=t, omega=omega, F=F, S=S, C=C, IC=IC, kappa=kappa, series=self)
+
+    def _compute_row(self, t: int) -> _RowValues:
+        c = self.contract
+        x = self._x
+        row = _tier1_row(
+            t,
+            x[t],
+            x[t - 1] if t >= 1 else None,
+            x[t - 2] if t >= 2 else None,
+            tau_R=math.nan,
+            Gamma=self._gamma,
+            p=float(c.p),
+            eps=float(c.epsilon),
+            alpha=float(c.alpha),
+            lam=float(c.lam),
+        )
+        return (row.omega, row.F, row.S, row.C, row.IC, row.kappa)
+
+    def tau_R(self, t: int) -> float:
+        """τ_R(t), computed on first request."""
+        t = self._index(t)
+        return float(self.tau_R_range(t, t + 1)[0])
+
+    def tau_R_range(self, start: int, stop: int) -> np.ndarray:
+        """
+        τ_R for rows [start, stop). Each contiguous run of uncached rows costs
+        one return_lags call.
+        """
+        T = len(self)
+        if not 0 <= start <= stop <= T:
+            raise ValueError(f"invalid row range [{start}, {stop}) for T={T}")
+        out = np.empty(stop - start)
+        missing = np.ones(stop - start, dtype=bool)
+        for t in range(start, stop):
+            v = self._tau.get(t)
+            if v is not None:
+                self._tau.move_to_end(t)
+                out[t - start] = v
+                missing[t - start] = False
+        self._stats["tau_hits"] += int(np.count_nonzero(~missing))
+        self._stats["tau_misses"] += int(np.count_nonzero(missing))
+
+        # Runs of missing rows: [edges[2k], edges[2k+1]) relative to start.
+        edges = np.flatnonzero(np.diff(np.concatenate(([False], missing, [False])).astype(np.int8)))
+        for a, b in zip(edges[0::2], edges[1::2]):
+            lags = return_lags(self._x, self.contract, start=start + int(a), stop=start + int(b))
+            out[a:b] = lags
+            for t, v in zip(range(start + int(a), start + int(b)), lags.tolist()):
+                self._tau[t] = v
+                if len(self._tau) > self.max_rows:
+                    self._tau.popitem(last=False)
+        return out
+
+    def cache_info(self) -> Dict[str, int]:
+        """Hit/miss counters and current sizes of the row and τ_R caches."""
+        return {**self._stats, "rows": len(self._rows), "tau_rows": len(self._tau), "max_rows": self.max_rows}
+
+    def clear_cache(self) -> None:
+        self._rows.clear()
+        self._tau.clear()
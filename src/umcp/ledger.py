@@ -0,0 +1,355 @@
+# src/umcp/ledger.py
+"""
+Append-only on-disk ledger of SS1m weld receipts.
+
+<path>         4 KiB header (magic, version, JSON with the FrozenContract), then
+               fixed-size little-endian records (RECORD_DTYPE):
+                 pre_t, post_t, the SS1mWeld fields, chain
+               where record i is sequence number i and
+               chain_i = blake2b(chain_{i-1} ‖ record_i without chain, 16 bytes),
+               chain_{-1} = 16 zero bytes.
+<path>.idx     block summaries, one per block_records full records:
+               (min/max pre_t, min/max post_t, fail count, chain of last record).
+               Derived data: rebuilt from the ledger whenever it looks stale.
+
+Appends are buffered and fsync'd once per sync_every records (or on flush/close).
+Window and PASS/FAIL queries consult the block summaries first and map only the
+blocks that can match; verify() re-hashes any record range starting from the
+stored chain of the record before it, so audits can proceed segment by segment.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import hashlib
+import json
+import os
+import struct
+from typing import Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+from umcp.contract import FrozenContract
+from umcp.store import contract_from_dict, contract_to_dict
+from umcp.weld import WELD_COLUMNS, SS1mWeld
+
+
+PathLike = Union[str, os.PathLike]
+
+MAGIC = b"UMCPLDG\0"
+LEDGER_VERSION = 1
+HEADER_SIZE = 4096
+BLOCK_RECORDS = 4096
+CHAIN_BYTES = 16
+_GENESIS = bytes(CHAIN_BYTES)
+_PREFIX = struct.Struct("<8sHHI")
+
+RECORD_DTYPE = np.dtype(
+    [("pre_t", "<i8"), ("post_t", "<i8")]
+    + [(name, "<f8") for name in WELD_COLUMNS if name != "passed"]
+    + [("passed", "u1"), ("_pad", "V7"), ("chain", f"V{CHAIN_BYTES}")]
+)
+_BODY_BYTES = RECORD_DTYPE.itemsize - CHAIN_BYTES
+
+BLOCK_DTYPE = np.dtype(
+    [
+        ("min_pre", "<i8"),
+        ("max_pre", "<i8"),
+        ("min_post", "<i8"),
+        ("max_post", "<i8"),
+        ("n_fail", "<i8"),
+        ("chain", f"V{CHAIN_BYTES}"),
+    ]
+)
+
+
+@dataclass(frozen=True, slots=True)
+class LedgerEntry:
+    """One ledger record: position, comparison times and the receipt."""
+    seq: int
+    pre_t: int
+    post_t: int
+    weld: SS1mWeld
+
+
+def _chain(prev: bytes, body: bytes) -> bytes:
+    return hashlib.blake2b(prev + body, digest_size=CHAIN_BYTES).digest()
+
+
+def _summarize(recs: np.ndarray) -> np.ndarray:
+    out = np.zeros(1, dtype=BLOCK_DTYPE)
+    out["min_pre"] = recs["pre_t"].min()
+    out["max_pre"] = recs["pre_t"].max()
+    out["min_post"] = recs["post_t"].min()
+    out["max_post"] = recs["post_t"].max()
+    out["n_fail"] = np.count_nonzero(recs["passed"] == 0)
+    out["chain"] = recs["chain"][-1]
+    return out
+
+
+class WeldLedger:
+    """
+    Append-only weld receipt ledger (see module docstring for the layout).
+
+    Create with WeldLedger(path, contract); reopen with WeldLedger(path), or
+    with the contract to assert it matches the one the ledger was started with.
+    Use as a context manager, or call close(), so buffered records are synced.
+
+    read_only=True opens an existing ledger "rb" for auditing: a torn tail
+    (a record a live writer is still appending) is ignored rather than
+    truncated, the .idx sidecar is never rewritten, and append() raises.
+    refresh() picks up records written since opening.
+    """
+
+    __slots__ = (
+        "path",
+        "contract",
+        "sync_every",
+        "block_records",
+        "read_only",
+        "_fh",
+        "_n",
+        "_tail",
+        "_pending",
+        "_blocks",
+    )
+
+    def __init__(
+        self,
+        path: PathLike,
+        contract: Optional[FrozenContract] = None,
+        *,
+        sync_every: int = 1024,
+        block_records: int = BLOCK_RECORDS,
+        read_only: bool = False,
+    ) -> None:
+        if sync_every < 1:
+            raise ValueError(f"sync_every must be >= 1; got {sync_every}")
+        if block_records < 1:
+            raise ValueError(f"block_records must be >= 1; got {block_records}")
+        self.path = os.fspath(path)
+        self.sync_every = int(sync_every)
+        self.block_records = int(block_records)
+        self.read_only = bool(read_only)
+        self._pending: List[np.ndarray] = []
+
+        if os.path.exists(self.path) and os.path.getsize(self.path) > 0:
+            stored = self._read_header()
+            if contract is not None and contract != stored:
+                raise ValueError("contract does not match the one recorded in the ledger header")
+            self.contract = stored
+            self._n = self._complete_records()
+            if self.read_only:
+                self._fh = open(self.path, "rb")
+            else:
+                self._fh = open(self.path, "r+b")
+                # Drop a torn trailing record left by an interrupted append.
+                self._fh.truncate(HEADER_SIZE + self._n * RECORD_DTYPE.itemsize)
+                self._fh.seek(0, os.SEEK_END)
+            self._tail = bytes(self._records()[-1]["chain"]) if self._n else _GENESIS
+        elif self.read_only:
+            raise FileNotFoundError(f"no weld ledger to open read-only: {self.path}")
+        else:
+            if contract is None:
+                raise ValueError("a FrozenContract is required to create a new ledger")
+            self.contract = contract
+            self._fh = open(self.path, "w+b")
+            self._write_header()
+            self._n = 0
+            self._tail = _GENESIS
+        self._blocks = self._load_blocks()
+
+    def __enter__(self) -> "WeldLedger":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._n + sum(int(p.shape[0]) for p in self._pending)
+
+    def close(self) -> None:
+        if self._fh.closed:
+            return
+        self.flush()
+        self._fh.close()
+
+    def _complete_records(self) -> int:
+        return max(os.path.getsize(self.path) - HEADER_SIZE, 0) // RECORD_DTYPE.itemsize
+
+    def refresh(self) -> int:
+        """Read-only mode: pick up records appended since opening; returns len(self)."""
+        if not self.read_only:
+            raise ValueError("refresh() is only for ledgers opened read_only")
+        n = self._complete_records()
+        if n != self._n:
+            self._n = n
+            self._tail = bytes(self._records()[-1]["chain"]) if n else _GENESIS
+            self._blocks = self._load_blocks()
+        return self._n
+
+    def _write_header(self) -> None:
+        meta = json.dumps(
+            {"contract": contract_to_dict(self.contract), "record_bytes": RECORD_DTYPE.itemsize},
+            sort_keys=True,
+        ).encode("utf-8")
+        if _PREFIX.size + len(meta) > HEADER_SIZE:  # pragma: no cover - contract is small
+            raise ValueError("ledger header does not fit in HEADER_SIZE")
+        head = _PREFIX.pack(MAGIC, LEDGER_VERSION, 0, len(meta)) + meta
+        self._fh.write(head + bytes(HEADER_SIZE - len(head)))
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+
+    def _read_header(self) -> FrozenContract:
+        with open(self.path, "rb") as fh:
+            magic, version, _, mlen = _PREFIX.unpack(fh.read(_PREFIX.size))
+            if magic != MAGIC:
+                raise ValueError(f"not a UMCP weld ledger (bad magic): {self.path}")
+            if version > LEDGER_VERSION:
+                raise ValueError(f"unsupported ledger version {version} (reader supports <= {LEDGER_VERSION})")
+            meta = json.loads(fh.read(mlen).decode("utf-8"))
+        if meta.get("record_bytes") != RECORD_DTYPE.itemsize:
+            raise ValueError(f"ledger record size {meta.get('record_bytes')} != {RECORD_DTYPE.itemsize}")
+        return contract_from_dict(meta["contract"])
+
+    def append(self, pre_t: int, post_t: int, weld: SS1mWeld) -> int:
+        """Buffer one receipt; returns its sequence number."""
+        if self.read_only:
+            raise ValueError(f"ledger opened read-only: {self.path}")
+        rec = np.zeros(1, dtype=RECORD_DTYPE)
+        rec["pre_t"] = pre_t
+        rec["post_t"] = post_t
+        for name in WELD_COLUMNS:
+            rec[name] = getattr(weld, name)
+        body = rec.tobytes()[:_BODY_BYTES]
+        self._tail = _chain(self._tail, body)
+        rec["chain"] = self._tail
+        seq = len(self)
+        self._pending.append(rec)
+        if len(self._pending) >= self.sync_every:
+            self.flush()
+        return seq
+
+    def extend(self, pre_t: Sequence[int], post_t: Sequence[int], welds: Iterable[SS1mWeld]) -> None:
+        for a, b, w in zip(pre_t, post_t, welds):
+            self.append(int(a), int(b), w)
+
+    def flush(self) -> None:
+        """Write buffered records and fsync once; then extend the block index."""
+        if not self._pending:
+            return
+        recs = np.concatenate(self._pending)
+        self._pending.clear()
+        self._fh.write(recs.tobytes())
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+        self._n += int(recs.shape[0])
+
+        full = self._n // self.block_records
+        if full > self._blocks.shape[0]:
+            mapped = self._records()
+            new = [
+                _summarize(mapped[k * self.block_records:(k + 1) * self.block_records])
+                for k in range(self._blocks.shape[0], full)
+            ]
+            with open(self.path + ".idx", "ab") as fh:
+                for row in new:
+                    fh.write(row.tobytes())
+            self._blocks = np.concatenate([self._blocks, *new])
+
+    def _records(self) -> np.ndarray:
+        if self._n == 0:
+            return np.zeros(0, dtype=RECORD_DTYPE)
+        return np.memmap(self.path, dtype=RECORD_DTYPE, mode="r", offset=HEADER_SIZE, shape=(self._n,))
+
+    def _load_blocks(self) -> np.ndarray:
+        full = self._n // self.block_records
+        idx_path = self.path + ".idx"
+        if os.path.exists(idx_path) and os.path.getsize(idx_path) == full * BLOCK_DTYPE.itemsize:
+            blocks = np.fromfile(idx_path, dtype=BLOCK_DTYPE)
+            if full == 0 or self._chain_at(full * self.block_records - 1) == bytes(blocks["chain"][-1]):
+                return blocks
+        mapped = self._records()
+        blocks = np.concatenate(
+            [np.zeros(0, dtype=BLOCK_DTYPE)]
+            + [_summarize(mapped[k * self.block_records:(k + 1) * self.block_records]) for k in range(full)]
+        )
+        if not self.read_only:
+            blocks.tofile(idx_path)
+        return blocks
+
+    def _chain_at(self, i: int) -> bytes:
+        if i < 0:
+            return _GENESIS
+        return bytes(self._records()[i]["chain"])
+
+    def entry(self, seq: int) -> LedgerEntry:
+        self.flush()
+        if not 0 <= seq < self._n:
+            raise IndexError(f"ledger sequence out of range: {seq}")
+        return self._entry(self._records(), seq)
+
+    @staticmethod
+    def _entry(recs: np.ndarray, seq: int) -> LedgerEntry:
+        r = recs[seq]
+        vals = {name: (bool(r[name]) if name == "passed" else float(r[name])) for name in WELD_COLUMNS}
+        return LedgerEntry(seq=seq, pre_t=int(r["pre_t"]), post_t=int(r["post_t"]), weld=SS1mWeld(**vals))
+
+    def query_indices(self, t_start: int, t_stop: int, passed: Optional[bool] = None) -> np.ndarray:
+        """
+        Sequence numbers of records with t_start <= pre_t and post_t < t_stop,
+        optionally restricted to PASS (True) or FAIL (False), in append order.
+        """
+        self.flush()
+        recs = self._records()
+        b = self._blocks
+        keep = (b["max_pre"] >= t_start) & (b["min_post"] < t_stop)
+        if passed is False:
+            keep &= b["n_fail"] > 0
+        elif passed is True:
+            keep &= b["n_fail"] < self.block_records
+        spans = [(int(k) * self.block_records, (int(k) + 1) * self.block_records) for k in np.flatnonzero(keep)]
+        if self._n > b.shape[0] * self.block_records:
+            spans.append((b.shape[0] * self.block_records, self._n))
+
+        hits = []
+        for lo, hi in spans:
+            r = recs[lo:hi]
+            m = (r["pre_t"] >= t_start) & (r["post_t"] < t_stop)
+            if passed is not None:
+                m &= (r["passed"] != 0) == passed
+            hits.append(lo + np.flatnonzero(m))
+        return np.concatenate(hits).astype(np.int64) if hits else np.zeros(0, dtype=np.int64)
+
+    def query(self, t_start: int, t_stop: int, passed: Optional[bool] = None) -> List[LedgerEntry]:
+        idx = self.query_indices(t_start, t_stop, passed)
+        recs = self._records()
+        return [self._entry(recs, int(i)) for i in idx]
+
+    def failing(self, t_start: int, t_stop: int) -> List[LedgerEntry]:
+        """All FAIL receipts whose PRE→POST pair lies inside [t_start, t_stop)."""
+        return self.query(t_start, t_stop, passed=False)
+
+    def lookup(self, pre_t: int, post_t: int) -> List[LedgerEntry]:
+        """Receipts recorded for exactly this (pre_t, post_t) pair."""
+        return [e for e in self.query(pre_t, post_t + 1) if e.pre_t == pre_t and e.post_t == post_t]
+
+    def verify(self, start: int = 0, stop: Optional[int] = None) -> Optional[int]:
+        """
+        Re-hash records [start, stop) from the stored chain of record start-1.
+
+        Returns the first record whose chain does not match, or None if the
+        range is intact. Verifying consecutive ranges covers the whole ledger.
+        """
+        self.flush()
+        stop = self._n if stop is None else int(stop)
+        if not 0 <= start <= stop <= self._n:
+            raise ValueError(f"invalid record range [{start}, {stop}) for {self._n} records")
+        recs = self._records()
+        raw = recs[start:stop].view(np.uint8).reshape(-1, RECORD_DTYPE.itemsize) if stop > start else None
+        prev = self._chain_at(start - 1)
+        for i in range(stop - start):
+            row = raw[i].tobytes()
+            prev = _chain(prev, row[:_BODY_BYTES])
+            if prev != row[_BODY_BYTES:]:
+                return start + i
+        return None
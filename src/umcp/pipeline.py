@@ -0,0 +1,129 @@
+# src/umcp/pipeline.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+
+from umcp.closures import DriftClosure, GammaOmegaPower
+from umcp.contract import FrozenContract
+from umcp.frame import DEFAULT_BLOCK_ROWS, Tier1Frame, _fill_tier1_columns, _Tier1Workspace
+from umcp.tier0.admit import AdmittedTrace, _check_policies
+
+
+DEFAULT_CHUNK_ROWS = 65536
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class OORIndex:
+    """
+    Sparse out-of-range flags for a (T,n) raw trace.
+
+    flat holds the sorted row-major indices of flagged entries, which is far
+    smaller than a (T,n) bool mask when OOR values are rare.
+    """
+    shape: Tuple[int, int]
+    flat: np.ndarray  # int64
+
+    def __len__(self) -> int:
+        return int(self.flat.shape[0])
+
+    @property
+    def rows(self) -> np.ndarray:
+        """Time indices with at least one flagged coordinate."""
+        return np.unique(self.flat // max(self.shape[1], 1))
+
+    def to_mask(self) -> np.ndarray:
+        mask = np.zeros(self.shape, dtype=bool)
+        mask.reshape(-1)[self.flat] = True
+        return mask
+
+    def packbits(self) -> np.ndarray:
+        """Bit-packed row-major mask (np.unpackbits(..., count=T*n) restores it)."""
+        bits = np.zeros((self.shape[0] * self.shape[1] + 7) // 8, dtype=np.uint8)
+        np.bitwise_or.at(bits, self.flat >> 3, (0x80 >> (self.flat & 7)).astype(np.uint8))
+        return bits
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class FusedResult:
+    """
+    Output of admit_and_compute.
+
+    psi: admitted trace (the caller's array when clipped in place)
+    oor: sparse out-of-range flags
+    frame: Tier-1 columns
+    """
+    psi: np.ndarray
+    oor: OORIndex
+    frame: Tier1Frame
+
+    def admitted(self) -> AdmittedTrace:
+        """Materialize the classic AdmittedTrace (allocates the full bool mask)."""
+        return AdmittedTrace(psi=self.psi, oor_mask=self.oor.to_mask())
+
+
+def admit_and_compute(
+    raw: np.ndarray,
+    contract: FrozenContract,
+    drift_closure: Optional[DriftClosure] = None,
+    *,
+    inplace: bool = False,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    block_rows: int = DEFAULT_BLOCK_ROWS,
+) -> FusedResult:
+    """
+    admit_trace followed by compute_tier1_frame in one pass over time chunks.
+
+    With inplace=True and a writeable C-contiguous raw array already in the
+    contract's precision (float64 unless contract.precision says otherwise), clipping
+    happens in the caller's buffer; otherwise raw is copied exactly once. OOR
+    flags are collected per chunk as sparse indices, and the kernel reuses one
+    set of block scratch buffers for every chunk, so peak memory is about one
+    trace copy plus the Tier-1 columns. Results equal the unfused path exactly.
+    """
+    _check_policies(contract)
+    if chunk_rows < 1:
+        raise ValueError(f"chunk_rows must be >= 1; got {chunk_rows}")
+
+    dtype = contract.float_dtype
+    can_reuse = (
+        isinstance(raw, np.ndarray)
+        and raw.dtype == dtype
+        and raw.flags.c_contiguous
+        and raw.flags.writeable
+    )
+    psi = raw if (inplace and can_reuse) else np.array(raw, dtype=dtype, order="C")
+    if psi.ndim != 2:
+        raise ValueError(f"raw trace must be 2D array shaped (T,n); got shape={psi.shape}")
+
+    Gamma = drift_closure if drift_closure is not None else GammaOmegaPower(p=float(contract.p), epsilon=float(contract.epsilon))
+
+    T, n = psi.shape
+    a, b = contract.a, contract.b
+    frame = Tier1Frame.empty(T)
+    rows = max(min(chunk_rows, T), 1)
+    ws = _Tier1Workspace(max(min(block_rows, rows), 1), n)
+    # Flag on the caller's values (before any down-cast), as admit_trace does.
+    flag_src = raw if isinstance(raw, np.ndarray) else psi
+    low = np.empty((rows, n), dtype=bool)
+    high = np.empty((rows, n), dtype=bool)
+    flagged = []
+
+    for start in range(0, T, chunk_rows):
+        stop = min(start + chunk_rows, T)
+        x = psi[start:stop]
+        m = stop - start
+        np.less(flag_src[start:stop], a, out=low[:m])
+        np.greater(flag_src[start:stop], b, out=high[:m])
+        np.logical_or(low[:m], high[:m], out=low[:m])
+        hits = np.flatnonzero(low[:m])
+        if hits.size:
+            flagged.append(hits + start * n)
+            np.clip(x, a, b, out=x)
+        # Rows before start are already admitted, so they serve as the halo.
+        _fill_tier1_columns(psi, frame.slice(start, stop), start, stop, contract, Gamma, block_rows, ws)
+
+    flat = np.concatenate(flagged).astype(np.int64, copy=False) if flagged else np.empty(0, dtype=np.int64)
+    return FusedResult(psi=psi, oor=OORIndex(shape=(T, n), flat=flat), frame=frame)
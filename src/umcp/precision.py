@@ -0,0 +1,105 @@
+# src/umcp/precision.py
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from umcp.closures import DriftClosure
+from umcp.contract import FrozenContract
+from umcp.frame import Tier1Frame, compute_tier1_frame
+from umcp.regime.classify import classify_regimes
+from umcp.tier0.admit import admit_trace
+from umcp.weld import evaluate_welds
+
+
+# Columns whose float32-vs-float64 deviation is reported.
+REPORTED_COLUMNS = ("omega", "F", "S", "C", "IC", "kappa")
+
+
+@dataclass(frozen=True, slots=True)
+class PrecisionReport:
+    """
+    Reduced-precision run compared against the float64 reference.
+
+    max_abs_dev: max |Δ| per Tier-1 column (NaN-aware)
+    oor_mismatches: admission flags that differ
+    tau_mismatches: rows whose τ_R differs
+    regime_disagreements: rows classified into a different regime
+    weld_pass_disagreements: weld pairs whose PASS decision differs
+    """
+    precision: str
+    rows: int
+    max_abs_dev: Dict[str, float]
+    oor_mismatches: int
+    tau_mismatches: int
+    regime_disagreements: int
+    weld_pairs: int
+    weld_pass_disagreements: int
+
+    @property
+    def decisions_agree(self) -> bool:
+        """True if every discrete outcome (flags, τ_R, regime, PASS) matches."""
+        return (
+            self.oor_mismatches == 0
+            and self.tau_mismatches == 0
+            and self.regime_disagreements == 0
+            and self.weld_pass_disagreements == 0
+        )
+
+
+def _max_abs_dev(a: np.ndarray, b: np.ndarray) -> float:
+    both_nan = np.isnan(a) & np.isnan(b)
+    with np.errstate(invalid="ignore"):
+        d = np.abs(a - b)
+    d = np.where(both_nan | (a == b), 0.0, d)  # equal infinities count as 0
+    return float(np.max(d)) if d.size else 0.0
+
+
+def validate_precision(
+    raw: np.ndarray,
+    contract: FrozenContract,
+    drift_closure: Optional[DriftClosure] = None,
+    *,
+    precision: str = "float32",
+    weld_pairs: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+) -> PrecisionReport:
+    """
+    Run admission → Tier-1 → regime → weld twice on the same raw trace, in
+    float64 and in `precision`, and report how far the reduced run drifts.
+
+    weld_pairs is (pre_index, post_index); by default every consecutive
+    (t-1 → t) pair is welded.
+    """
+    ref_contract = replace(contract, precision="float64")
+    low_contract = replace(contract, precision=precision)
+
+    def run(c: FrozenContract) -> Tuple[np.ndarray, Tier1Frame, np.ndarray]:
+        admitted = admit_trace(raw, c)
+        frame = compute_tier1_frame(admitted.psi, c, drift_closure)
+        return admitted.oor_mask, frame, classify_regimes(frame, c)
+
+    ref_oor, ref, ref_codes = run(ref_contract)
+    low_oor, low, low_codes = run(low_contract)
+
+    T = len(ref)
+    if weld_pairs is None:
+        pre_idx = np.arange(0, max(T - 1, 0), dtype=np.int64)
+        post_idx = pre_idx + 1
+    else:
+        pre_idx, post_idx = (np.asarray(i, dtype=np.int64) for i in weld_pairs)
+    ref_w = evaluate_welds(ref, ref, ref_contract, drift_closure, pre_index=pre_idx, post_index=post_idx)
+    low_w = evaluate_welds(low, low, low_contract, drift_closure, pre_index=pre_idx, post_index=post_idx)
+
+    tau_same = (ref.tau_R == low.tau_R) | (np.isnan(ref.tau_R) & np.isnan(low.tau_R))
+    return PrecisionReport(
+        precision=precision,
+        rows=T,
+        max_abs_dev={name: _max_abs_dev(ref.column(name), low.column(name)) for name in REPORTED_COLUMNS},
+        oor_mismatches=int(np.count_nonzero(ref_oor != low_oor)),
+        tau_mismatches=int(np.count_nonzero(~tau_same)),
+        regime_disagreements=int(np.count_nonzero(ref_codes != low_codes)),
+        weld_pairs=int(pre_idx.size),
+        weld_pass_disagreements=int(np.count_nonzero(ref_w.passed != low_w.passed)),
+    )
@@ -0,0 +1,201 @@
+# src/umcp/primes.py
+from __future__ import annotations
+
+import math
+import os
+import threading
+from typing import Union
+
+import numpy as np
+
+
+# Integers sieved per segment while growing the table.
+_SEGMENT = 1 << 20
+
+# prime_count(n) beyond the table switches to the sublinear counter once n is
+# at least this large; below it, growing the table is cheaper and reusable.
+SUBLINEAR_PI_MIN = 1 << 24
+
+
+def _nth_prime_bound(k: int) -> int:
+    # Upper bound for the k-th prime: k(ln k + ln ln k) for k >= 6.
+    if k < 6:
+        return 15
+    return int(k * (math.log(k) + math.log(math.log(k)))) + 10
+
+
+def _storage_dtype(limit: int) -> np.dtype:
+    return np.dtype(np.uint32) if limit < 2**32 else np.dtype(np.uint64)
+
+
+class PrimeTable:
+    """
+    Incrementally grown table of all primes ≤ limit.
+
+    Stored as one contiguous numpy array (uint32 while it fits, else uint64)
+    and extended with a segmented sieve, so earlier primes are never
+    regenerated. Thread-safe; save()/load() persist the table as .npz.
+    """
+
+    def __init__(self) -> None:
+        self._primes = np.empty(0, dtype=np.uint32)
+        self._limit = 1
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        """All primes ≤ limit are in the table."""
+        return self._limit
+
+    def __len__(self) -> int:
+        return int(self._primes.shape[0])
+
+    def _base_primes(self, hi: int) -> np.ndarray:
+        # Sieving primes for [.., hi): every prime ≤ sqrt(hi - 1). Caller holds the lock.
+        r = math.isqrt(max(hi - 1, 0))
+        if r > self._limit:
+            self._grow(r)
+        return self._primes[: int(np.searchsorted(self._primes, r, side="right"))]
+
+    def _grow(self, n: int) -> None:
+        base = self._base_primes(n + 1)  # may grow the table up to √n first
+        lo = self._limit + 1
+        chunks = [self._primes]
+        dtype = _storage_dtype(n)
+        for s0 in range(lo, n + 1, _SEGMENT):
+            s1 = min(s0 + _SEGMENT, n + 1)
+            seg = np.ones(s1 - s0, dtype=bool)
+            for p in base.tolist():
+                pp = p * p
+                if pp >= s1:
+                    break
+                start = max(pp, ((s0 + p - 1) // p) * p)
+                seg[start - s0::p] = False
+            if s0 <= 1:
+                seg[: 2 - s0] = False
+            chunks.append((s0 + np.flatnonzero(seg)).astype(dtype))
+        self._primes = np.concatenate(chunks).astype(dtype, copy=False)
+        self._limit = n
+
+    def extend_to(self, n: int) -> None:
+        n = int(n)
+        if n <= self._limit:
+            return
+        with self._lock:
+            if n > self._limit:
+                self._grow(n)
+
+    def upto(self, n: int) -> np.ndarray:
+        """Read-only view of all primes ≤ n."""
+        self.extend_to(n)
+        primes = self._primes
+        view = primes[: int(np.searchsorted(primes, max(int(n), 0), side="right"))]
+        view.flags.writeable = False
+        return view
+
+    def first(self, k: int) -> np.ndarray:
+        """Read-only view of the first k primes."""
+        k = int(k)
+        if k <= 0:
+            return np.empty(0, dtype=self._primes.dtype)
+        bound = max(_nth_prime_bound(k), self._limit)
+        while len(self) < k:
+            self.extend_to(bound)
+            bound *= 2
+        view = self._primes[:k]
+        view.flags.writeable = False
+        return view
+
+    def count(self, n: int) -> int:
+        """π(n) from the table (grows it to n)."""
+        return int(self.upto(n).shape[0])
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        with self._lock:
+            primes, limit = self._primes, self._limit
+        tmp = f"{os.fspath(path)}.tmp.{os.getpid()}"
+        with open(tmp, "wb") as fh:
+            np.savez(fh, primes=primes, limit=np.array(limit, dtype=np.uint64))
+        os.replace(tmp, path)
+
+    def load(self, path: Union[str, os.PathLike]) -> None:
+        """Adopt a saved table if it covers more than the current one."""
+        with np.load(path) as data:
+            primes = data["primes"]
+            limit = int(data["limit"])
+        with self._lock:
+            if limit > self._limit:
+                self._primes = primes.astype(_storage_dtype(limit), copy=False)
+                self._limit = limit
+
+
+def _lucy_prime_count(n: int) -> int:
+    """
+    π(n) in O(n^(3/4)) time and O(√n) memory (Lucy_Hedgehog's Legendre-style
+    recurrence, the sieve-free core of Meissel–Lehmer counting).
+
+    S(v) starts as the count of 2..v; sieving by each prime p ≤ √n removes the
+    composites whose smallest factor is p: S(v) -= S(v//p) − S(p−1).
+    small[v] = S(v) for v ≤ √n, large[i] = S(n//i) for i ≤ √n.
+    """
+    r = math.isqrt(n)
+    small = np.arange(-1, r, dtype=np.int64)  # small[v] = v - 1
+    i = np.arange(1, r + 1, dtype=np.int64)
+    large = np.empty(r + 1, dtype=np.int64)
+    large[0] = 0
+    large[1:] = n // i - 1
+    for p in range(2, r + 1):
+        if small[p] == small[p - 1]:
+            continue  # p is composite
+        sp = small[p - 1]
+        p2 = p * p
+        lim = min(r, n // p2)
+        if lim >= 1:
+            d = i[:lim] * p
+            inner = d <= r
+            rhs = np.empty(lim, dtype=np.int64)
+            rhs[inner] = large[d[inner]]
+            rhs[~inner] = small[n // d[~inner]]
+            large[1:lim + 1] -= rhs - sp
+        if p2 <= r:
+            v = np.arange(p2, r + 1, dtype=np.int64)
+            small[p2:] -= small[v // p] - sp
+    return int(large[1])
+
+
+# Process-wide table shared by prime_pi, eid_checksum and friends.
+_TABLE = PrimeTable()
+
+
+def prime_table() -> PrimeTable:
+    return _TABLE
+
+
+def primes_upto(n: int) -> np.ndarray:
+    return _TABLE.upto(n)
+
+
+def first_primes(k: int) -> np.ndarray:
+    return _TABLE.first(k)
+
+
+def prime_count(n: int) -> int:
+    """π(n): table lookup when covered, sublinear counting for large n."""
+    n = int(n)
+    if n < 2:
+        return 0
+    if n <= _TABLE.limit or n < SUBLINEAR_PI_MIN:
+        return _TABLE.count(n)
+    return _lucy_prime_count(n)
+
+
+def load_prime_cache(path: Union[str, os.PathLike]) -> bool:
+    """Load a persisted table into the process-wide one; False if path is missing."""
+    if not os.path.exists(path):
+        return False
+    _TABLE.load(path)
+    return True
+
+
+def save_prime_cache(path: Union[str, os.PathLike]) -> None:
+    _TABLE.save(path)
@@ -6,8 +6,21 @@ Default gates:
 - Stable: ω < 0.038 and F > 0.90 and S < 0.15 and C < 0.14
 - Watch:  0.038 ≤ ω < 0.30 (or unstable by other measures)
 - Collapse: ω ≥ 0.30
+
+Whole series classify to uint8 codes (classify_regimes); RegimeTimeline
+run-length encodes them for point, interval and transition queries.
 """
 
-from .classify import Regime, classify_regime
+from .classify import COLLAPSE, REGIME_NAMES, STABLE, WATCH, Regime, classify_regime, classify_regimes
+from .timeline import RegimeTimeline
 
-__all__ = ["Regime", "classify_regime"]
+__all__ = [
+    "Regime",
+    "classify_regime",
+    "classify_regimes",
+    "REGIME_NAMES",
+    "STABLE",
+    "WATCH",
+    "COLLAPSE",
+    "RegimeTimeline",
+]
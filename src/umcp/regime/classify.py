@@ -1,10 +1,12 @@
 # src/umcp/regime/classify.py
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Literal
+from typing import Literal, Tuple
+
+import numpy as np
 
 from umcp.contract import FrozenContract
+from umcp.frame import Tier1Frame
 from umcp.kernel import Tier1Row
 
 
@@ -37,3 +39,32 @@ def classify_regime(row: Tier1Row, contract: FrozenContract) -> Regime:
         return "Stable"
 
     return "Watch"
+
+
+# uint8 regime codes: REGIME_NAMES[code] is the Regime label.
+REGIME_NAMES: Tuple[Regime, ...] = ("Stable", "Watch", "Collapse")
+STABLE, WATCH, COLLAPSE = 0, 1, 2
+
+
+def classify_regimes(frame: Tier1Frame, contract: FrozenContract) -> np.ndarray:
+    """
+    Vectorized classify_regime over a whole Tier-1 series.
+
+    Returns a uint8 array of codes (STABLE / WATCH / COLLAPSE, see
+    REGIME_NAMES) with the same gate priority as the per-row classifier.
+    """
+    omega = np.asarray(frame.omega, dtype=float)
+    F = np.asarray(frame.F, dtype=float)
+    S = np.asarray(frame.S, dtype=float)
+    C = np.asarray(frame.C, dtype=float)
+
+    codes = np.full(omega.shape, WATCH, dtype=np.uint8)
+    stable = (
+        (omega < float(contract.stable_omega_max))
+        & (F > float(contract.stable_F_min))
+        & (S < float(contract.stable_S_max))
+        & (C < float(contract.stable_C_max))
+    )
+    codes[stable] = STABLE
+    codes[omega >= float(contract.watch_omega_max)] = COLLAPSE
+    return codes
@@ -0,0 +1,90 @@
+# src/umcp/regime/timeline.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from umcp.regime.classify import REGIME_NAMES, Regime
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class RegimeTimeline:
+    """
+    Run-length encoded regime history over t ∈ [t0, stop).
+
+    Run k covers [starts[k], starts[k+1]) (the last run ends at stop) and has
+    regime code codes[k]. Point and transition queries are O(log runs);
+    interval queries are O(log runs + matching runs).
+    """
+    starts: np.ndarray  # int64, strictly increasing, starts[0] == t0
+    codes: np.ndarray  # uint8, codes[k] != codes[k+1]
+    stop: int
+    _runs_by_code: Dict[int, np.ndarray]
+
+    @classmethod
+    def from_codes(cls, codes: np.ndarray, t0: int = 0) -> "RegimeTimeline":
+        c = np.asarray(codes, dtype=np.uint8)
+        if c.ndim != 1:
+            raise ValueError(f"codes must be 1D; got shape={c.shape}")
+        if c.size == 0:
+            starts = np.empty(0, dtype=np.int64)
+        else:
+            starts = np.flatnonzero(np.concatenate(([True], c[1:] != c[:-1]))).astype(np.int64)
+        run_codes = c[starts]
+        by_code = {k: np.flatnonzero(run_codes == k) for k in range(len(REGIME_NAMES))}
+        return cls(starts=starts + int(t0), codes=run_codes, stop=int(t0) + int(c.size), _runs_by_code=by_code)
+
+    @property
+    def t0(self) -> int:
+        return int(self.starts[0]) if self.starts.size else self.stop
+
+    def __len__(self) -> int:
+        return int(self.starts.shape[0])
+
+    def _run_stop(self, k: int) -> int:
+        return int(self.starts[k + 1]) if k + 1 < len(self) else self.stop
+
+    def _run_at(self, t: int) -> int:
+        if not self.t0 <= t < self.stop:
+            raise IndexError(f"t={t} outside timeline [{self.t0}, {self.stop})")
+        return int(np.searchsorted(self.starts, t, side="right")) - 1
+
+    def code_at(self, t: int) -> int:
+        return int(self.codes[self._run_at(t)])
+
+    def regime_at(self, t: int) -> Regime:
+        return REGIME_NAMES[self.code_at(t)]
+
+    def run_at(self, t: int) -> Tuple[int, int, Regime]:
+        """(start, stop, regime) of the run containing t."""
+        k = self._run_at(t)
+        return int(self.starts[k]), self._run_stop(k), REGIME_NAMES[int(self.codes[k])]
+
+    def next_transition(self, t: int) -> Optional[int]:
+        """First time > t at which the regime changes, or None."""
+        k = int(np.searchsorted(self.starts, t, side="right"))
+        return int(self.starts[k]) if k < len(self) else None
+
+    def intervals(self, regime: Regime, t0: int, t1: int) -> List[Tuple[int, int]]:
+        """All [start, stop) spans of `regime` intersected with [t0, t1)."""
+        runs = self._runs_by_code[REGIME_NAMES.index(regime)]
+        if runs.size == 0 or t1 <= t0:
+            return []
+        # First run of this regime that can end after t0: the one containing t0 or later.
+        k0 = max(int(np.searchsorted(self.starts, t0, side="right")) - 1, 0)
+        k1 = int(np.searchsorted(self.starts, t1, side="left"))
+        lo = int(np.searchsorted(runs, k0, side="left"))
+        hi = int(np.searchsorted(runs, k1, side="left"))
+        out: List[Tuple[int, int]] = []
+        for k in runs[lo:hi]:
+            s = max(int(self.starts[k]), t0)
+            e = min(self._run_stop(int(k)), t1)
+            if s < e:
+                out.append((s, e))
+        return out
+
+    def transitions(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(t, from_code, to_code) for every regime change."""
+        return self.starts[1:].copy(), self.codes[:-1].copy(), self.codes[1:].copy()
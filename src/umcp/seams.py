@@ -0,0 +1,172 @@
+# src/umcp/seams.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+
+from umcp.closures import DriftClosure, GammaOmegaPower, evaluate_closure
+from umcp.contract import FrozenContract
+from umcp.frame import Tier1Frame
+from umcp.kernel import Tier1Row
+from umcp.weld import WELD_COLUMNS, WeldTable, evaluate_welds
+
+
+# Candidate pairs gathered before each exact evaluate_welds pass.
+_VERIFY_PAIRS = 1 << 16
+
+# Padding (in ulps of the magnitudes involved) on the ln(IC0) interval, so pairs
+# whose computed ln(IC1/IC0) differs from ln(IC1) − ln(IC0) by rounding are
+# still tried.
+_SLACK_ULPS = 64.0
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class SeamMatches:
+    """
+    PASS welds found in a series: receipts.row k welds pre_t[k] → post_t[k].
+
+    Sorted by post_t, then pre_t.
+    """
+    pre_t: np.ndarray  # int64
+    post_t: np.ndarray  # int64
+    receipts: WeldTable
+
+    def __len__(self) -> int:
+        return int(self.pre_t.shape[0])
+
+
+def _select(table: WeldTable, keep: np.ndarray) -> WeldTable:
+    return WeldTable(**{name: getattr(table, name)[keep] for name in WELD_COLUMNS})
+
+
+def _concat(tables: List[WeldTable]) -> WeldTable:
+    if not tables:
+        return WeldTable(**{name: np.empty(0, dtype=bool if name == "passed" else float) for name in WELD_COLUMNS})
+    return WeldTable(**{name: np.concatenate([getattr(t, name) for t in tables]) for name in WELD_COLUMNS})
+
+
+def find_seams(
+    series: Union[Tier1Frame, Sequence[Tier1Row]],
+    contract: FrozenContract,
+    drift_closure: Optional[DriftClosure] = None,
+    *,
+    max_distance: Optional[int] = None,
+    best_only: bool = False,
+) -> SeamMatches:
+    """
+    Every PASS weld PRE→POST with pre_t < post_t in one series.
+
+    The budget R·τ_R − (Γ(ω) + α·C) depends only on POST, and the ledger is
+    ln(IC1/IC0), so |s| <= tol_seam confines ln(IC0) to an interval of width
+    2·tol_seam around ln(IC1) − budget. PRE rows are sorted by ln(IC) once;
+    each POST takes the matching range (or, when max_distance makes the time
+    window smaller, scans that window). The interval is padded for rounding,
+    and every candidate is re-decided by evaluate_welds, so PASS agrees exactly
+    with evaluate_weld. Cost is about O(T log T + candidates).
+
+    max_distance: only pairs with post_t − pre_t <= max_distance
+    best_only: keep one PRE per POST, the one with the smallest |s| (ties go
+        to the latest PRE)
+    """
+    frame = series if isinstance(series, Tier1Frame) else Tier1Frame.from_rows(list(series))
+    if max_distance is not None and max_distance < 1:
+        raise ValueError(f"max_distance must be >= 1; got {max_distance}")
+
+    eps = float(contract.epsilon)
+    p = float(contract.p)
+    alpha = float(contract.alpha)
+    tol = float(contract.tol_seam)
+    Gamma = drift_closure if drift_closure is not None else GammaOmegaPower(p=p, epsilon=eps)
+
+    IC = np.asarray(frame.IC, dtype=float)
+    tau = np.asarray(frame.tau_R, dtype=float)
+    # The ledger is ln(IC1/IC0), so search on ln(IC) rather than the κ column
+    # (they differ once IC is clipped).
+    with np.errstate(divide="ignore", invalid="ignore"):
+        kappa = np.log(IC)
+
+    with np.errstate(invalid="ignore", over="ignore"):
+        budget = tau - (evaluate_closure(Gamma, frame.omega) + alpha * np.asarray(frame.C, dtype=float))
+        center = kappa - budget
+    usable = (IC > 0.0) & np.isfinite(kappa)
+    posts = np.flatnonzero(usable & np.isfinite(tau) & np.isfinite(center))
+
+    pres = np.flatnonzero(usable)
+    order = pres[np.argsort(kappa[pres], kind="stable")]
+    sorted_k = kappa[order]
+    scale = float(np.max(np.abs(kappa[pres]))) if pres.size else 0.0
+    pad = tol + _SLACK_ULPS * np.finfo(float).eps * (1.0 + 2.0 * scale + np.abs(budget[posts]) + tol)
+    lo = np.searchsorted(sorted_k, center[posts] - pad, side="left")
+    hi = np.searchsorted(sorted_k, center[posts] + pad, side="right")
+
+    found_pre: List[np.ndarray] = []
+    found_post: List[np.ndarray] = []
+    found: List[WeldTable] = []
+    buf_pre: List[np.ndarray] = []
+    buf_post: List[np.ndarray] = []
+    pending = 0
+
+    def verify() -> None:
+        i0 = np.concatenate(buf_pre)
+        i1 = np.concatenate(buf_post)
+        table = evaluate_welds(frame, frame, contract, drift_closure, pre_index=i0, post_index=i1)
+        keep = table.passed
+        found_pre.append(i0[keep])
+        found_post.append(i1[keep])
+        found.append(_select(table, keep))
+        buf_pre.clear()
+        buf_post.clear()
+
+    for k, j in enumerate(posts):
+        j = int(j)
+        if hi[k] == lo[k]:
+            continue
+        w0 = 0 if max_distance is None else max(j - int(max_distance), 0)
+        if w0 >= j:
+            continue
+        if hi[k] - lo[k] <= j - w0:
+            cand = order[lo[k]:hi[k]]
+            cand = cand[(cand >= w0) & (cand < j)]
+        else:
+            win = kappa[w0:j]
+            with np.errstate(invalid="ignore"):
+                near = np.abs(win - center[j]) <= pad[k]
+            cand = w0 + np.flatnonzero(near & usable[w0:j])
+        if cand.size == 0:
+            continue
+        buf_pre.append(np.sort(cand))
+        buf_post.append(np.full(cand.size, j, dtype=np.int64))
+        pending += cand.size
+        if pending >= _VERIFY_PAIRS:
+            verify()
+            pending = 0
+    if buf_pre:
+        verify()
+
+    pre = np.concatenate(found_pre) if found_pre else np.empty(0, dtype=np.int64)
+    post = np.concatenate(found_post) if found_post else np.empty(0, dtype=np.int64)
+    table = _concat(found)
+
+    if best_only and pre.size:
+        # Within each POST (already contiguous), smallest |s|, then latest PRE.
+        rank = np.lexsort((-pre, np.abs(table.seam_residual), post))
+        first = np.ones(rank.size, dtype=bool)
+        first[1:] = post[rank][1:] != post[rank][:-1]
+        keep = np.sort(rank[first])
+        pre, post, table = pre[keep], post[keep], _select(table, keep)
+
+    t0 = int(frame.t0)
+    return SeamMatches(pre_t=pre.astype(np.int64) + t0, post_t=post.astype(np.int64) + t0, receipts=table)
+
+
+def count_seams(
+    series: Union[Tier1Frame, Sequence[Tier1Row]],
+    contract: FrozenContract,
+    drift_closure: Optional[DriftClosure] = None,
+    *,
+    max_distance: Optional[int] = None,
+) -> int:
+    """Number of PASS welds find_seams would return."""
+    return len(find_seams(series, contract, drift_closure, max_distance=max_distance))
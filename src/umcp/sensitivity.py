@@ -0,0 +1,247 @@
+# src/umcp/sensitivity.py
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+import math
+from typing import Dict, Literal, Optional, Sequence, Tuple
+
+import numpy as np
+
+from umcp.closures import DriftClosure, GammaOmegaPower, closure_derivative, evaluate_closure
+from umcp.contract import FrozenContract
+from umcp.frame import DEFAULT_BLOCK_ROWS, Tier1Frame, compute_tier1_frame
+from umcp.weld import evaluate_welds
+
+
+SENSITIVITY_PARAMS = ("alpha", "lam", "p", "epsilon")
+
+# Default relative step for the finite-difference cross-check, and the
+# absolute floor that keeps it above rounding noise for tiny parameters
+# (ε = 1e-8 would otherwise step by 1e-12).
+FD_REL_STEP = 1e-4
+FD_ABS_STEP = 1e-10
+
+GradientMethod = Literal["analytic", "fd"]
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class KappaSensitivity:
+    """
+    Per-row derivatives of κ and of the weld budget w.r.t. contract parameters.
+
+    d_kappa[k, i]  = ∂κ(t0+i)/∂params[k]
+    d_budget[k, i] = ∂(R·τ_R − Γ(ω) − α·C)(t0+i)/∂params[k], row i as POST;
+                     NaN where τ_R = ∞_rec (the budget itself is NaN there)
+    τ_R is piecewise constant in every parameter and is treated as fixed.
+    """
+    params: Tuple[str, ...]
+    d_kappa: np.ndarray
+    d_budget: np.ndarray
+    frame: Tier1Frame
+
+    def __getitem__(self, param: str) -> np.ndarray:
+        return self.d_kappa[self.params.index(param)]
+
+    def d_IC(self, param: str) -> np.ndarray:
+        """∂IC/∂param = IC·∂κ/∂param."""
+        return self.frame.IC * self[param]
+
+    def seam(self, pre_index: np.ndarray, post_index: np.ndarray) -> np.ndarray:
+        """
+        ∂s/∂params for PRE→POST pairs, shape (len(params), K).
+
+        s = budget(POST) − (κ1 − κ0), so ∂s = ∂budget1 − ∂κ1 + ∂κ0. NaN where
+        s itself is undefined (τ_R(POST) = ∞_rec or a non-positive IC).
+        """
+        i0 = np.asarray(pre_index, dtype=np.int64)
+        i1 = np.asarray(post_index, dtype=np.int64)
+        ds = self.d_budget[:, i1] - self.d_kappa[:, i1] + self.d_kappa[:, i0]
+        defined = np.isfinite(self.frame.tau_R[i1]) & (self.frame.IC[i0] > 0.0) & (self.frame.IC[i1] > 0.0)
+        ds[:, ~defined] = np.nan
+        return ds
+
+
+def _check_params(params: Sequence[str]) -> Tuple[str, ...]:
+    params = tuple(params)
+    bad = [p for p in params if p not in SENSITIVITY_PARAMS]
+    if bad:
+        raise ValueError(f"unsupported sensitivity parameters {bad}; choose from {SENSITIVITY_PARAMS}")
+    return params
+
+
+def _lp_mean_norm_grad(d: np.ndarray, p: float, eps: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Row-wise ∂M/∂p and ∂M/∂ε for M = mean((|d|+ε)^p)^(1/p):
+      ∂M/∂p = M·(mean(v^p·ln v)/(p·A) − ln A/p²),  ∂M/∂ε = M·mean(v^(p−1))/A
+    with v = |d|+ε and A = mean(v^p).
+    """
+    v = np.abs(d) + eps
+    vp = np.power(v, p)
+    A = np.mean(vp, axis=1)
+    M = np.power(A, 1.0 / p)
+    d_p = M * (np.mean(vp * np.log(v), axis=1) / (p * A) - np.log(A) / (p * p))
+    d_eps = M * np.mean(vp / v, axis=1) / A
+    return d_p, d_eps
+
+
+def _entropy_grad_eps(x: np.ndarray, eps: float) -> np.ndarray:
+    # S depends on ε only through the clip: x1 = ε below, 1−ε above, and
+    # dh/dx1 = ln((1−x1)/x1).
+    low = x < eps
+    high = x > 1.0 - eps
+    x1 = np.clip(x, eps, 1.0 - eps)
+    g = np.log((1.0 - x1) / x1) * (low.astype(float) - high.astype(float))
+    return np.mean(g, axis=1) / math.log(2.0)
+
+
+def _analytic(
+    x: np.ndarray,
+    frame: Tier1Frame,
+    contract: FrozenContract,
+    drift_closure: Optional[DriftClosure],
+    params: Tuple[str, ...],
+    block_rows: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    eps = float(contract.epsilon)
+    p = float(contract.p)
+    alpha = float(contract.alpha)
+    lam = float(contract.lam)
+    Gamma = drift_closure if drift_closure is not None else GammaOmegaPower(p=p, epsilon=eps)
+
+    T = x.shape[0]
+    w_p, w_e, c_p, c_e, s_e = (np.zeros(T) for _ in range(5))
+    for b0 in range(0, T, block_rows):
+        b1 = min(b0 + block_rows, T)
+        lo = max(b0, 1)
+        if lo < b1:
+            w_p[lo:b1], w_e[lo:b1] = _lp_mean_norm_grad(x[lo:b1] - x[lo - 1:b1 - 1], p, eps)
+        lo = max(b0, 2)
+        if lo < b1:
+            dd = x[lo:b1] - 2.0 * x[lo - 1:b1 - 1] + x[lo - 2:b1 - 2]
+            c_p[lo:b1], c_e[lo:b1] = _lp_mean_norm_grad(dd, p, eps)
+        s_e[b0:b1] = _entropy_grad_eps(x[b0:b1], eps)
+
+    omega = np.asarray(frame.omega, dtype=float)
+    g_w = closure_derivative(Gamma, omega)
+    # Only the default closure is parameterized by the contract's p and ε.
+    g_theta: Dict[str, np.ndarray] = Gamma.param_derivatives(omega) if drift_closure is None else {}
+    zero = np.zeros(T)
+
+    d_kappa = np.empty((len(params), T))
+    d_budget = np.empty((len(params), T))
+    for k, name in enumerate(params):
+        if name == "alpha":
+            d_D, d_LS = np.asarray(frame.C, dtype=float), zero
+        elif name == "lam":
+            d_D, d_LS = zero, np.asarray(frame.S, dtype=float)
+        elif name == "p":
+            d_D, d_LS = g_theta.get("p", zero) + g_w * w_p + alpha * c_p, zero
+        else:  # epsilon
+            d_D, d_LS = g_theta.get("epsilon", zero) + g_w * w_e + alpha * c_e, lam * s_e
+        # κ = −(D + λS) with D = Γ(ω) + α·C; budget = R·τ_R − D.
+        d_kappa[k] = -(d_D + d_LS)
+        d_budget[k] = -d_D
+    # R·τ_R is NaN at τ_R = ∞_rec, so the budget has no derivative there.
+    d_budget[:, ~np.isfinite(frame.tau_R)] = np.nan
+    return d_kappa, d_budget
+
+
+def _budget(frame: Tier1Frame, contract: FrozenContract, drift_closure: Optional[DriftClosure]) -> np.ndarray:
+    Gamma = drift_closure if drift_closure is not None else GammaOmegaPower(p=float(contract.p), epsilon=float(contract.epsilon))
+    tau = np.asarray(frame.tau_R, dtype=float)
+    R = np.isfinite(tau).astype(float)
+    with np.errstate(invalid="ignore"):
+        return (R * tau) - (evaluate_closure(Gamma, frame.omega) + float(contract.alpha) * frame.C)
+
+
+def _step(contract: FrozenContract, name: str, rel_step: float) -> float:
+    v = float(getattr(contract, name))
+    if v == 0.0:
+        return rel_step
+    # The floor never exceeds |θ|/2, so θ ± h keeps the sign of θ.
+    return min(max(rel_step * abs(v), FD_ABS_STEP), 0.5 * abs(v))
+
+
+def kappa_sensitivity(
+    psi: np.ndarray,
+    contract: FrozenContract,
+    drift_closure: Optional[DriftClosure] = None,
+    *,
+    params: Sequence[str] = SENSITIVITY_PARAMS,
+    method: GradientMethod = "analytic",
+    rel_step: float = FD_REL_STEP,
+    block_rows: int = DEFAULT_BLOCK_ROWS,
+) -> KappaSensitivity:
+    """
+    ∂κ/∂θ and ∂budget/∂θ for every row, θ in params (alpha, lam, p, epsilon).
+
+    method="analytic" differentiates the kernel in closed form in one pass:
+    chain rule through Γ (DriftClosure.derivative / param_derivatives), the
+    mean-Lp norms behind ω and C, and the ε-clip in S. method="fd" reruns
+    compute_tier1_frame at θ ± h (h = rel_step·|θ|, at least FD_ABS_STEP) as
+    a cross-check.
+    """
+    params = _check_params(params)
+    x = np.asarray(psi, dtype=contract.float_dtype)
+    if x.ndim != 2:
+        raise ValueError(f"psi must be 2D array shaped (T,n); got shape={x.shape}")
+    frame = compute_tier1_frame(x, contract, drift_closure, block_rows=block_rows)
+
+    if method == "analytic":
+        d_kappa, d_budget = _analytic(x.astype(float, copy=False), frame, contract, drift_closure, params, block_rows)
+    elif method == "fd":
+        T = len(frame)
+        d_kappa = np.empty((len(params), T))
+        d_budget = np.empty((len(params), T))
+        for k, name in enumerate(params):
+            h = _step(contract, name, rel_step)
+            v = float(getattr(contract, name))
+            hi = replace(contract, **{name: v + h})
+            lo = replace(contract, **{name: v - h})
+            f_hi = compute_tier1_frame(x, hi, drift_closure, block_rows=block_rows)
+            f_lo = compute_tier1_frame(x, lo, drift_closure, block_rows=block_rows)
+            d_kappa[k] = (f_hi.kappa - f_lo.kappa) / (2.0 * h)
+            with np.errstate(invalid="ignore"):
+                d_budget[k] = (_budget(f_hi, hi, drift_closure) - _budget(f_lo, lo, drift_closure)) / (2.0 * h)
+    else:
+        raise ValueError(f"unknown method: {method!r}")
+
+    return KappaSensitivity(params=params, d_kappa=d_kappa, d_budget=d_budget, frame=frame)
+
+
+def seam_sensitivity(
+    psi: np.ndarray,
+    contract: FrozenContract,
+    pre_index: np.ndarray,
+    post_index: np.ndarray,
+    drift_closure: Optional[DriftClosure] = None,
+    *,
+    params: Sequence[str] = SENSITIVITY_PARAMS,
+    method: GradientMethod = "analytic",
+    rel_step: float = FD_REL_STEP,
+) -> np.ndarray:
+    """
+    ∂s/∂θ for PRE→POST pairs of one series, shape (len(params), K).
+
+    "analytic" combines kappa_sensitivity rows; "fd" re-evaluates the welds
+    (evaluate_welds) under θ ± h, independently of the analytic path.
+    """
+    if method == "analytic":
+        sens = kappa_sensitivity(psi, contract, drift_closure, params=params)
+        return sens.seam(pre_index, post_index)
+    if method != "fd":
+        raise ValueError(f"unknown method: {method!r}")
+
+    params = _check_params(params)
+    x = np.asarray(psi, dtype=contract.float_dtype)
+    out = np.empty((len(params), np.asarray(pre_index).shape[0]))
+    for k, name in enumerate(params):
+        h = _step(contract, name, rel_step)
+        v = float(getattr(contract, name))
+        s = []
+        for c in (replace(contract, **{name: v + h}), replace(contract, **{name: v - h})):
+            f = compute_tier1_frame(x, c, drift_closure)
+            s.append(evaluate_welds(f, f, c, drift_closure, pre_index=pre_index, post_index=post_index).seam_residual)
+        with np.errstate(invalid="ignore"):
+            out[k] = (s[0] - s[1]) / (2.0 * h)
+    return out
@@ -0,0 +1,392 @@
+# src/umcp/service.py
+"""
+asyncio ingestion service around admission and the streaming Tier-1 kernel.
+
+  async with IngestService(max_batch=256) as svc:
+      svc.register("sensor-a", contract)
+      await svc.submit("sensor-a", sample)      # waits while the queue is full
+      batch = await svc.next_batch("sensor-a")  # IngestBatch of Tier1Rows
+
+Each stream has its own FrozenContract, Tier1Stream and bounded input queue.
+One consumer task per stream drains up to max_batch samples (waiting at most
+max_delay for a batch to fill), then runs admission + the kernel for the whole
+micro-batch in an executor so the event loop never blocks on NumPy. Producers
+are throttled by the bounded queues; a slow reader of next_batch() throttles
+the consumer through the bounded output queue in turn.
+"""
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import json
+import math
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from umcp.closures import DriftClosure
+from umcp.contract import FrozenContract
+from umcp.kernel import Tier1Row
+from umcp.stream import Tier1Stream
+from umcp.tier0.admit import admit_trace
+
+
+BatchSink = Callable[["IngestBatch"], Awaitable[None]]
+
+_CLOSE = object()
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class IngestBatch:
+    """
+    One processed micro-batch.
+
+    rows: Tier1Rows for times t0 .. t0+len(rows)-1 (empty on failure)
+    oor_mask: (len(rows), n) admission flags
+    error: "ExcType: message" if the batch failed, else None
+    """
+    stream_id: str
+    t0: int
+    rows: List[Tier1Row]
+    oor_mask: np.ndarray
+    latency_s: float  # oldest sample's enqueue → batch ready
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass(slots=True)
+class StreamMetrics:
+    """Running counters for one stream (mutable; copied by IngestService.metrics)."""
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    samples_in: int = 0
+    samples_out: int = 0
+    batches: int = 0
+    errors: int = 0
+    sink_errors: int = 0  # batches the sink raised on (counted, then dropped)
+    oor: int = 0
+    latency_sum_s: float = 0.0
+    latency_max_s: float = 0.0
+
+    @property
+    def latency_mean_s(self) -> float:
+        return self.latency_sum_s / self.batches if self.batches else 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "samples_in": self.samples_in,
+            "samples_out": self.samples_out,
+            "batches": self.batches,
+            "errors": self.errors,
+            "sink_errors": self.sink_errors,
+            "oor": self.oor,
+            "latency_mean_s": self.latency_mean_s,
+            "latency_max_s": self.latency_max_s,
+        }
+
+
+class _Stream:
+    __slots__ = ("stream_id", "contract", "kernel", "inbox", "outbox", "metrics", "task", "closed", "failure")
+
+    def __init__(self, stream_id: str, contract: FrozenContract, kernel: Tier1Stream, queue_size: int, out_size: int) -> None:
+        self.stream_id = stream_id
+        self.contract = contract
+        self.kernel = kernel
+        self.inbox: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.outbox: asyncio.Queue = asyncio.Queue(maxsize=out_size)
+        self.metrics = StreamMetrics()
+        self.task: Optional[asyncio.Task] = None
+        self.closed = False
+        self.failure: Optional[str] = None  # set if the consumer task died
+
+
+def _process(stream: _Stream, samples: np.ndarray) -> Tuple[int, List[Tier1Row], np.ndarray]:
+    # Runs in the executor; only this stream's consumer touches its kernel.
+    adm = admit_trace(samples, stream.contract)
+    t0 = stream.kernel.t
+    return t0, stream.kernel.update(adm.psi), adm.oor_mask
+
+
+def _drain(q: asyncio.Queue) -> None:
+    while True:
+        try:
+            q.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+
+
+class IngestService:
+    """
+    Bounded, micro-batching asyncio front end for many Tier-1 streams.
+
+    queue_size: max pending samples per stream before submit() waits
+    max_batch / max_delay: a batch is cut at max_batch samples, or max_delay
+        seconds after its first sample arrived, whichever comes first
+    executor: thread pool where admission + kernel run (None: the loop's
+        default executor). Each stream's Tier1Stream is updated in place, so
+        a process pool (which would update a pickled copy) is rejected.
+    sink: optional coroutine called with every IngestBatch; without one,
+        batches are buffered (out_queue_size per stream) for next_batch().
+        A sink that raises is counted in sink_errors and consumption goes on.
+
+    If a stream's consumer task fails anyway, the stream is shut down: its
+    queue is drained and submit() raises RuntimeError instead of waiting.
+    """
+
+    def __init__(
+        self,
+        *,
+        queue_size: int = 4096,
+        max_batch: int = 256,
+        max_delay: float = 0.005,
+        out_queue_size: int = 64,
+        executor: Optional[ThreadPoolExecutor] = None,
+        sink: Optional[BatchSink] = None,
+    ) -> None:
+        if queue_size < 1 or max_batch < 1 or out_queue_size < 1:
+            raise ValueError("queue_size, max_batch and out_queue_size must be >= 1")
+        if not (max_delay >= 0.0 and math.isfinite(max_delay)):
+            raise ValueError(f"max_delay must be a finite value >= 0; got {max_delay}")
+        if executor is not None and not isinstance(executor, ThreadPoolExecutor):
+            raise TypeError(f"executor must be a ThreadPoolExecutor; got {type(executor).__name__}")
+        self.queue_size = int(queue_size)
+        self.max_batch = int(max_batch)
+        self.max_delay = float(max_delay)
+        self.out_queue_size = int(out_queue_size)
+        self.executor = executor
+        self.sink = sink
+        self._streams: Dict[str, _Stream] = {}
+        self._running = False
+
+    async def __aenter__(self) -> "IngestService":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
+
+    async def start(self) -> None:
+        self._running = True
+        for s in self._streams.values():
+            self._spawn(s)
+
+    async def stop(self) -> None:
+        """Drain every stream (all submitted samples are processed), then stop."""
+        for sid, s in list(self._streams.items()):
+            if not s.closed:
+                await self.close_stream(sid)
+        self._running = False
+
+    def register(
+        self,
+        stream_id: str,
+        contract: FrozenContract,
+        drift_closure: Optional[DriftClosure] = None,
+        n: Optional[int] = None,
+    ) -> None:
+        """Bind a new stream to its contract (and optional Γ closure / width n)."""
+        if stream_id in self._streams:
+            raise ValueError(f"stream already registered: {stream_id!r}")
+        s = _Stream(stream_id, contract, Tier1Stream(contract, drift_closure, n=n), self.queue_size, self.out_queue_size)
+        self._streams[stream_id] = s
+        if self._running:
+            self._spawn(s)
+
+    def _spawn(self, s: _Stream) -> None:
+        if s.task is None:
+            s.task = asyncio.get_running_loop().create_task(self._consume(s), name=f"umcp-ingest-{s.stream_id}")
+
+    def _stream(self, stream_id: str) -> _Stream:
+        try:
+            return self._streams[stream_id]
+        except KeyError:
+            raise KeyError(f"unknown stream: {stream_id!r}") from None
+
+    def _check(self, s: _Stream, sample: np.ndarray) -> np.ndarray:
+        if s.failure is not None:
+            raise RuntimeError(f"stream {s.stream_id!r} consumer failed: {s.failure}")
+        if s.closed:
+            raise ValueError(f"stream is closed: {s.stream_id!r}")
+        x = np.asarray(sample, dtype=float)
+        n = s.kernel.n
+        if x.ndim != 1 or (n is not None and x.shape[0] != n):
+            raise ValueError(f"sample for {s.stream_id!r} must be shaped (n,) with n={n}; got shape={x.shape}")
+        return x
+
+    async def submit(self, stream_id: str, sample: np.ndarray) -> None:
+        """Enqueue one raw sample; waits (backpressure) while the stream is full."""
+        s = self._stream(stream_id)
+        x = self._check(s, sample)
+        await s.inbox.put((time.perf_counter(), x))
+        if s.failure is not None:
+            # Woken by the failed consumer draining the queue: the sample is
+            # lost. Drain again so any other blocked submitter wakes as well.
+            _drain(s.inbox)
+            raise RuntimeError(f"stream {s.stream_id!r} consumer failed: {s.failure}")
+        self._note_depth(s)
+
+    def try_submit(self, stream_id: str, sample: np.ndarray) -> bool:
+        """Non-blocking submit; False if the stream's queue is full."""
+        s = self._stream(stream_id)
+        x = self._check(s, sample)
+        try:
+            s.inbox.put_nowait((time.perf_counter(), x))
+        except asyncio.QueueFull:
+            return False
+        self._note_depth(s)
+        return True
+
+    def _note_depth(self, s: _Stream) -> None:
+        m = s.metrics
+        m.samples_in += 1
+        m.queue_depth = s.inbox.qsize()
+        m.max_queue_depth = max(m.max_queue_depth, m.queue_depth)
+
+    async def next_batch(self, stream_id: str) -> Optional[IngestBatch]:
+        """Next processed batch, or None once the stream is closed and drained."""
+        s = self._stream(stream_id)
+        if self.sink is not None:
+            raise RuntimeError("batches are delivered to the sink; next_batch() is unavailable")
+        item = await s.outbox.get()
+        return None if item is _CLOSE else item
+
+    async def close_stream(self, stream_id: str) -> None:
+        """
+        Process everything already submitted for the stream, then retire it.
+
+        Without a sink, batches still queued stay readable via next_batch()
+        (which then returns None); keep reading concurrently if more than
+        out_queue_size batches may be pending, or this waits for room.
+        """
+        s = self._stream(stream_id)
+        if s.closed:
+            return
+        s.closed = True
+        if s.task is None:
+            self._spawn(s)
+        if s.failure is None:
+            await s.inbox.put(_CLOSE)
+        await s.task
+
+    def metrics(self) -> Dict[str, Dict[str, float]]:
+        """Per-stream counters and latency, plus current queue depths."""
+        out = {}
+        for sid, s in self._streams.items():
+            s.metrics.queue_depth = s.inbox.qsize()
+            out[sid] = s.metrics.as_dict()
+        return out
+
+    async def _consume(self, s: _Stream) -> None:
+        try:
+            await self._consume_batches(s)
+        except Exception as exc:
+            self._fail(s, f"{type(exc).__name__}: {exc}")
+
+    def _fail(self, s: _Stream, reason: str) -> None:
+        # Shut the stream down so producers are not left waiting on a queue
+        # nobody drains: release blocked submitters, then end next_batch().
+        s.failure = reason
+        s.closed = True
+        s.metrics.errors += 1
+        _drain(s.inbox)
+        if self.sink is None:
+            while True:
+                try:
+                    s.outbox.put_nowait(_CLOSE)
+                    break
+                except asyncio.QueueFull:
+                    s.outbox.get_nowait()  # drop the oldest batch to make room
+
+    async def _consume_batches(self, s: _Stream) -> None:
+        loop = asyncio.get_running_loop()
+        closing = False
+        while not closing:
+            first = await s.inbox.get()
+            if first is _CLOSE:
+                break
+            items = [first]
+            deadline = loop.time() + self.max_delay
+            while len(items) < self.max_batch:
+                try:
+                    item = s.inbox.get_nowait()
+                except asyncio.QueueEmpty:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0.0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(s.inbox.get(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+                if item is _CLOSE:
+                    closing = True
+                    break
+                items.append(item)
+            await self._emit(s, items, loop)
+
+        if self.sink is None:
+            await s.outbox.put(_CLOSE)
+
+    async def _emit(self, s: _Stream, items: list, loop: asyncio.AbstractEventLoop) -> None:
+        m = s.metrics
+        m.queue_depth = s.inbox.qsize()
+        try:
+            samples = np.stack([x for _, x in items])
+            t0, rows, oor = await loop.run_in_executor(self.executor, _process, s, samples)
+            error = None
+        except Exception as exc:
+            t0, rows, oor, error = s.kernel.t, [], np.zeros((0, s.kernel.n or 0), dtype=bool), f"{type(exc).__name__}: {exc}"
+            m.errors += 1
+
+        latency = time.perf_counter() - items[0][0]
+        m.batches += 1
+        m.samples_out += len(rows)
+        m.oor += int(np.count_nonzero(oor))
+        m.latency_sum_s += latency
+        m.latency_max_s = max(m.latency_max_s, latency)
+
+        batch = IngestBatch(stream_id=s.stream_id, t0=t0, rows=rows, oor_mask=oor, latency_s=latency, error=error)
+        if self.sink is not None:
+            try:
+                await self.sink(batch)
+            except Exception:
+                m.sink_errors += 1
+        else:
+            await s.outbox.put(batch)
+
+
+async def handle_connection(service: IngestService, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """
+    Line protocol for socket producers: one JSON object per line,
+    {"stream": "<id>", "sample": [ψ_1, ..., ψ_n]}. Reading pauses while the
+    target stream is full, so TCP flow control pushes back on the sender.
+    Malformed lines are answered with an "error ..." line and skipped.
+    """
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            try:
+                msg = json.loads(line)
+                await service.submit(str(msg["stream"]), np.asarray(msg["sample"], dtype=float))
+            except (ValueError, KeyError, TypeError) as exc:
+                writer.write(f"error {type(exc).__name__}: {exc}\n".encode("utf-8"))
+                await writer.drain()
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+async def start_tcp_server(service: IngestService, host: str = "127.0.0.1", port: int = 0) -> asyncio.AbstractServer:
+    """Serve handle_connection on host:port (port 0 picks a free port)."""
+    return await asyncio.start_server(lambda r, w: handle_connection(service, r, w), host, port)
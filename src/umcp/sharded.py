@@ -0,0 +1,169 @@
+# src/umcp/sharded.py
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+import mmap
+import os
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from umcp import _shm
+from umcp.chunked import TraceSource, halo_rows, open_trace
+from umcp.closures import DriftClosure, GammaOmegaPower
+from umcp.contract import FrozenContract
+from umcp.frame import DEFAULT_BLOCK_ROWS, Tier1Frame, _fill_tier1_columns
+
+
+# Output rows per shard (one worker task each).
+DEFAULT_SHARD_ROWS = 1 << 18
+
+
+@dataclass(frozen=True, slots=True)
+class _Shard:
+    start: int  # first output row
+    stop: int
+    halo: int  # history rows read before start
+
+
+@dataclass(frozen=True, slots=True)
+class _Input:
+    """Where a worker finds the trace: a file region, or a shared-memory segment."""
+    T: int
+    n: int
+    dtype: str
+    path: Optional[str] = None
+    offset: int = 0  # bytes into path
+    shm: Optional[str] = None
+
+    def open(self, buf=None) -> np.ndarray:
+        if self.path is not None:
+            return np.memmap(self.path, dtype=self.dtype, mode="r", offset=self.offset, shape=(self.T, self.n))
+        return np.ndarray((self.T, self.n), dtype=self.dtype, buffer=buf)
+
+
+def _file_region(x: np.ndarray) -> Optional[Tuple[str, int]]:
+    """
+    (path, byte offset) of a C-contiguous array backed by a file mapping, e.g.
+    from np.memmap / np.load(mmap_mode="r") or a row slice of one; else None.
+    """
+    if not (isinstance(x, np.memmap) and x.flags.c_contiguous and getattr(x, "filename", None)):
+        return None
+    root = x
+    while isinstance(root.base, np.ndarray):
+        root = root.base
+    if not isinstance(root, np.memmap) or not isinstance(root.base, mmap.mmap):
+        return None
+    delta = x.__array_interface__["data"][0] - root.__array_interface__["data"][0]
+    return os.fspath(x.filename), int(root.offset) + int(delta)
+
+
+def _plan(T: int, contract: FrozenContract, shard_rows: int) -> List[_Shard]:
+    halo = halo_rows(contract)
+    return [_Shard(s0, min(s0 + shard_rows, T), min(halo, s0)) for s0 in range(0, T, shard_rows)]
+
+
+def _run_shard(
+    shard: _Shard,
+    x: np.ndarray,
+    block: np.ndarray,
+    contract: FrozenContract,
+    drift_closure: Optional[DriftClosure],
+    block_rows: int,
+) -> None:
+    """
+    Rows [start, stop) from the window x[start − halo : stop]. The halo covers
+    every row ω, C and τ_R can reach back to, so the window's own row-0/1
+    conventions and lookback limit never apply to an output row (unless the
+    shard starts at t = 0, where they are the trace's own). Only the window
+    is read (and converted to the contract precision) from x.
+    """
+    Gamma = drift_closure if drift_closure is not None else GammaOmegaPower(p=float(contract.p), epsilon=float(contract.epsilon))
+    window = np.asarray(x[shard.start - shard.halo:shard.stop], dtype=contract.float_dtype)
+    out = _shm.frame_view(block, shard.start, shard.stop)
+    _fill_tier1_columns(window, out, shard.halo, shard.halo + shard.stop - shard.start, contract, Gamma, block_rows)
+
+
+def _worker(
+    shard: _Shard,
+    src: _Input,
+    names: Tuple[str, ...],
+    contract: FrozenContract,
+    drift_closure: Optional[DriftClosure],
+    block_rows: int,
+) -> int:
+    with _shm.attached(names) as bufs:
+        x = src.open(bufs[-1] if src.shm is not None else None)
+        block = _shm.tier1_block(bufs[0], src.T)
+        _run_shard(shard, x, block, contract, drift_closure, block_rows)
+        del x, block
+    return shard.start
+
+
+def compute_tier1_sharded(
+    source: TraceSource,
+    contract: FrozenContract,
+    drift_closure: Optional[DriftClosure] = None,
+    *,
+    n: Optional[int] = None,
+    dtype: np.dtype = np.float64,
+    shard_rows: int = DEFAULT_SHARD_ROWS,
+    max_workers: Optional[int] = None,
+    mp_context=None,
+    block_rows: int = DEFAULT_BLOCK_ROWS,
+) -> Tier1Frame:
+    """
+    compute_tier1_frame for one long admitted trace, split along time over a
+    process pool.
+
+    source is opened like compute_tier1_chunked's (ndarray, np.memmap, *.npy
+    path, or raw binary path with n and dtype). The trace is cut into shards
+    of shard_rows output rows; each shard also reads halo_rows(contract) rows
+    before its start, so ω, C and τ_R see the same history as in a serial
+    pass. File-backed traces are never copied: every worker maps the file and
+    reads only its shard plus halo. An in-memory ndarray is copied once into
+    shared memory (pass a memmap to avoid that). Workers write their rows
+    straight into a shared (7, T) output block, so shards concatenate in
+    place. Row reductions do not depend on which rows share a block, so the
+    frame equals compute_tier1_frame exactly for any max_workers and
+    shard_rows. max_workers=1 runs in-process.
+    """
+    x = open_trace(source, n=n, dtype=dtype)
+    if x.ndim != 2:
+        raise ValueError(f"psi must be 2D array shaped (T,n); got shape={x.shape}")
+    if shard_rows < 1 or block_rows < 1:
+        raise ValueError(f"shard_rows and block_rows must be >= 1; got {shard_rows}, {block_rows}")
+
+    T, width = x.shape
+    shards = _plan(T, contract, int(shard_rows))
+
+    if max_workers == 1 or len(shards) <= 1:
+        block = np.empty((_shm.NCOLS, T))
+        for shard in shards:
+            _run_shard(shard, x, block, contract, drift_closure, block_rows)
+        return _shm.frame_view(block, 0, T)
+
+    region = _file_region(x)
+    in_bytes = 0 if region is not None else T * width * np.dtype(contract.float_dtype).itemsize
+    with _shm.segments(_shm.tier1_block_bytes(T), *([in_bytes] if region is None else [])) as segs:
+        if region is not None:
+            src = _Input(T, width, x.dtype.str, path=region[0], offset=region[1])
+        else:
+            src = _Input(T, width, np.dtype(contract.float_dtype).str, shm=segs[1].name)
+            packed = src.open(segs[1].buf)
+            packed[...] = x
+            del packed
+
+        names = tuple(seg.name for seg in segs)
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as pool:
+            futures = [
+                pool.submit(_worker, shard, src, names, contract, drift_closure, block_rows) for shard in shards
+            ]
+            for fut in futures:
+                fut.result()
+
+        block = _shm.tier1_block(segs[0].buf, T)
+        out = _shm.frame_copy(block, 0, T)
+        del block
+    return out
@@ -0,0 +1,189 @@
+# src/umcp/store.py
+"""
+Versioned columnar files for Tier-1 series and SS1m weld receipts.
+
+Layout (all little-endian):
+  [0:8)    magic  b"UMCPCOL\\0"
+  [8:10)   format version (uint16)
+  [10:12)  reserved (0)
+  [12:16)  header length H (uint32)
+  [16:16+H) UTF-8 JSON header: kind, rows, t0, contract (FrozenContract fields),
+           columns [{name, dtype, offset}]
+  then one contiguous array per column, each starting on a 64-byte boundary.
+
+Readers memory-map the file once and hand out column views into the mapping,
+so opening is O(header) and slicing touches only the pages it reads.
+"""
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, fields
+import json
+import os
+import struct
+from typing import Any, Dict, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from umcp.contract import FrozenContract
+from umcp.frame import TIER1_COLUMNS, Tier1Frame
+from umcp.kernel import Tier1Row
+from umcp.weld import WELD_COLUMNS, SS1mWeld, WeldTable
+
+
+PathLike = Union[str, os.PathLike]
+
+MAGIC = b"UMCPCOL\0"
+FORMAT_VERSION = 1
+_PREFIX = struct.Struct("<8sHHI")
+_ALIGN = 64
+_WRITE_CHUNK = 1 << 20
+
+_COLUMN_DTYPES: Dict[str, Dict[str, str]] = {
+    "tier1": {name: "<f8" for name in TIER1_COLUMNS},
+    "weld": {**{name: "<f8" for name in WELD_COLUMNS}, "passed": "|b1"},
+}
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class StoredSeries:
+    """A Tier-1 series file opened for reading; frame columns are mapped views."""
+    contract: FrozenContract
+    frame: Tier1Frame
+    version: int
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def between(self, t_start: int, t_stop: int) -> Tier1Frame:
+        """Rows with t_start <= t < t_stop (views, no copy)."""
+        t0 = self.frame.t0
+        return self.frame.slice(max(t_start - t0, 0), max(t_stop - t0, 0))
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class StoredWelds:
+    """A weld receipt file opened for reading; table columns are mapped views."""
+    contract: FrozenContract
+    table: WeldTable
+    version: int
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+
+def contract_to_dict(contract: FrozenContract) -> Dict[str, Any]:
+    return asdict(contract)
+
+
+def contract_from_dict(d: Dict[str, Any]) -> FrozenContract:
+    """Inverse of contract_to_dict; unknown keys (newer writers) are rejected."""
+    known = {f.name for f in fields(FrozenContract)}
+    extra = set(d) - known
+    if extra:
+        raise ValueError(f"unknown FrozenContract fields in header: {sorted(extra)}")
+    return FrozenContract(**d)
+
+
+def _align(n: int) -> int:
+    return (n + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def _write(path: PathLike, kind: str, contract: FrozenContract, cols: Dict[str, np.ndarray], t0: int = 0) -> None:
+    dtypes = _COLUMN_DTYPES[kind]
+    rows = {int(c.shape[0]) for c in cols.values()}
+    if len(rows) != 1:
+        raise ValueError(f"columns must share one length; got {sorted(rows)}")
+    T = rows.pop()
+
+    # Offsets depend on the header size, which depends on the offsets' digits;
+    # reserve the header with placeholder offsets first, then fix them up.
+    layout = [{"name": name, "dtype": dtypes[name], "offset": 0} for name in dtypes]
+    header: Dict[str, Any] = {
+        "kind": kind,
+        "rows": T,
+        "t0": int(t0),
+        "contract": contract_to_dict(contract),
+        "columns": layout,
+    }
+    for _ in range(3):
+        blob = json.dumps(header, sort_keys=True).encode("utf-8")
+        pos = _align(_PREFIX.size + len(blob))
+        for col in layout:
+            col["offset"] = pos
+            pos = _align(pos + T * np.dtype(col["dtype"]).itemsize)
+    blob = json.dumps(header, sort_keys=True).encode("utf-8")
+    if _align(_PREFIX.size + len(blob)) > layout[0]["offset"]:  # pragma: no cover - offsets stabilize in 2 passes
+        raise RuntimeError("columnar header layout did not converge")
+
+    with open(path, "wb") as fh:
+        fh.write(_PREFIX.pack(MAGIC, FORMAT_VERSION, 0, len(blob)))
+        fh.write(blob)
+        for col in layout:
+            fh.write(b"\0" * (col["offset"] - fh.tell()))
+            src, dt = cols[col["name"]], np.dtype(col["dtype"])
+            # Chunked so memory-mapped inputs are streamed rather than loaded.
+            for i in range(0, T, _WRITE_CHUNK):
+                arr = np.ascontiguousarray(src[i:i + _WRITE_CHUNK], dtype=dt)
+                fh.write(memoryview(arr).cast("B"))
+
+
+def _read(path: PathLike, kind: str) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    with open(path, "rb") as fh:
+        prefix = fh.read(_PREFIX.size)
+        if len(prefix) < _PREFIX.size:
+            raise ValueError(f"not a UMCP columnar file (truncated): {os.fspath(path)}")
+        magic, version, _, hlen = _PREFIX.unpack(prefix)
+        if magic != MAGIC:
+            raise ValueError(f"not a UMCP columnar file (bad magic): {os.fspath(path)}")
+        if version > FORMAT_VERSION:
+            raise ValueError(f"unsupported columnar format version {version} (reader supports <= {FORMAT_VERSION})")
+        header = json.loads(fh.read(hlen).decode("utf-8"))
+    if header.get("kind") != kind:
+        raise ValueError(f"expected a {kind!r} file; got {header.get('kind')!r}")
+    header["version"] = version
+
+    T = int(header["rows"])
+    size = os.path.getsize(path)
+    buf = np.memmap(path, dtype=np.uint8, mode="r") if size > 0 else np.empty(0, dtype=np.uint8)
+    cols: Dict[str, np.ndarray] = {}
+    for col in header["columns"]:
+        dt = np.dtype(col["dtype"])
+        off = int(col["offset"])
+        end = off + T * dt.itemsize
+        if end > size:
+            raise ValueError(f"column {col['name']!r} runs past end of file ({end} > {size})")
+        cols[col["name"]] = buf[off:end].view(dt)
+    missing = set(_COLUMN_DTYPES[kind]) - set(cols)
+    if missing:
+        raise ValueError(f"file is missing columns: {sorted(missing)}")
+    return header, cols
+
+
+def write_tier1(path: PathLike, series: Union[Tier1Frame, Sequence[Tier1Row]], contract: FrozenContract) -> None:
+    """Write a Tier-1 series (frame or rows from compute_tier1_series)."""
+    frame = series if isinstance(series, Tier1Frame) else Tier1Frame.from_rows(list(series))
+    _write(path, "tier1", contract, {name: frame.column(name) for name in TIER1_COLUMNS}, t0=frame.t0)
+
+
+def read_tier1(path: PathLike) -> StoredSeries:
+    """Open a Tier-1 series file; columns are read-only views into one mapping."""
+    header, cols = _read(path, "tier1")
+    frame = Tier1Frame(**{name: cols[name] for name in TIER1_COLUMNS}, t0=int(header["t0"]))
+    return StoredSeries(contract=contract_from_dict(header["contract"]), frame=frame, version=header["version"])
+
+
+def write_welds(path: PathLike, welds: Union[WeldTable, Sequence[SS1mWeld]], contract: FrozenContract) -> None:
+    """Write weld receipts (a WeldTable or a list of SS1mWeld)."""
+    if isinstance(welds, WeldTable):
+        cols = {name: getattr(welds, name) for name in WELD_COLUMNS}
+    else:
+        items: List[SS1mWeld] = list(welds)
+        cols = {name: np.array([getattr(w, name) for w in items], dtype=_COLUMN_DTYPES["weld"][name]) for name in WELD_COLUMNS}
+    _write(path, "weld", contract, cols)
+
+
+def read_welds(path: PathLike) -> StoredWelds:
+    """Open a weld receipt file; columns are read-only views into one mapping."""
+    header, cols = _read(path, "weld")
+    table = WeldTable(**{name: cols[name] for name in WELD_COLUMNS})
+    return StoredWelds(contract=contract_from_dict(header["contract"]), table=table, version=header["version"])
@@ -0,0 +1,147 @@
+# src/umcp/stream.py
+from __future__ import annotations
+
+from typing import List, Optional
+
+import numpy as np
+
+from umcp.closures import DriftClosure, GammaOmegaPower
+from umcp.contract import FrozenContract
+from umcp.kernel import Tier1Row, _lp_mean_norm, _tier1_row
+from umcp.tau import _projection_radius, _sign_projections
+
+
+class Tier1Stream:
+    """
+    Incremental Tier-1 kernel for sample-at-a-time ingestion.
+
+    Holds a ring buffer of the last max(tau_lookback, 2) states (plus their
+    τ_R pruning projections) and emits one Tier1Row per pushed ψ(t). Per-sample
+    work and memory are bounded by tau_lookback·n, and rows are bit-for-bit
+    identical to compute_tier1_series over the concatenated samples.
+    """
+
+    __slots__ = (
+        "contract",
+        "drift_closure",
+        "_n",
+        "_cap",
+        "_ring",
+        "_proj",
+        "_signs",
+        "_scale",
+        "_t",
+        "_gamma",
+    )
+
+    def __init__(
+        self,
+        contract: FrozenContract,
+        drift_closure: Optional[DriftClosure] = None,
+        n: Optional[int] = None,
+    ) -> None:
+        self.contract = contract
+        self.drift_closure = drift_closure
+        self._gamma = (
+            drift_closure
+            if drift_closure is not None
+            else GammaOmegaPower(p=float(contract.p), epsilon=float(contract.epsilon))
+        )
+        self._cap = max(int(contract.tau_lookback), 2)
+        self._n: Optional[int] = None
+        self._ring = np.empty((0, 0))
+        self._proj = np.empty((0, 0))
+        self._signs = np.empty((0, 0))
+        self._scale = 0.0
+        self._t = 0
+        if n is not None:
+            self._allocate(int(n))
+
+    @property
+    def t(self) -> int:
+        """Time index the next pushed sample will get."""
+        return self._t
+
+    @property
+    def n(self) -> Optional[int]:
+        return self._n
+
+    def _allocate(self, n: int) -> None:
+        self._n = n
+        self._ring = np.empty((self._cap, n), dtype=float)
+        self._signs = _sign_projections(n) if n > 0 else np.empty((0, 0))
+        self._proj = np.empty((self._cap, self._signs.shape[1] if n > 0 else 0), dtype=float)
+
+    def _state(self, lag: int) -> np.ndarray:
+        # State pushed `lag` samples before the next one.
+        return self._ring[(self._t - lag) % self._cap]
+
+    def _return_lag(self, x_t: np.ndarray, proj_t: np.ndarray) -> float:
+        contract = self.contract
+        lookback = int(contract.tau_lookback)
+        max_lag = min(lookback, self._t)
+        if max_lag < 1 or self._n == 0:
+            return float("inf")
+
+        tol_id = float(contract.tol_id)
+        p = float(contract.p)
+        eps = float(contract.epsilon)
+
+        lags = np.arange(1, max_lag + 1)
+        radius = _projection_radius(self._n, p, eps, tol_id, self._scale)
+        if radius is not None:
+            if not radius >= 0.0:
+                return float("inf")
+            slots = (self._t - lags) % self._cap
+            near = np.all(np.abs(self._proj[slots] - proj_t) <= radius, axis=1)
+            lags = lags[near]
+
+        for L in lags:
+            if _lp_mean_norm(x_t - self._state(int(L)), p=p, eps=eps) <= tol_id:
+                return float(L)
+        return float("inf")
+
+    def push(self, sample: np.ndarray) -> Tier1Row:
+        """Ingest one ψ(t) vector and return its Tier1Row."""
+        x_t = np.array(sample, dtype=float)
+        if x_t.ndim != 1:
+            raise ValueError(f"sample must be 1D shaped (n,); got shape={x_t.shape}")
+        if self._n is None:
+            self._allocate(x_t.shape[0])
+        elif x_t.shape[0] != self._n:
+            raise ValueError(f"sample has n={x_t.shape[0]}; stream was started with n={self._n}")
+
+        contract = self.contract
+        if x_t.size:
+            self._scale = max(self._scale, float(np.max(np.abs(x_t))))
+        proj_t = x_t @ self._signs if self._n else self._proj[:0]
+
+        t = self._t
+        row = _tier1_row(
+            t,
+            x_t,
+            self._state(1) if t >= 1 else None,
+            self._state(2) if t >= 2 else None,
+            tau_R=self._return_lag(x_t, proj_t),
+            Gamma=self._gamma,
+            p=float(contract.p),
+            eps=float(contract.epsilon),
+            alpha=float(contract.alpha),
+            lam=float(contract.lam),
+        )
+
+        slot = t % self._cap
+        self._ring[slot] = x_t
+        if self._n:
+            self._proj[slot] = proj_t
+        self._t = t + 1
+        return row
+
+    def update(self, samples: np.ndarray) -> List[Tier1Row]:
+        """Ingest one ψ(t) vector (n,) or a batch (k, n); return the new rows."""
+        x = np.asarray(samples, dtype=float)
+        if x.ndim == 1:
+            return [self.push(x)]
+        if x.ndim != 2:
+            raise ValueError(f"samples must be shaped (n,) or (k,n); got shape={x.shape}")
+        return [self.push(x_t) for x_t in x]
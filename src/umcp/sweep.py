@@ -0,0 +1,140 @@
+# src/umcp/sweep.py
+from __future__ import annotations
+
+from dataclasses import dataclass, fields, replace
+import itertools
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from umcp.closures import DriftClosure, GammaOmegaPower, evaluate_closure
+from umcp.contract import FrozenContract
+from umcp.frame import DEFAULT_BLOCK_ROWS, Tier1Frame, compute_tier1_frame
+from umcp.regime.classify import REGIME_NAMES, classify_regimes
+from umcp.tau import return_lags
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class SweepResult:
+    """
+    Tier-1 outputs of one trace under K contracts, stacked as (K, T) arrays.
+
+    kappa / IC / tau_R / regime_codes row k belongs to contracts[k]; ω, F, S
+    and C are shared by every contract with the same (p, ε, precision) and are
+    reached through frame(k).
+    """
+    contracts: Tuple[FrozenContract, ...]
+    kappa: np.ndarray
+    IC: np.ndarray
+    tau_R: np.ndarray
+    regime_codes: np.ndarray  # uint8 into REGIME_NAMES
+    group: np.ndarray  # contract k uses shared[group[k]]
+    shared: Tuple[Tier1Frame, ...]
+
+    def __len__(self) -> int:
+        return len(self.contracts)
+
+    def frame(self, k: int) -> Tier1Frame:
+        """The full Tier1Frame for contracts[k] (shared columns are views)."""
+        base = self.shared[int(self.group[k])]
+        return Tier1Frame(
+            omega=base.omega,
+            F=base.F,
+            S=base.S,
+            C=base.C,
+            tau_R=self.tau_R[k],
+            IC=self.IC[k],
+            kappa=self.kappa[k],
+            t0=base.t0,
+        )
+
+    def regimes(self, k: int) -> List[str]:
+        return [REGIME_NAMES[c] for c in self.regime_codes[k]]
+
+
+def contract_grid(base: FrozenContract, **axes: Sequence) -> List[FrozenContract]:
+    """
+    Cartesian product of field values over a base contract, e.g.
+    contract_grid(FrozenContract(), alpha=[0.5, 1.0], lam=[0.1, 0.2]).
+    The last axis varies fastest.
+    """
+    known = {f.name for f in fields(FrozenContract)}
+    unknown = set(axes) - known
+    if unknown:
+        raise ValueError(f"unknown FrozenContract fields: {sorted(unknown)}")
+    names = list(axes)
+    return [replace(base, **dict(zip(names, values))) for values in itertools.product(*(axes[k] for k in names))]
+
+
+def sweep_contracts(
+    psi: np.ndarray,
+    contracts: Sequence[FrozenContract],
+    drift_closure: Optional[DriftClosure] = None,
+    *,
+    block_rows: int = DEFAULT_BLOCK_ROWS,
+) -> SweepResult:
+    """
+    compute_tier1_frame + classify_regimes for every contract, sharing work.
+
+    Contracts are grouped by (p, ε, precision): each group runs the frame
+    kernel once for ω, F, S, C and Γ(ω). Within a group, τ_R is computed once
+    per distinct (tol_id, tau_lookback). Per contract only κ = −((Γ + α·C) +
+    λ·S), IC = exp(κ) and the regime gates remain. The operation order is
+    the frame engine's, so frame(k) equals compute_tier1_frame(psi,
+    contracts[k]) exactly. drift_closure, if given, applies to every contract.
+    """
+    contracts = tuple(contracts)
+    if not contracts:
+        raise ValueError("at least one contract is required")
+
+    x = np.asarray(psi)
+    if x.ndim != 2:
+        raise ValueError(f"psi must be 2D array shaped (T,n); got shape={x.shape}")
+    T = x.shape[0]
+    K = len(contracts)
+
+    groups: Dict[Tuple[float, float, str], int] = {}
+    group = np.empty(K, dtype=np.int64)
+    for k, c in enumerate(contracts):
+        group[k] = groups.setdefault((float(c.p), float(c.epsilon), c.precision), len(groups))
+
+    kappa = np.empty((K, T))
+    IC = np.empty((K, T))
+    tau = np.empty((K, T))
+    codes = np.empty((K, T), dtype=np.uint8)
+    shared: List[Tier1Frame] = []
+
+    for g, (p, eps, _) in enumerate(groups):
+        members = np.flatnonzero(group == g)
+        rep = contracts[int(members[0])]
+        base = compute_tier1_frame(x, rep, drift_closure, block_rows=block_rows)
+        shared.append(base)
+        Gamma = drift_closure if drift_closure is not None else GammaOmegaPower(p=p, epsilon=eps)
+        D_omega = evaluate_closure(Gamma, base.omega)
+
+        taus = {(float(rep.tol_id), int(rep.tau_lookback)): base.tau_R}
+        for k in members:
+            c = contracts[int(k)]
+            key = (float(c.tol_id), int(c.tau_lookback))
+            if key not in taus:
+                taus[key] = return_lags(np.asarray(x, dtype=c.float_dtype), c)
+            tau[k] = taus[key]
+
+            # κ = -((Γ(ω) + α·C) + λ·S), IC = exp(κ), as in _fill_tier1_columns.
+            row = kappa[k]
+            np.copyto(row, D_omega)
+            row += float(c.alpha) * base.C
+            row += float(c.lam) * base.S
+            np.negative(row, out=row)
+            np.exp(row, out=IC[k])
+            codes[k] = classify_regimes(base, c)
+
+    return SweepResult(
+        contracts=contracts,
+        kappa=kappa,
+        IC=IC,
+        tau_R=tau,
+        regime_codes=codes,
+        group=group,
+        shared=tuple(shared),
+    )
@@ -0,0 +1,55 @@
+# src/umcp/synthetic.py
+from __future__ import annotations
+
+from typing import Literal
+
+import numpy as np
+
+
+SyntheticRegime = Literal["stable", "drifting", "periodic", "collapsing"]
+SYNTHETIC_REGIMES = ("stable", "drifting", "periodic", "collapsing")
+
+
+def synthetic_trace(
+    regime: SyntheticRegime,
+    T: int,
+    n: int,
+    *,
+    seed: int = 0,
+    period: int = 17,
+    oor_rate: float = 0.0,
+) -> np.ndarray:
+    """
+    Deterministic raw trace (T,n) for tests and benchmarks.
+
+    - stable:     parked near the 0-face with tiny jitter (Stable under the
+                  default gates: low ω, S and C)
+    - drifting:   bounded random walk around 0.5 (mostly Watch)
+    - periodic:   a fixed cycle of `period` states repeated exactly, so τ_R
+                  finds returns once tol_id > ε
+    - collapsing: calm start, then jitter grows until ω crosses the
+                  Collapse gate
+
+    oor_rate injects that fraction of entries outside [0,1] (for admission).
+    The same (regime, T, n, seed, period, oor_rate) always gives the same array.
+    """
+    rng = np.random.default_rng(seed)
+    if regime == "stable":
+        x = 1e-3 + 1e-5 * rng.standard_normal((T, n))
+    elif regime == "drifting":
+        x = 0.5 + np.cumsum(0.01 * rng.standard_normal((T, n)), axis=0)
+        x = 0.5 + 0.45 * np.tanh((x - 0.5) / 0.45)
+    elif regime == "periodic":
+        cycle = rng.random((max(int(period), 1), n))
+        x = cycle[np.arange(T) % cycle.shape[0]]
+    elif regime == "collapsing":
+        ramp = np.linspace(0.0, 1.0, T)[:, None] ** 2
+        x = 0.5 + 0.6 * ramp * rng.standard_normal((T, n))
+    else:
+        raise ValueError(f"unknown synthetic regime: {regime!r}")
+
+    x = np.clip(x, 0.0, 1.0)
+    if oor_rate > 0.0:
+        hit = rng.random((T, n)) < oor_rate
+        x[hit] = np.where(rng.random(int(hit.sum())) < 0.5, -0.1, 1.1)
+    return np.ascontiguousarray(x, dtype=float)
@@ -0,0 +1,194 @@
+# src/umcp/tau.py
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+from typing import Optional
+
+import numpy as np
+
+from umcp.contract import FrozenContract
+from umcp.instrument import _ACTIVE, Collector
+from umcp.kernel import _lp_mean_norm, _return_lag
+
+
+# Projections used to prune lags: column 0 is the coordinate mean, the rest are
+# fixed ±1 sign patterns (seeded, so pruning is reproducible across runs).
+_N_PROJECTIONS = 4
+_PROJECTION_SEED = 0x554D4350
+
+
+def _sign_projections(n: int) -> np.ndarray:
+    rng = np.random.default_rng(_PROJECTION_SEED)
+    signs = rng.choice(np.array([-1.0, 1.0]), size=(n, _N_PROJECTIONS))
+    signs[:, 0] = 1.0
+    return signs / float(n)
+
+
+def _projection_radius(n: int, p: float, eps: float, tol_id: float, scale: float) -> Optional[float]:
+    """
+    Radius r such that ||Δ||_p_mean <= tol_id implies |mean(s·Δ)| <= r for every
+    ±1 sign vector s. None if no such bound is available (p <= 0 or non-finite).
+
+    p >= 1: power-mean inequality, M_p(|Δ|+ε) >= mean|Δ| + ε, so r = tol_id − ε.
+    p <  1: every term obeys (|Δ_i|+ε)^p <= n·tol_id^p, so r = n^(1/p)·tol_id − ε.
+
+    The radius is padded for rounding in the norm and in the projections, so a
+    lag whose *computed* norm passes is never pruned.
+    """
+    if not (math.isfinite(p) and p > 0.0):
+        return None
+    u = 4.0 * (n + 2) * np.finfo(float).eps
+    tol = tol_id * (1.0 + u)
+    r = (tol - eps) if p >= 1.0 else (n ** (1.0 / p)) * tol - eps
+    return r + 2.0 * u * scale
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class LagProjections:
+    """
+    Pruning projections for rows [row0, row0 + len(P)) of one trace, computed
+    once and reused by every return_lags call over that trace (e.g. one per
+    block of a frame) instead of re-projecting each call's lookback halo.
+
+    P: (rows, _N_PROJECTIONS) sign projections; row_max: max |ψ| per row.
+    """
+    row0: int
+    P: np.ndarray
+    row_max: np.ndarray
+
+
+def lag_projections(psi: np.ndarray, start: int = 0, stop: Optional[int] = None) -> LagProjections:
+    """Projections for rows [start, stop) of psi, for return_lags(projections=...)."""
+    x = np.asarray(psi)
+    stop = x.shape[0] if stop is None else int(stop)
+    xs = x[start:stop]
+    P = xs @ _sign_projections(x.shape[1])
+    row_max = np.max(np.abs(xs), axis=1) if xs.size else np.zeros(xs.shape[0])
+    return LagProjections(row0=int(start), P=P, row_max=row_max)
+
+
+def return_lags(
+    psi: np.ndarray,
+    contract: FrozenContract,
+    *,
+    start: int = 0,
+    stop: Optional[int] = None,
+    projections: Optional[LagProjections] = None,
+) -> np.ndarray:
+    """
+    τ_R(t) for t in [start, stop): same smallest lag as kernel._return_lag.
+
+    A lag L can only pass if every sign projection of ψ[t] − ψ[t−L] lies within
+    the radius from _projection_radius. States are sorted on the mean projection,
+    so each t only visits lags inside that interval (or, when the interval is
+    wider than the lookback window, the window itself). Surviving lags are
+    checked in increasing order with the exact scalar norm, so the returned lag
+    is bit-for-bit the one the brute-force scan finds; the cost scales with the
+    number of near-returns rather than with tau_lookback.
+
+    projections (from lag_projections) must cover rows [start − tau_lookback,
+    stop); they are sliced instead of recomputed. Pruning is conservative, so
+    the lags are the same with or without them.
+
+    Under an active instrument.collect(), records tau.rows, tau.lag_comparisons
+    (exact norm evaluations) and tau.inf_rec.
+    """
+    x = np.asarray(psi)
+    if x.dtype not in (np.float32, np.float64):
+        x = x.astype(float)
+    if x.ndim != 2:
+        raise ValueError(f"psi must be 2D array shaped (T,n); got shape={x.shape}")
+
+    T, n = x.shape
+    stop = T if stop is None else int(stop)
+    start = int(start)
+    if not 0 <= start <= stop <= T:
+        raise ValueError(f"invalid row range [{start}, {stop}) for T={T}")
+
+    tol_id = float(contract.tol_id)
+    lookback = int(contract.tau_lookback)
+    p = float(contract.p)
+    eps = float(contract.epsilon)
+
+    collector = _ACTIVE.get()
+    tau = np.full(stop - start, np.inf)
+    if stop == start or lookback < 1 or n == 0:
+        if collector is not None:
+            _record(collector, tau, 0)
+        return tau
+
+    base = max(0, start - lookback)
+    xs = x[base:stop]
+    if projections is not None:
+        lo, hi = base - projections.row0, stop - projections.row0
+        if lo < 0 or hi > projections.P.shape[0]:
+            raise ValueError(
+                f"projections cover rows [{projections.row0}, {projections.row0 + projections.P.shape[0]}); "
+                f"need [{base}, {stop})"
+            )
+        P = projections.P[lo:hi]
+        scale = float(np.max(projections.row_max[lo:hi]))
+    else:
+        P = None
+        scale = float(np.max(np.abs(xs)))
+    radius = _projection_radius(n, p, eps, tol_id, scale)
+
+    if radius is None:
+        compared = 0
+        for t in range(start, stop):
+            lag = _return_lag(x, t=t, tol_id=tol_id, lookback=lookback, p=p, eps=eps)
+            tau[t - start] = lag
+            compared += int(lag) if math.isfinite(lag) else min(lookback, t)
+        if collector is not None:
+            _record(collector, tau, compared)
+        return tau
+    if not radius >= 0.0:
+        # No pair of states can be within tol_id (e.g. ε > tol_id): all ∞_rec.
+        if collector is not None:
+            _record(collector, tau, 0)
+        return tau
+
+    if P is None:
+        P = xs @ _sign_projections(n)
+    key = np.ascontiguousarray(P[:, 0])
+    order = np.argsort(key, kind="stable")
+    sorted_key = key[order]
+
+    q = key[start - base:]
+    lo = np.searchsorted(sorted_key, q - radius, side="left")
+    hi = np.searchsorted(sorted_key, q + radius, side="right")
+
+    compared = 0
+    # Each state matches itself, so only intervals holding >1 state can return.
+    for i in np.flatnonzero(hi - lo > 1):
+        j = start - base + int(i)
+        w0 = max(j - lookback, 0)
+        if w0 >= j:
+            continue
+        if hi[i] - lo[i] <= j - w0:
+            cand = order[lo[i]:hi[i]]
+            cand = cand[(cand >= w0) & (cand < j)]
+        else:
+            cand = w0 + np.flatnonzero(np.abs(key[w0:j] - key[j]) <= radius)
+        if cand.size == 0:
+            continue
+        cand = cand[np.all(np.abs(P[cand, 1:] - P[j, 1:]) <= radius, axis=1)]
+
+        # Norms are taken in float64 even for float32-stored traces.
+        x_t = xs[j].astype(float, copy=False)
+        for s in np.sort(cand)[::-1]:
+            compared += 1
+            if _lp_mean_norm(x_t - xs[s], p=p, eps=eps) <= tol_id:
+                tau[i] = float(j - s)
+                break
+
+    if collector is not None:
+        _record(collector, tau, compared)
+    return tau
+
+
+def _record(collector: Collector, tau: np.ndarray, compared: int) -> None:
+    collector.incr("tau.rows", tau.shape[0])
+    collector.incr("tau.lag_comparisons", compared)
+    collector.incr("tau.inf_rec", int(np.count_nonzero(np.isinf(tau))))
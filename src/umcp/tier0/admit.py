@@ -2,10 +2,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import time
 from typing import Optional, Tuple
 import numpy as np
 
 from umcp.contract import FrozenContract
+from umcp.instrument import _ACTIVE
 
 
 @dataclass(frozen=True, slots=True)
@@ -20,6 +22,13 @@ class AdmittedTrace:
     oor_mask: np.ndarray
 
 
+def _check_policies(contract: FrozenContract) -> None:
+    if contract.face != "pre_clip":
+        raise ValueError(f"unsupported face policy: {contract.face}")
+    if contract.oor != "clip_and_flag":
+        raise ValueError(f"unsupported OOR policy: {contract.oor}")
+
+
 def admit_trace(raw: np.ndarray, contract: FrozenContract) -> AdmittedTrace:
     """
     Admit a raw trace to Ψ(t) ∈ [a,b]^n under the frozen contract.
@@ -27,18 +36,27 @@ def admit_trace(raw: np.ndarray, contract: FrozenContract) -> AdmittedTrace:
     face=pre_clip + oor=clip_and_flag:
       - clip raw to [a,b]
       - flag out-of-range entries in oor_mask
+
+    psi is stored in contract.precision (float64 by default).
     """
-    x = np.asarray(raw, dtype=float)
+    collector = _ACTIVE.get()
+    t0 = time.perf_counter() if collector is not None else 0.0
+
+    x = np.asarray(raw)
+    if x.dtype.kind != "f":
+        x = x.astype(float)
     if x.ndim != 2:
         raise ValueError(f"raw trace must be 2D array shaped (T,n); got shape={x.shape}")
 
     a, b = contract.a, contract.b
+    # Flag on the raw values, before any down-cast to the contract precision.
     oor_mask = (x < a) | (x > b)
 
-    if contract.face != "pre_clip":
-        raise ValueError(f"unsupported face policy: {contract.face}")
-    if contract.oor != "clip_and_flag":
-        raise ValueError(f"unsupported OOR policy: {contract.oor}")
+    _check_policies(contract)
 
-    psi = np.clip(x, a, b)
+    psi = np.clip(x.astype(contract.float_dtype, copy=False), a, b)
+    if collector is not None:
+        collector.add_time("admit", time.perf_counter() - t0)
+        collector.incr("admit.rows", x.shape[0])
+        collector.incr("admit.oor", int(np.count_nonzero(oor_mask)))
     return AdmittedTrace(psi=psi, oor_mask=oor_mask)
@@ -3,10 +3,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import math
-from typing import Optional
+import time
+from typing import List, Optional
 
-from umcp.closures import DriftClosure, GammaOmegaPower
+import numpy as np
+
+from umcp.closures import DriftClosure, GammaOmegaPower, evaluate_closure
 from umcp.contract import FrozenContract
+from umcp.frame import TIER1_COLUMNS, Tier1Frame
+from umcp.instrument import _ACTIVE
 from umcp.kernel import Tier1Row
 
 
@@ -55,6 +60,27 @@ def evaluate_weld(
       - R is set to 1 if τ_R is finite, else 0 (typed censoring idea).
       - τ_R is taken from the POST row (the “new” regime being welded into).
     """
+    collector = _ACTIVE.get()
+    t0 = time.perf_counter() if collector is not None else 0.0
+
+    w = _weld(pre, post, contract, drift_closure)
+
+    if collector is not None:
+        collector.add_time("weld", time.perf_counter() - t0)
+        collector.incr("weld.evaluated")
+        collector.incr("weld.passed", int(w.passed))
+        collector.incr("weld.inf_rec", int(w.R == 0.0))
+
+    return w
+
+
+def _weld(
+    pre: Tier1Row,
+    post: Tier1Row,
+    contract: FrozenContract,
+    drift_closure: Optional[DriftClosure],
+) -> SS1mWeld:
+    """Scalar weld law behind evaluate_weld; records nothing."""
     eps = float(contract.epsilon)
     p = float(contract.p)
     alpha = float(contract.alpha)
@@ -102,3 +128,160 @@ def evaluate_weld(
         R=float(R),
         passed=bool(passed),
     )
+
+
+# Column order mirrors the SS1mWeld field order.
+WELD_COLUMNS = (
+    "kappa0",
+    "kappa1",
+    "IC0",
+    "IC1",
+    "delta_kappa_ledger",
+    "ir",
+    "delta_kappa_budget",
+    "seam_residual",
+    "tau_R",
+    "R",
+    "passed",
+)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class WeldTable:
+    """
+    Columnar SS1m receipts: one array per SS1mWeld field (passed is a bool mask).
+
+    Row i is the receipt for the i-th PRE→POST pair handed to evaluate_welds.
+    """
+    kappa0: np.ndarray
+    kappa1: np.ndarray
+    IC0: np.ndarray
+    IC1: np.ndarray
+    delta_kappa_ledger: np.ndarray
+    ir: np.ndarray
+    delta_kappa_budget: np.ndarray
+    seam_residual: np.ndarray
+    tau_R: np.ndarray
+    R: np.ndarray
+    passed: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.passed.shape[0])
+
+    def receipt(self, i: int) -> SS1mWeld:
+        vals = {name: getattr(self, name)[i] for name in WELD_COLUMNS}
+        return SS1mWeld(**{k: (bool(v) if k == "passed" else float(v)) for k, v in vals.items()})
+
+    def receipts(self) -> List[SS1mWeld]:
+        return [self.receipt(i) for i in range(len(self))]
+
+
+# Rounding headroom (in ulps of the magnitudes involved) between NumPy's
+# log/exp/power and libm. Pairs this close to a tolerance are re-decided by
+# the scalar evaluate_weld so PASS never depends on the code path.
+_BORDERLINE_ULPS = 64.0
+
+
+def evaluate_welds(
+    pre: Tier1Frame,
+    post: Tier1Frame,
+    contract: FrozenContract,
+    drift_closure: Optional[DriftClosure] = None,
+    *,
+    pre_index: Optional[np.ndarray] = None,
+    post_index: Optional[np.ndarray] = None,
+) -> WeldTable:
+    """
+    Evaluate many PRE→POST welds at once; same weld law as evaluate_weld.
+
+    Pairs are either (pre.row(pre_index[k]), post.row(post_index[k])) or, with
+    no index arrays, row k of pre against row k of post. Typical use welds a
+    series against itself: evaluate_welds(f, f, contract, pre_index=i0,
+    post_index=i1).
+
+    Values agree with evaluate_weld to rounding; the PASS mask is identical.
+    Under instrument.collect() the weld.* counters count every pair once.
+    """
+    collector = _ACTIVE.get()
+    t0 = time.perf_counter() if collector is not None else 0.0
+
+    eps = float(contract.epsilon)
+    p = float(contract.p)
+    alpha = float(contract.alpha)
+    tol_seam = float(contract.tol_seam)
+    tol_id = float(contract.tol_id)
+
+    Gamma = drift_closure if drift_closure is not None else GammaOmegaPower(p=p, epsilon=eps)
+
+    def cols(frame: Tier1Frame, index: Optional[np.ndarray]) -> Tier1Frame:
+        if index is None:
+            return frame
+        idx = np.asarray(index, dtype=np.int64)
+        return Tier1Frame(**{name: frame.column(name)[idx] for name in TIER1_COLUMNS})
+
+    a = cols(pre, pre_index)
+    b = cols(post, post_index)
+    if len(a) != len(b):
+        raise ValueError(f"PRE and POST must pair up; got {len(a)} and {len(b)} rows")
+
+    IC0 = np.asarray(a.IC, dtype=float)
+    IC1 = np.asarray(b.IC, dtype=float)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        # Ledger side
+        positive = (IC0 > 0.0) & (IC1 > 0.0)
+        delta_kappa_ledger = np.where(positive, np.log(np.where(positive, IC1 / IC0, 1.0)), np.nan)
+        ir = np.where(IC0 > 0.0, IC1 / IC0, np.inf)
+
+        # Budget side
+        tau_R = np.asarray(b.tau_R, dtype=float)
+        finite_tau = np.isfinite(tau_R)
+        R = finite_tau.astype(float)
+
+        D_omega = evaluate_closure(Gamma, b.omega)
+        D_C = alpha * b.C
+
+        delta_kappa_budget = (R * tau_R) - (D_omega + D_C)
+        seam_residual = delta_kappa_budget - delta_kappa_ledger
+
+        finite_ledger = np.isfinite(delta_kappa_ledger)
+        id_err = np.where(finite_ledger, np.abs(ir - np.exp(delta_kappa_ledger)), np.inf)
+
+    passed = finite_tau & np.isfinite(seam_residual) & (np.abs(seam_residual) <= tol_seam) & (id_err <= tol_id)
+
+    table = WeldTable(
+        kappa0=np.array(a.kappa, dtype=float),
+        kappa1=np.array(b.kappa, dtype=float),
+        IC0=IC0.copy(),
+        IC1=IC1.copy(),
+        delta_kappa_ledger=delta_kappa_ledger,
+        ir=ir,
+        delta_kappa_budget=delta_kappa_budget,
+        seam_residual=seam_residual,
+        tau_R=tau_R.copy(),
+        R=R,
+        passed=passed,
+    )
+
+    ulp = _BORDERLINE_ULPS * np.finfo(float).eps
+    with np.errstate(invalid="ignore", over="ignore"):
+        seam_scale = np.abs(delta_kappa_budget) + np.abs(delta_kappa_ledger) + np.abs(D_omega) + np.abs(D_C) + tol_seam
+        id_scale = np.abs(ir) * (1.0 + np.abs(delta_kappa_ledger)) + tol_id
+        borderline = finite_tau & finite_ledger & (
+            (np.abs(np.abs(seam_residual) - tol_seam) <= ulp * seam_scale)
+            | (np.abs(id_err - tol_id) <= ulp * id_scale)
+        )
+
+    for i in np.flatnonzero(borderline):
+        w = _weld(a.row(int(i)), b.row(int(i)), contract, drift_closure)
+        for name in WELD_COLUMNS:
+            getattr(table, name)[i] = getattr(w, name)
+
+    if collector is not None:
+        n = len(table)
+        collector.add_time("weld", time.perf_counter() - t0, calls=n)
+        collector.incr("weld.evaluated", n)
+        collector.incr("weld.passed", int(np.count_nonzero(table.passed)))
+        collector.incr("weld.inf_rec", n - int(np.count_nonzero(finite_tau)))
+
+    return table
@@ -0,0 +1,175 @@
+# src/umcp/wide.py
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+import math
+import threading
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from umcp.closures import DriftClosure, GammaOmegaPower, evaluate_closure
+from umcp.contract import FrozenContract
+from umcp.frame import Tier1Frame
+from umcp.tau import return_lags
+
+
+# Coordinates per block. Fixed (not derived from the thread count) so the
+# summation tree, and therefore every float, is the same for any max_workers.
+DEFAULT_COORD_BLOCK = 4096
+
+# Time rows per tile; a tile's scratch is tile_rows·coord_block float64s.
+DEFAULT_TILE_ROWS = 64
+
+
+class _TileScratch(threading.local):
+    def get(self, rows: int, cols: int) -> np.ndarray:
+        buf = getattr(self, "buf", None)
+        if buf is None or buf.shape[0] < rows or buf.shape[1] < cols:
+            buf = self.buf = np.empty((rows, cols), dtype=float)
+        return buf[:rows, :cols]
+
+
+def _tile_partials(
+    x: np.ndarray,
+    r0: int,
+    r1: int,
+    c0: int,
+    c1: int,
+    p: float,
+    eps: float,
+    omega_sum: np.ndarray,
+    C_sum: np.ndarray,
+    S_sum: np.ndarray,
+    scratch: _TileScratch,
+) -> None:
+    """
+    Per-row partial sums over coordinates [c0, c1) for rows [r0, r1):
+    Σ(|Δψ|+ε)^p, Σ(|Δ²ψ|+ε)^p and Σ h(ψ) (unnormalized binary entropy).
+    Rows 0 (ω) and 0–1 (C) have no history and are left untouched.
+    """
+    v = scratch.get(r1 - r0, c1 - c0)
+    xs = x[:, c0:c1]
+
+    lo = max(r0, 1)
+    if lo < r1:
+        d = v[:r1 - lo]
+        np.subtract(xs[lo:r1], xs[lo - 1:r1 - 1], out=d)
+        np.abs(d, out=d)
+        d += eps
+        np.power(d, p, out=d)
+        omega_sum[lo:r1] = np.sum(d, axis=1)
+
+    lo = max(r0, 2)
+    if lo < r1:
+        dd = v[:r1 - lo]
+        np.multiply(xs[lo - 1:r1 - 1], 2.0, out=dd)
+        np.subtract(xs[lo:r1], dd, out=dd)
+        dd += xs[lo - 2:r1 - 2]
+        np.abs(dd, out=dd)
+        dd += eps
+        np.power(dd, p, out=dd)
+        C_sum[lo:r1] = np.sum(dd, axis=1)
+
+    # h = -(x1*ln(x1) + (1-x1)*ln(1-x1)), in float64 as in the frame engine.
+    x1 = v
+    np.copyto(x1, xs[r0:r1])
+    np.clip(x1, eps, 1.0 - eps, out=x1)
+    h = x1 * np.log(x1)
+    y = 1.0 - x1
+    np.log(y, out=x1)
+    x1 *= y
+    h += x1
+    np.negative(h, out=h)
+    S_sum[r0:r1] = np.sum(h, axis=1)
+
+
+def compute_tier1_wide(
+    psi: np.ndarray,
+    contract: FrozenContract,
+    drift_closure: Optional[DriftClosure] = None,
+    *,
+    max_workers: Optional[int] = None,
+    coord_block: int = DEFAULT_COORD_BLOCK,
+    tile_rows: int = DEFAULT_TILE_ROWS,
+) -> Tier1Frame:
+    """
+    Tier-1 frame for very wide traces (large n), split across a thread pool.
+
+    ω, C and S reductions are cut into (tile_rows × coord_block) tiles. Each
+    tile sums its coordinate block per row (NumPy releases the GIL inside
+    these kernels), and the per-block partial sums are then added in block
+    order. The result is independent of max_workers; it matches
+    compute_tier1_frame to within FRAME_ABS_TOL because only the summation
+    order differs. τ_R is computed by return_lags in the calling thread, so it
+    is identical to the serial kernel. max_workers=1 runs inline.
+    """
+    x = np.asarray(psi, dtype=contract.float_dtype)
+    if x.ndim != 2:
+        raise ValueError(f"psi must be 2D array shaped (T,n); got shape={x.shape}")
+    if coord_block < 1 or tile_rows < 1:
+        raise ValueError(f"coord_block and tile_rows must be >= 1; got {coord_block}, {tile_rows}")
+
+    eps = float(contract.epsilon)
+    p = float(contract.p)
+    alpha = float(contract.alpha)
+    lam = float(contract.lam)
+    Gamma = drift_closure if drift_closure is not None else GammaOmegaPower(p=p, epsilon=eps)
+
+    T, n = x.shape
+    out = Tier1Frame.empty(T)
+    if T == 0:
+        return out
+
+    cblocks = [(c0, min(c0 + coord_block, n)) for c0 in range(0, n, coord_block)] or [(0, 0)]
+    partial = np.zeros((3, len(cblocks), T))  # ω, C, S partial sums per coordinate block
+    scratch = _TileScratch()
+
+    tasks: List[Callable[[], None]] = []
+    for k, (c0, c1) in enumerate(cblocks):
+        for r0 in range(0, T, tile_rows):
+            r1 = min(r0 + tile_rows, T)
+            tasks.append(
+                lambda r0=r0, r1=r1, c0=c0, c1=c1, k=k: _tile_partials(
+                    x, r0, r1, c0, c1, p, eps, partial[0, k], partial[1, k], partial[2, k], scratch
+                )
+            )
+
+    if max_workers == 1:
+        for task in tasks:
+            task()
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for fut in [pool.submit(task) for task in tasks]:
+                fut.result()
+
+    # τ_R's lag search is GIL-bound Python, so threads would not speed it up;
+    # it runs here, where instrument.collect() sees its tau.* counters.
+    out.tau_R[:] = return_lags(x, contract)
+
+    # Fixed left-to-right combination of block partials.
+    sums = partial[:, 0].copy()
+    for k in range(1, len(cblocks)):
+        sums += partial[:, k]
+
+    # Row means as in the frame engine: (Σ/n)^(1/p) and (Σh/n)/ln 2.
+    np.divide(sums[0], n, out=out.omega)
+    np.power(out.omega, 1.0 / p, out=out.omega)
+    out.omega[0] = 0.0
+    np.divide(sums[1], n, out=out.C)
+    np.power(out.C, 1.0 / p, out=out.C)
+    out.C[:2] = 0.0
+    np.divide(sums[2], n, out=out.S)
+    np.divide(out.S, math.log(2.0), out=out.S)
+
+    np.subtract(1.0, out.omega, out=out.F)
+    np.clip(out.F, 0.0, 1.0, out=out.F)
+
+    # κ = -((Γ(ω) + α·C) + λ·S), IC = exp(κ)
+    np.copyto(out.kappa, evaluate_closure(Gamma, out.omega))
+    kappa = out.kappa
+    kappa += alpha * out.C
+    kappa += lam * out.S
+    np.negative(kappa, out=kappa)
+    np.exp(kappa, out=out.IC)
+    return out
@@ -0,0 +1,183 @@
+# src/umcp/window.py
+from __future__ import annotations
+
+from collections import deque
+import math
+from typing import Deque, Dict, Iterable, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from umcp.contract import FrozenContract
+from umcp.frame import TIER1_COLUMNS, Tier1Frame
+from umcp.kernel import Tier1Row
+from umcp.regime.classify import REGIME_NAMES, classify_regime, classify_regimes
+
+
+# (kind, target): kind is "mean" / "min" / "max" over a Tier-1 column, or
+# "frac" of rows whose regime is target. Output key is f"{kind}_{target}".
+WindowAggregate = Tuple[str, str]
+
+DEFAULT_AGGREGATES: Tuple[WindowAggregate, ...] = (
+    ("mean", "omega"),
+    ("min", "IC"),
+    ("max", "C"),
+    ("frac", "Stable"),
+)
+
+_CODES = {name: code for code, name in enumerate(REGIME_NAMES)}
+
+
+def _aggregate_key(agg: WindowAggregate) -> str:
+    return f"{agg[0]}_{agg[1]}"
+
+
+class _Extremum:
+    """Sliding min or max over the last W values via a monotonic deque."""
+    __slots__ = ("W", "is_min", "q")
+
+    def __init__(self, W: int, is_min: bool) -> None:
+        self.W = W
+        self.is_min = is_min
+        self.q: Deque[Tuple[int, float]] = deque()
+
+    def push(self, t: int, v: float) -> float:
+        q = self.q
+        if self.is_min:
+            while q and q[-1][1] >= v:
+                q.pop()
+        else:
+            while q and q[-1][1] <= v:
+                q.pop()
+        q.append((t, v))
+        while q[0][0] <= t - self.W:
+            q.popleft()
+        return q[0][1]
+
+
+class RollingTier1:
+    """
+    Sliding-window aggregates over a Tier-1 series, updated per row.
+
+    For every window size W and aggregate, push() returns the value over the
+    last min(W, rows seen) rows ending at the pushed row. Means keep a running
+    sum (re-summed exactly once every W steps, so rounding cannot drift), min /
+    max use monotonic deques, and regime fractions keep running counts; each
+    step is amortized O(1) per (window, aggregate). Memory is O(max(windows)).
+    """
+
+    __slots__ = ("contract", "windows", "aggregates", "keys", "_cap", "_ring", "_codes", "_t", "_sums", "_ext", "_counts")
+
+    def __init__(
+        self,
+        contract: FrozenContract,
+        windows: Sequence[int] = (16,),
+        aggregates: Sequence[WindowAggregate] = DEFAULT_AGGREGATES,
+    ) -> None:
+        self.contract = contract
+        self.windows = tuple(dict.fromkeys(int(w) for w in windows))
+        if not self.windows or min(self.windows) < 1:
+            raise ValueError(f"window sizes must be >= 1; got {windows}")
+        for kind, target in aggregates:
+            if kind in ("mean", "min", "max"):
+                if target not in TIER1_COLUMNS:
+                    raise ValueError(f"unknown Tier-1 column for {kind}: {target!r}")
+            elif kind == "frac":
+                if target not in _CODES:
+                    raise ValueError(f"unknown regime for frac: {target!r}")
+            else:
+                raise ValueError(f"unknown aggregate kind: {kind!r}")
+        self.aggregates = tuple(dict.fromkeys(tuple(a) for a in aggregates))
+        self.keys = tuple(_aggregate_key(a) for a in self.aggregates)
+
+        self._cap = max(self.windows)
+        self._ring = {col: np.zeros(self._cap) for col in dict.fromkeys(c for k, c in self.aggregates if k == "mean")}
+        self._codes = np.zeros(self._cap, dtype=np.uint8)
+        self._t = 0
+        self._sums = {(W, col): 0.0 for W in self.windows for col in self._ring}
+        self._ext = {
+            (W, kind, col): _Extremum(W, kind == "min")
+            for W in self.windows
+            for kind, col in self.aggregates
+            if kind in ("min", "max")
+        }
+        self._counts = {(W, c): 0 for W in self.windows for c in range(len(REGIME_NAMES))}
+
+    @property
+    def t(self) -> int:
+        """Number of rows pushed so far."""
+        return self._t
+
+    def push(self, row: Tier1Row) -> Dict[int, Dict[str, float]]:
+        """Add the next row; returns {W: {aggregate key: value}}."""
+        code = _CODES[classify_regime(row, self.contract)]
+        return self._push({col: float(getattr(row, col)) for col in TIER1_COLUMNS}, code)
+
+    def update(self, rows: Iterable[Tier1Row]) -> List[Dict[int, Dict[str, float]]]:
+        return [self.push(r) for r in rows]
+
+    def _push(self, values: Dict[str, float], code: int) -> Dict[int, Dict[str, float]]:
+        t = self._t
+        cap = self._cap
+        # The ring still holds row t - W for every W <= cap until `slot` is
+        # overwritten below, so departures are read before the new row lands.
+        for W in self.windows:
+            leaving = (t - W) % cap if t >= W else -1
+            for col, ring in self._ring.items():
+                s = self._sums[(W, col)] + values[col]
+                if leaving >= 0:
+                    s -= float(ring[leaving])
+                self._sums[(W, col)] = s
+            if leaving >= 0:
+                self._counts[(W, int(self._codes[leaving]))] -= 1
+            self._counts[(W, code)] += 1
+
+        slot = t % cap
+        for col, ring in self._ring.items():
+            ring[slot] = values[col]
+        self._codes[slot] = code
+        self._t = t + 1
+
+        out: Dict[int, Dict[str, float]] = {}
+        for W in self.windows:
+            m = min(W, self._t)
+            if self._t % W == 0:
+                # Exact re-sum once per W rows: O(1) amortized, no drift.
+                for col, ring in self._ring.items():
+                    self._sums[(W, col)] = math.fsum(ring[(t - k) % cap] for k in range(m))
+            res: Dict[str, float] = {}
+            for (kind, target), key in zip(self.aggregates, self.keys):
+                if kind == "mean":
+                    res[key] = self._sums[(W, target)] / m
+                elif kind == "frac":
+                    res[key] = self._counts[(W, _CODES[target])] / m
+                else:
+                    res[key] = self._ext[(W, kind, target)].push(t, values[target])
+            out[W] = res
+        return out
+
+
+def rolling_window_stats(
+    series: Union[Tier1Frame, Sequence[Tier1Row]],
+    contract: FrozenContract,
+    windows: Sequence[int] = (16,),
+    aggregates: Sequence[WindowAggregate] = DEFAULT_AGGREGATES,
+) -> Dict[int, Dict[str, np.ndarray]]:
+    """
+    RollingTier1 over a whole series (frame or compute_tier1_series rows).
+
+    Returns {W: {aggregate key: array of length T}}; entry i covers rows
+    max(0, i-W+1) .. i, matching what push() reports row by row.
+    """
+    frame = series if isinstance(series, Tier1Frame) else Tier1Frame.from_rows(list(series))
+    roll = RollingTier1(contract, windows, aggregates)
+    T = len(frame)
+    out = {W: {key: np.empty(T) for key in roll.keys} for W in roll.windows}
+    codes = classify_regimes(frame, contract)
+    cols = {col: np.asarray(frame.column(col), dtype=float) for col in TIER1_COLUMNS}
+    for i in range(T):
+        step = roll._push({col: float(cols[col][i]) for col in TIER1_COLUMNS}, int(codes[i]))
+        for W, res in step.items():
+            dst = out[W]
+            for key, v in res.items():
+                dst[key][i] = v
+    return out
@@ -0,0 +1,46 @@
+import numpy as np
+
+from umcp.batch import compute_tier1_batch
+from umcp.contract import FrozenContract
+from umcp.frame import compute_tier1_frame
+from umcp.regime.classify import classify_regime
+from umcp.tier0.admit import admit_trace
+
+
+def _traces(k=5, seed=5):
+    rng = np.random.default_rng(seed)
+    return [rng.uniform(-0.1, 1.1, size=(20 + 3 * i, 3)) for i in range(k)]
+
+
+def test_batch_matches_serial_pipeline_in_input_order():
+    contract = FrozenContract()
+    traces = _traces()
+
+    for workers in (1, 2):
+        results = compute_tier1_batch(traces, contract, max_workers=workers)
+        assert [r.index for r in results] == list(range(len(traces)))
+        for raw, res in zip(traces, results):
+            assert res.ok
+            admitted = admit_trace(raw, contract)
+            ref = compute_tier1_frame(admitted.psi, contract)
+            assert np.array_equal(res.frame.kappa, ref.kappa)
+            assert np.array_equal(res.frame.tau_R, ref.tau_R)
+            assert res.regimes() == [classify_regime(row, contract) for row in ref]
+            assert res.oor_count == int(admitted.oor_mask.sum())
+
+
+def test_batch_reports_failures_without_aborting():
+    contract = FrozenContract()
+    traces = _traces(k=3)
+    traces.insert(1, np.zeros(4))  # not (T,n)
+    traces.append(np.full((5, 2), "x"))  # (T,n) but not numeric: fails while packing
+    traces.append(traces[0].astype(np.float32).tolist())  # converted straight into shm
+
+    results = compute_tier1_batch(traces, contract, max_workers=2)
+    assert len(results) == 6
+    assert not results[1].ok and not results[4].ok
+    assert results[1].error.startswith("ValueError") and results[4].error.startswith("ValueError")
+    assert results[1].frame is None
+    assert all(results[i].ok for i in (0, 2, 3, 5))
+    ref = compute_tier1_frame(admit_trace(np.asarray(traces[5]), contract).psi, contract)
+    assert np.array_equal(results[5].frame.kappa, ref.kappa)
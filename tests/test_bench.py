@@ -0,0 +1,74 @@
+import json
+
+import numpy as np
+import pytest
+
+from umcp.bench import BenchCase, compare, default_cases, main, run_suite
+from umcp.contract import FrozenContract
+from umcp.frame import compute_tier1_frame
+from umcp.regime.classify import COLLAPSE, STABLE, WATCH, classify_regimes
+from umcp.synthetic import SYNTHETIC_REGIMES, synthetic_trace
+
+
+def test_synthetic_traces_are_deterministic_and_in_range():
+    for regime in SYNTHETIC_REGIMES:
+        a = synthetic_trace(regime, 200, 8, seed=3)
+        b = synthetic_trace(regime, 200, 8, seed=3)
+        assert a.shape == (200, 8)
+        assert np.array_equal(a, b)
+        assert np.all((a >= 0.0) & (a <= 1.0))
+    raw = synthetic_trace("drifting", 500, 8, oor_rate=0.05)
+    assert np.any((raw < 0.0) | (raw > 1.0))
+    with pytest.raises(ValueError):
+        synthetic_trace("chaotic", 10, 2)
+
+
+def test_synthetic_regime_shapes():
+    contract = FrozenContract(tol_id=1e-6)
+    codes = {r: classify_regimes(compute_tier1_frame(synthetic_trace(r, 600, 16), contract), contract) for r in SYNTHETIC_REGIMES}
+    assert np.all(codes["stable"] == STABLE)
+    assert np.mean(codes["drifting"] == WATCH) > 0.9
+    assert codes["collapsing"][-1] == COLLAPSE
+    frame = compute_tier1_frame(synthetic_trace("periodic", 600, 16, period=17), contract)
+    assert np.all(frame.tau_R[17:] == 17.0)
+
+
+def test_run_suite_and_compare_flags_regressions():
+    cases = [BenchCase("noop", {"k": 1}, lambda: None, repeats=2)]
+    report = run_suite(cases)
+    assert report["schema"] == 1
+    (res,) = report["results"]
+    assert res["key"] == "noop[k=1]" and res["repeats"] == 2
+
+    # setup runs once per case, untimed, and feeds every call.
+    built, seen = [], []
+    case = BenchCase("sum", {}, lambda x: seen.append(x.sum()), repeats=3, setup=lambda: built.append(1) or np.ones(4))
+    run_suite([case])
+    assert built == [1] and seen == [4.0] * 4
+
+    base = {"results": [{"key": "a", "min_s": 1.0}, {"key": "b", "min_s": 1.0}]}
+    cur = {"results": [{"key": "a", "min_s": 1.1}, {"key": "b", "min_s": 1.5}, {"key": "c", "min_s": 9.0}]}
+    regs = compare(cur, base, threshold=0.2)
+    assert [r.key for r in regs] == ["b"]
+    assert regs[0].ratio == pytest.approx(1.5)
+
+
+def test_main_writes_json_and_fails_on_regression(tmp_path):
+    out = tmp_path / "bench.json"
+    assert main(["--quick", "--filter", "eid_checksum", "--out", str(out)]) == 0
+    report = json.loads(out.read_text())
+    assert {r["name"] for r in report["results"]} == {"eid_checksum"}
+
+    for r in report["results"]:
+        r["min_s"] /= 100.0
+    base = tmp_path / "base.json"
+    base.write_text(json.dumps(report))
+    assert main(["--quick", "--filter", "eid_checksum", "--baseline", str(base)]) == 1
+
+
+def test_listing_the_full_sweep_builds_no_inputs():
+    # Every case takes its input from setup, so enumerating (and filtering)
+    # the full sweep, wide 256×32768 trace included, costs nothing.
+    cases = list(default_cases())
+    assert any(c.params.get("n") == 32768 for c in cases)
+    assert all(c.setup is not None for c in cases if c.name != "prime_pi")
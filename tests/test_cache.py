@@ -0,0 +1,123 @@
+import dataclasses
+import os
+
+import numpy as np
+
+from umcp.cache import ResultCache, array_digest, closure_digest, contract_digest
+from umcp.closures import GammaNegLogOneMinusOmega, GammaOmegaPower
+from umcp.contract import FrozenContract
+from umcp.frame import compute_tier1_frame
+from umcp.instrument import collect
+from umcp.kernel import compute_tier1_series
+from umcp.synthetic import synthetic_trace
+from umcp.tier0.admit import admit_trace
+from umcp.weld import evaluate_weld, evaluate_welds
+
+
+def test_cached_results_equal_direct(tmp_path):
+    cache = ResultCache(tmp_path)
+    contract = FrozenContract(tol_id=1e-6, tau_lookback=16)
+    raw = synthetic_trace("periodic", 60, 4, period=6, oor_rate=0.05)
+
+    for _ in range(2):
+        adm = cache.admit_trace(raw, contract)
+        rows = cache.compute_tier1_series(adm.psi, contract)
+        w = cache.evaluate_weld(rows[10], rows[16], contract)
+
+    ref_adm = admit_trace(raw, contract)
+    ref_rows = compute_tier1_series(ref_adm.psi, contract)
+    assert np.array_equal(adm.psi, ref_adm.psi) and np.array_equal(adm.oor_mask, ref_adm.oor_mask)
+    assert rows == ref_rows
+    assert w == evaluate_weld(ref_rows[10], ref_rows[16], contract)
+
+    s = cache.stats()
+    assert (s.hits, s.misses, s.stores) == (3, 3, 3)
+    assert s.hit_rate == 0.5 and s.bytes_read > 0
+
+    # A second handle on the same directory (another worker) sees the entries.
+    other = ResultCache(tmp_path)
+    with collect() as c:
+        other.compute_tier1_series(adm.psi, contract)
+    assert c.count("cache.hit") == 1
+
+
+def test_keys_cover_contract_closure_and_bytes(tmp_path):
+    c0 = FrozenContract()
+    assert contract_digest(c0) != contract_digest(FrozenContract(alpha=0.5))
+    assert closure_digest(None) != closure_digest(GammaOmegaPower())
+    assert closure_digest(GammaOmegaPower(p=2.0)) != closure_digest(GammaOmegaPower(p=3.0))
+    assert closure_digest(GammaOmegaPower()) != closure_digest(GammaNegLogOneMinusOmega())
+    assert closure_digest(lambda w: w) is None
+    # NumPy parameters are keyed by value; unencodable ones skip the cache.
+    assert closure_digest(GammaOmegaPower(p=np.float64(3.0))) == closure_digest(GammaOmegaPower(p=3.0))
+    assert closure_digest(GammaOmegaPower(p=object())) is None
+
+    a = np.zeros((3, 2))
+    assert array_digest(a) != array_digest(a.astype(np.float32))
+    assert array_digest(a) != array_digest(a.reshape(2, 3))
+    assert array_digest(a) == array_digest(np.asfortranarray(a))
+
+    cache = ResultCache(tmp_path)
+    psi = synthetic_trace("drifting", 30, 3)
+    cache.compute_tier1_series(psi, c0)
+    cache.compute_tier1_series(psi, c0, GammaNegLogOneMinusOmega())
+    cache.compute_tier1_series(psi, c0, lambda w: w * w)
+    s = cache.stats()
+    assert (s.hits, s.misses, s.bypassed) == (0, 2, 1)
+
+
+def test_lru_eviction_by_size(tmp_path):
+    cache = ResultCache(tmp_path, max_bytes=10**9)
+    contract = FrozenContract()
+    traces = [synthetic_trace("drifting", 40, 3, seed=s) for s in range(3)]
+    paths = []
+    for i, psi in enumerate(traces[:2]):
+        cache.compute_tier1_series(psi, contract)
+        (entry,) = [e for e in os.scandir(tmp_path / "tier1") if e.path not in paths]
+        paths.append(entry.path)
+        os.utime(entry.path, ns=(i * 10**9, i * 10**9))
+    one = os.path.getsize(paths[0])
+
+    # Stores below the budget never rescan; over it, the oldest go until the
+    # low-water mark (2 entries fit under 0.9 · max_bytes, 3 do not).
+    cache.max_bytes = 3 * one - 1
+    cache.compute_tier1_series(traces[0], contract)  # hit refreshes entry 0
+    cache.compute_tier1_series(traces[2], contract)  # entry 1 is now the oldest
+    assert os.path.exists(paths[0]) and not os.path.exists(paths[1])
+    assert cache.stats().evictions == 1
+    assert cache.size_bytes() == cache._total == 2 * one
+
+    # Corrupt entries are dropped and recomputed.
+    with open(paths[0], "wb") as fh:
+        fh.write(b"junk")
+    rows = cache.compute_tier1_series(traces[0], contract)
+    assert rows == compute_tier1_series(traces[0], contract)
+    raw = synthetic_trace("periodic", 20, 3)
+    cache.admit_trace(raw, contract)
+    (npz,) = os.scandir(tmp_path / "admit")
+    with open(npz.path, "wb") as fh:
+        fh.write(b"PK\x03\x04junk")
+    assert np.array_equal(cache.admit_trace(raw, contract).psi, admit_trace(raw, contract).psi)
+    cache.clear()
+    assert cache.size_bytes() == 0
+
+
+def test_weld_tables_are_one_entry_and_keys_ignore_time(tmp_path):
+    cache = ResultCache(tmp_path)
+    contract = FrozenContract(tol_id=1e-6, tau_lookback=16)
+    frame = compute_tier1_frame(synthetic_trace("periodic", 80, 4, period=6), contract)
+    i0, i1 = np.arange(0, 70), np.arange(6, 76)
+
+    for _ in range(2):
+        table = cache.evaluate_welds(frame, frame, contract, pre_index=i0, post_index=i1)
+    ref = evaluate_welds(frame, frame, contract, pre_index=i0, post_index=i1)
+    assert table.receipts() == ref.receipts()
+    assert table.seam_residual.flags.writeable  # a copy, not a view of the entry
+    assert len(os.listdir(tmp_path / "weld")) == 1
+    assert (cache.stats().hits, cache.stats().misses) == (1, 1)
+
+    # The same pair of rows at other times is the same weld.
+    rows = frame.rows()
+    w = cache.evaluate_weld(rows[10], rows[16], contract)
+    assert cache.evaluate_weld(dataclasses.replace(rows[10], t=99), dataclasses.replace(rows[16], t=105), contract) == w
+    assert (cache.stats().hits, cache.stats().misses) == (2, 2)
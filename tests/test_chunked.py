@@ -0,0 +1,36 @@
+import numpy as np
+
+from umcp.chunked import compute_tier1_chunked
+from umcp.contract import FrozenContract
+from umcp.frame import TIER1_COLUMNS, compute_tier1_frame
+from umcp.tier0.admit import admit_trace
+
+
+def _raw(T=200, n=3, seed=4):
+    rng = np.random.default_rng(seed)
+    states = rng.uniform(-0.2, 1.2, size=(6, n))
+    return states[rng.integers(0, 6, size=T)]
+
+
+def test_chunked_npy_matches_in_memory_path(tmp_path):
+    raw = _raw()
+    np.save(tmp_path / "raw.npy", raw)
+    contract = FrozenContract(tol_id=1e-6, tau_lookback=20)
+
+    ref = compute_tier1_frame(admit_trace(raw, contract).psi, contract)
+    for chunk_rows in (1, 7, 64, 1000):
+        got = compute_tier1_chunked(tmp_path / "raw.npy", contract, chunk_rows=chunk_rows, out_dir=tmp_path / f"out{chunk_rows}")
+        for name in TIER1_COLUMNS:
+            assert np.array_equal(got.column(name), ref.column(name))
+    assert isinstance(got.kappa, np.memmap)
+    assert np.isfinite(ref.tau_R).any()
+
+
+def test_chunked_raw_binary_in_memory_output(tmp_path):
+    raw = _raw(T=50, n=4).astype(np.float32)
+    raw.tofile(tmp_path / "raw.bin")
+    contract = FrozenContract()
+
+    got = compute_tier1_chunked(tmp_path / "raw.bin", contract, n=4, dtype=np.float32, chunk_rows=9)
+    ref = compute_tier1_frame(admit_trace(raw, contract).psi, contract)
+    assert np.array_equal(got.IC, ref.IC)
@@ -1,6 +1,11 @@
 import math
 
+import numpy as np
+import pytest
+
 from umcp.eid import prime_pi, EIDCounts, eid_checksum, delta_kappa_eid
+from umcp.eid import eid_checksum_update, eid_combine_checksums, eid_partial_checksum
+from umcp.primes import first_primes
 
 
 def test_prime_pi_basic_values():
@@ -29,3 +34,53 @@ def test_delta_kappa_eid_mass_ratio():
     post = EIDCounts(counts=[2, 1])   # mass 3
     dk = delta_kappa_eid(pre, post)
     assert math.isclose(dk, math.log(3.0 / 2.0), rel_tol=0.0, abs_tol=1e-12)
+
+
+def test_vectorized_checksum_wraps_like_python_reference():
+    rng = np.random.default_rng(10)
+    counts = rng.integers(0, 2**62, size=5000, dtype=np.int64)
+    primes = first_primes(counts.size).tolist()
+    ref = sum(int(c) * p for c, p in zip(counts, primes)) % 2**64
+
+    assert eid_checksum(counts) == ref
+    assert eid_checksum(counts.tolist()) == ref
+    assert eid_checksum([2**70, 1]) == (2**70 * 2 + 3) % 2**64  # big ints take the exact path
+
+
+def test_partial_checksums_merge_and_single_bin_updates():
+    counts = np.arange(1, 1001, dtype=np.int64) ** 3
+    full = eid_checksum(counts)
+
+    shards = [eid_partial_checksum(counts[a:a + 300], offset=a) for a in range(0, 1000, 300)]
+    assert eid_combine_checksums(*reversed(shards)) == full
+
+    e = EIDCounts(counts=counts.copy())
+    assert e.checksum() == full and e.mass == int(counts.sum())
+    e.add(17, -5)
+    e.add(999, 2**40)
+    assert e.checksum() == eid_checksum(e.counts)
+    assert e.mass == int(counts.sum()) - 5 + 2**40
+    assert eid_checksum_update(full, 0, 1) == (full + 2) % 2**64
+
+
+def test_counts_are_copied_and_read_only():
+    src = [1, 2, 3]
+    e = EIDCounts(counts=src)
+    assert e.checksum() == 23
+    src[0] = 100  # the caller's list is not shared
+    assert e.checksum() == eid_checksum(e.counts) == 23
+    with pytest.raises(ValueError):
+        e.counts[0] = 5
+    e.add(0, 1)
+    assert list(e.counts) == [2, 2, 3] and e.mass == 7
+    assert e == EIDCounts(counts=[2, 2, 3])
+
+    # counts is an ndarray, not the list passed in: list semantics need tolist().
+    assert isinstance(e.counts, np.ndarray)
+    assert e.counts.tolist() + [4] == [2, 2, 3, 4]
+    assert list(e.counts + e.counts) == [4, 4, 6]
+    assert (e.counts == [2, 2, 3]).all()
+
+    big = EIDCounts(counts=np.array([2**62], dtype=np.int64))
+    big.add(0, 2**62)
+    assert big.mass == 2**63 and big.checksum() == eid_checksum([2**63])
@@ -0,0 +1,55 @@
+import math
+import numpy as np
+
+from umcp.contract import FrozenContract
+from umcp.frame import FRAME_ABS_TOL, TIER1_COLUMNS, Tier1Frame, compute_tier1_frame
+from umcp.kernel import compute_tier1_series
+
+
+def _trace(T=64, n=5, seed=0):
+    rng = np.random.default_rng(seed)
+    psi = np.clip(0.5 + 0.05 * rng.standard_normal((T, n)).cumsum(axis=0), 0.0, 1.0)
+    if T > 40:
+        psi[40] = psi[33]  # exact revisit -> finite τ_R
+    return psi
+
+
+def test_frame_matches_row_loop_within_tolerance():
+    # tol_id above ε so the exact revisit registers as a return.
+    contract = FrozenContract(tol_id=1e-6, tau_lookback=16)
+    psi = _trace()
+
+    rows = compute_tier1_series(psi, contract)
+    frame = compute_tier1_frame(psi, contract, block_rows=7)
+
+    assert len(frame) == len(rows)
+    assert frame.tau_R[40] == 7.0
+    for r, f in zip(rows, frame.rows()):
+        assert f.t == r.t
+        assert f.tau_R == r.tau_R
+        for name in ("omega", "F", "S", "C", "IC", "kappa"):
+            assert math.isclose(getattr(f, name), getattr(r, name), rel_tol=0.0, abs_tol=FRAME_ABS_TOL)
+
+
+def test_frame_is_independent_of_block_size():
+    contract = FrozenContract(tol_id=1e-6, tau_lookback=16)
+    psi = _trace(T=50)
+
+    a = compute_tier1_frame(psi, contract, block_rows=1)
+    b = compute_tier1_frame(psi, contract, block_rows=1000)
+    for name in TIER1_COLUMNS:
+        assert np.array_equal(a.column(name), b.column(name))
+
+
+def test_frame_row_views_and_roundtrip():
+    contract = FrozenContract()
+    frame = compute_tier1_frame(_trace(T=10), contract)
+
+    tail = frame.slice(7, 10)
+    assert tail.t0 == 7
+    assert tail.row(-1).t == 9
+    assert tail.row(0) == frame.row(7)
+
+    again = Tier1Frame.from_rows(list(tail))
+    assert again.t0 == 7
+    assert np.array_equal(again.kappa, tail.kappa)
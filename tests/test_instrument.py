@@ -0,0 +1,70 @@
+import math
+
+import numpy as np
+
+from umcp.contract import FrozenContract
+from umcp.instrument import Collector, active_collector, collect
+from umcp.kernel import _return_lag, compute_tier1_series
+from umcp.synthetic import synthetic_trace
+from umcp.tier0.admit import admit_trace
+from umcp.weld import evaluate_weld
+
+
+def test_disabled_by_default_and_scoped():
+    assert active_collector() is None
+    with collect() as c:
+        assert active_collector() is c
+    assert active_collector() is None
+
+
+def test_pipeline_counters_and_stages():
+    contract = FrozenContract(tol_id=1e-6, tau_lookback=32)
+    raw = synthetic_trace("periodic", 120, 6, period=9, oor_rate=0.02)
+    plain = compute_tier1_series(admit_trace(raw, contract).psi, contract)
+
+    with collect() as c:
+        adm = admit_trace(raw, contract)
+        rows = compute_tier1_series(adm.psi, contract)
+        w = [evaluate_weld(rows[t - 1], rows[t], contract) for t in range(1, len(rows))]
+
+    # Instrumentation must not change results.
+    assert rows == plain
+
+    assert c.count("admit.rows") == 120
+    assert c.count("admit.oor") == int(adm.oor_mask.sum())
+    assert c.count("kernel.rows") == 120
+    assert c.count("tau.rows") == 120
+    assert c.count("tau.inf_rec") == sum(math.isinf(r.tau_R) for r in rows)
+    assert c.count("weld.evaluated") == 119
+    assert c.count("weld.passed") == sum(x.passed for x in w)
+    assert c.count("weld.inf_rec") == sum(math.isinf(x.tau_R) for x in w)
+
+    # Pruned search never does more exact comparisons than brute force.
+    brute = sum(
+        int(lag) if math.isfinite(lag) else min(32, t)
+        for t in range(120)
+        for lag in [_return_lag(adm.psi, t, 1e-6, 32, float(contract.p), float(contract.epsilon))]
+    )
+    assert 0 < c.count("tau.lag_comparisons") <= brute
+
+    snap = c.snapshot()
+    for stage in ("admit", "kernel", "kernel.omega_C", "kernel.entropy", "kernel.tau_R", "kernel.gamma", "weld"):
+        assert snap["stages"][stage]["seconds"] >= 0.0
+    assert snap["stages"]["weld"]["calls"] == 119
+    parts = sum(c.seconds(s) for s in ("kernel.omega_C", "kernel.entropy", "kernel.tau_R", "kernel.gamma"))
+    assert parts <= c.seconds("kernel") * 1.01
+
+
+def test_prometheus_export_and_reuse():
+    c = Collector()
+    with collect(c):
+        admit_trace(np.zeros((4, 2)), FrozenContract())
+    with collect(c):
+        admit_trace(np.ones((3, 2)) * 2.0, FrozenContract())
+    assert c.count("admit.rows") == 7
+    text = c.prometheus()
+    assert "umcp_admit_rows_total 7" in text
+    assert "umcp_admit_oor_total 6" in text
+    assert 'umcp_stage_calls_total{stage="admit"} 2' in text
+    c.reset()
+    assert c.snapshot() == {"stages": {}, "counters": {}}
@@ -1,7 +1,9 @@
 import math
 import numpy as np
 
+from umcp.closures import DriftClosure, GammaOmegaPower, evaluate_closure
 from umcp.contract import FrozenContract
+from umcp.frame import compute_tier1_frame
 from umcp.kernel import compute_tier1_series
 
 
@@ -32,3 +34,25 @@ def test_tier1_identity_ic_equals_exp_kappa():
 
         # Fidelity is clipped into [0,1]
         assert 0.0 <= row.F <= 1.0
+
+
+def test_scalar_only_closure_is_adapted_to_arrays():
+    class LinearGamma(DriftClosure):
+        def __call__(self, omega: float) -> float:
+            return 2.0 * max(omega, 0.0)
+
+    omega = np.array([-0.5, 0.0, 0.25, 1.5])
+    assert np.array_equal(evaluate_closure(LinearGamma(), omega), [0.0, 0.0, 0.5, 3.0])
+    assert np.array_equal(evaluate_closure(lambda w: w + 1.0, omega), omega + 1.0)
+
+    # Integer-exponent fast path agrees between scalar and array forms.
+    g = GammaOmegaPower(p=3.0, epsilon=0.0)
+    assert np.array_equal(g(omega), [g(float(w)) for w in omega])
+    assert g(0.5) == 0.125
+
+    psi = np.linspace(0.0, 1.0, 24).reshape(8, 3)
+    contract = FrozenContract()
+    rows = compute_tier1_series(psi, contract, LinearGamma())
+    frame = compute_tier1_frame(psi, contract, LinearGamma())
+    for r, f in zip(rows, frame):
+        assert math.isclose(r.kappa, f.kappa, rel_tol=0.0, abs_tol=1e-12)
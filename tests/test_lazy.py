@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from umcp.contract import FrozenContract
+from umcp.instrument import collect
+from umcp.kernel import Tier1Row, compute_tier1_series
+from umcp.lazy import LazyTier1Series
+from umcp.synthetic import synthetic_trace
+from umcp.weld import evaluate_weld
+
+
+def _fields(row):
+    return (row.t, row.omega, row.F, row.S, row.C, row.tau_R, row.IC, row.kappa)
+
+
+def test_lazy_rows_match_series():
+    contract = FrozenContract(tol_id=1e-6, tau_lookback=24)
+    psi = synthetic_trace("periodic", 150, 5, period=8)
+    ref = compute_tier1_series(psi, contract)
+    lazy = LazyTier1Series(psi, contract)
+
+    assert len(lazy) == 150
+    assert all(_fields(a) == _fields(b) for a, b in zip(lazy, ref))
+    assert [_fields(r) for r in lazy[40:60:3]] == [_fields(r) for r in ref[40:60:3]]
+    assert _fields(lazy[-1]) == _fields(ref[-1])
+    assert isinstance(lazy[7].to_row(), Tier1Row) and lazy[7].to_row() == ref[7]
+    assert np.array_equal(lazy.tau_R_range(0, 150), [r.tau_R for r in ref])
+
+    w = evaluate_weld(lazy[90], lazy[130], contract)
+    assert w == evaluate_weld(ref[90], ref[130], contract)
+    with pytest.raises(IndexError):
+        lazy[150]
+
+
+def test_tau_only_on_read_and_cached():
+    contract = FrozenContract(tol_id=1e-6, tau_lookback=24)
+    lazy = LazyTier1Series(synthetic_trace("periodic", 500, 4, period=10), contract)
+
+    with collect() as c:
+        tail = lazy[-5:]
+        assert c.count("tau.rows") == 0
+        assert [r.tau_R for r in tail] == [10.0] * 5
+        assert c.count("tau.rows") == 5
+        lazy.tau_R_range(490, 500)  # five cached, one return_lags call for the rest
+        assert c.count("tau.rows") == 10
+    info = lazy.cache_info()
+    assert info["rows"] == 5 and info["tau_rows"] == 10
+    assert info["tau_hits"] == 5
+
+
+def test_lru_bound_and_eviction():
+    contract = FrozenContract()
+    lazy = LazyTier1Series(synthetic_trace("drifting", 100, 3), contract, max_rows=8)
+    for t in range(20):
+        lazy[t]
+    lazy[12]  # hit: 12 becomes most recent
+    lazy[20]
+    info = lazy.cache_info()
+    assert info["rows"] == 8
+    assert info["row_hits"] == 1 and info["row_misses"] == 21
+    lazy[12]
+    assert lazy.cache_info()["row_hits"] == 2
+    lazy[0]
+    assert lazy.cache_info()["row_misses"] == 22
+    lazy.clear_cache()
+    assert lazy.cache_info()["rows"] == 0
+
+    with pytest.raises(ValueError):
+        LazyTier1Series(np.zeros((4, 2)), contract, max_rows=0)
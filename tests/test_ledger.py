@@ -0,0 +1,128 @@
+from dataclasses import astuple
+import os
+
+import numpy as np
+import pytest
+
+from umcp.contract import FrozenContract
+from umcp.frame import compute_tier1_frame
+from umcp.ledger import HEADER_SIZE, RECORD_DTYPE, WeldLedger
+from umcp.synthetic import synthetic_trace
+from umcp.weld import evaluate_weld
+
+
+def _receipts(T=200):
+    # Alternate returning (PASS) and drifting (FAIL: τ_R = ∞_rec) stretches.
+    contract = FrozenContract(tol_id=1e-6, tol_seam=10.0, tau_lookback=32)
+    parts = [synthetic_trace("periodic" if k % 2 else "drifting", 40, 4, seed=k, period=7) for k in range(T // 40 + 1)]
+    frame = compute_tier1_frame(np.vstack(parts)[:T], contract)
+    pairs = [(t - 1, t) for t in range(1, T)]
+    welds = [evaluate_weld(frame.row(a), frame.row(b), contract) for a, b in pairs]
+    return contract, pairs, welds
+
+
+def _same(a, b):
+    # Receipts for ∞_rec welds carry NaN budget/residual, so compare NaN-aware.
+    return np.array_equal(np.array(astuple(a), dtype=float), np.array(astuple(b), dtype=float), equal_nan=True)
+
+
+def test_append_query_and_reopen(tmp_path):
+    contract, pairs, welds = _receipts()
+    assert any(w.passed for w in welds) and not all(w.passed for w in welds)
+    path = tmp_path / "welds.ledger"
+
+    with WeldLedger(path, contract, sync_every=16, block_records=32) as led:
+        for (a, b), w in zip(pairs, welds):
+            led.append(a, b, w)
+        assert len(led) == len(welds)
+
+    led = WeldLedger(path, block_records=32)
+    assert led.contract == contract and len(led) == len(welds)
+    assert os.path.getsize(str(path) + ".idx") == (len(welds) // 32) * 56
+
+    fails = led.failing(50, 120)
+    expect = [i for i, ((a, b), w) in enumerate(zip(pairs, welds)) if a >= 50 and b < 120 and not w.passed]
+    assert [e.seq for e in fails] == expect
+    assert all(_same(e.weld, welds[e.seq]) for e in fails)
+    assert list(led.query_indices(0, 10**9, passed=True)) == [i for i, w in enumerate(welds) if w.passed]
+
+    (hit,) = led.lookup(99, 100)
+    assert hit.seq == 99 and _same(hit.weld, welds[99])
+    assert led.entry(0).pre_t == 0
+
+    # Appending after reopen continues the chain.
+    led.append(500, 501, welds[0])
+    assert led.verify() is None
+    led.close()
+    with pytest.raises(ValueError, match="does not match"):
+        WeldLedger(path, FrozenContract())
+
+
+def test_verify_detects_tampering_incrementally(tmp_path):
+    contract, pairs, welds = _receipts(120)
+    path = tmp_path / "welds.ledger"
+    with WeldLedger(path, contract) as led:
+        led.extend([a for a, _ in pairs], [b for _, b in pairs], welds)
+        assert led.verify(0, 60) is None and led.verify(60) is None
+
+    recs = np.memmap(path, dtype=RECORD_DTYPE, mode="r+", offset=HEADER_SIZE)
+    recs["seam_residual"][77] += 1.0
+    recs.flush()
+    del recs
+
+    led = WeldLedger(path)
+    assert led.verify(0, 60) is None
+    assert led.verify(60) == 77
+    led.close()
+
+
+def test_torn_tail_and_stale_index_are_repaired(tmp_path):
+    contract, pairs, welds = _receipts(100)
+    path = tmp_path / "welds.ledger"
+    with WeldLedger(path, contract, block_records=16) as led:
+        led.extend([a for a, _ in pairs], [b for _, b in pairs], welds)
+    with open(path, "ab") as fh:
+        fh.write(b"\x01" * 10)
+    os.remove(str(path) + ".idx")
+
+    with WeldLedger(path, block_records=16) as led:
+        assert len(led) == len(welds)
+        assert led.verify() is None
+        assert len(led.failing(0, 1000)) == sum(not w.passed for w in welds)
+
+
+def test_read_only_audit_never_truncates_or_rewrites(tmp_path):
+    contract, pairs, welds = _receipts(120)
+    path = tmp_path / "w.ldg"
+    writer = WeldLedger(path, contract, sync_every=1, block_records=16)
+    writer.extend([a for a, _ in pairs[:50]], [b for _, b in pairs[:50]], welds[:50])
+
+    # Simulate a record that is still being written.
+    with open(path, "ab") as fh:
+        fh.write(b"\x01" * (RECORD_DTYPE.itemsize // 2))
+    size = os.path.getsize(path)
+    idx_mtime = os.stat(str(path) + ".idx").st_mtime_ns
+
+    audit = WeldLedger(path, read_only=True, block_records=16)
+    assert len(audit) == 50 and audit.verify() is None
+    assert os.path.getsize(path) == size
+    assert os.stat(str(path) + ".idx").st_mtime_ns == idx_mtime
+    with pytest.raises(ValueError):
+        audit.append(0, 1, welds[0])
+    audit.close()
+    assert os.path.getsize(path) == size
+
+    with pytest.raises(FileNotFoundError):
+        WeldLedger(tmp_path / "missing.ldg", read_only=True)
+    writer._fh.close()
+
+    # Writer mode repairs the torn tail; a live auditor picks up new records.
+    writer = WeldLedger(path, block_records=16)
+    assert os.path.getsize(path) == HEADER_SIZE + 50 * RECORD_DTYPE.itemsize
+    audit = WeldLedger(path, read_only=True, block_records=16)
+    writer.extend([a for a, _ in pairs[50:]], [b for _, b in pairs[50:]], welds[50:])
+    writer.flush()
+    assert audit.refresh() == len(pairs)
+    assert audit.verify() is None and _same(audit.entry(100).weld, welds[100])
+    writer.close()
+    audit.close()
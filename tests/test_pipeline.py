@@ -0,0 +1,47 @@
+import numpy as np
+
+from umcp.contract import FrozenContract
+from umcp.frame import TIER1_COLUMNS, compute_tier1_frame
+from umcp.pipeline import admit_and_compute
+from umcp.tier0.admit import admit_trace
+
+
+def _raw(T=150, n=4, seed=11):
+    rng = np.random.default_rng(seed)
+    raw = rng.random((T, n))
+    raw[rng.random((T, n)) < 0.02] = 1.5  # rare OOR values
+    raw[3, 1] = -0.25
+    return raw
+
+
+def test_fused_pipeline_matches_unfused_path():
+    raw = _raw()
+    contract = FrozenContract()
+    ref_adm = admit_trace(raw, contract)
+    ref = compute_tier1_frame(ref_adm.psi, contract)
+
+    for chunk_rows in (1, 16, 1000):
+        res = admit_and_compute(raw, contract, chunk_rows=chunk_rows, block_rows=5)
+        assert np.array_equal(res.psi, ref_adm.psi)
+        assert np.array_equal(res.oor.to_mask(), ref_adm.oor_mask)
+        for name in TIER1_COLUMNS:
+            assert np.array_equal(res.frame.column(name), ref.column(name))
+
+    bits = res.oor.packbits()
+    assert np.array_equal(np.unpackbits(bits, count=raw.size).reshape(raw.shape).astype(bool), ref_adm.oor_mask)
+    assert 3 in res.oor.rows
+
+
+def test_inplace_admission_reuses_caller_buffer():
+    raw = _raw(T=20)
+    untouched = raw.copy()
+    contract = FrozenContract()
+
+    copied = admit_and_compute(raw, contract)
+    assert copied.psi is not raw
+    assert np.array_equal(raw, untouched)
+
+    res = admit_and_compute(raw, contract, inplace=True)
+    assert res.psi is raw
+    assert raw.max() <= 1.0 and raw.min() >= 0.0
+    assert np.array_equal(res.frame.kappa, copied.frame.kappa)
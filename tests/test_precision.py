@@ -0,0 +1,52 @@
+import dataclasses
+
+import numpy as np
+import pytest
+
+from umcp.contract import FrozenContract
+from umcp.frame import compute_tier1_frame
+from umcp.pipeline import admit_and_compute
+from umcp.precision import validate_precision
+from umcp.tier0.admit import admit_trace
+
+
+def _raw(T=300, n=6, seed=12):
+    rng = np.random.default_rng(seed)
+    return np.clip(0.5 + 0.02 * rng.standard_normal((T, n)).cumsum(axis=0), -0.1, 1.1)
+
+
+def test_float32_mode_stores_float32_and_outputs_float64():
+    contract = FrozenContract(precision="float32")
+    admitted = admit_trace(_raw(), contract)
+    assert admitted.psi.dtype == np.float32
+
+    frame = compute_tier1_frame(admitted.psi, contract)
+    assert frame.kappa.dtype == np.float64
+    assert np.isfinite(frame.S).all()  # 1-ε would round to 1.0 in float32
+
+    fused = admit_and_compute(_raw(), contract)
+    assert fused.psi.dtype == np.float32
+    assert np.array_equal(fused.oor.to_mask(), admitted.oor_mask)
+    assert np.array_equal(fused.frame.kappa, frame.kappa)
+
+
+def test_validation_harness_reports_small_deviation():
+    report = validate_precision(_raw(), FrozenContract())
+    assert report.precision == "float32"
+    assert report.rows == 300
+    assert report.weld_pairs == 299
+    for name, dev in report.max_abs_dev.items():
+        assert dev < 1e-5, name
+    assert report.oor_mismatches == 0
+    assert report.tau_mismatches == 0
+
+    same = validate_precision(_raw(), FrozenContract(), precision="float64")
+    assert same.decisions_agree
+    assert all(dev == 0.0 for dev in same.max_abs_dev.values())
+
+
+def test_precision_is_last_field_and_validated_eagerly():
+    assert [f.name for f in dataclasses.fields(FrozenContract)][-1] == "precision"
+    assert FrozenContract(0.0, 1.0, "pre_clip", "clip_and_flag", 1e-8, 3.0, 0.5).alpha == 0.5
+    with pytest.raises(ValueError):
+        FrozenContract(precision="float16")
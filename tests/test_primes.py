@@ -0,0 +1,37 @@
+import numpy as np
+
+from umcp.eid import prime_pi
+from umcp.primes import PrimeTable, SUBLINEAR_PI_MIN, _lucy_prime_count
+
+
+def _naive_primes(n):
+    return [k for k in range(2, n + 1) if all(k % d for d in range(2, int(k ** 0.5) + 1))]
+
+
+def test_table_grows_incrementally_and_matches_naive_sieve():
+    table = PrimeTable()
+    for n in (1, 2, 10, 97, 500, 3000):  # each call extends the previous table
+        assert table.upto(n).tolist() == _naive_primes(n)
+    assert table.limit == 3000
+    assert table.first(5).tolist() == [2, 3, 5, 7, 11]
+    assert table.first(1000)[-1] == 7919  # grows past the current limit
+    assert not table.upto(100).flags.writeable
+
+
+def test_sublinear_count_matches_table():
+    table = PrimeTable()
+    for n in (2, 3, 4, 30, 1000, 65_537, 10**6):
+        assert _lucy_prime_count(n) == table.count(n)
+    assert prime_pi(10**9) == 50_847_534
+    assert 10**9 > SUBLINEAR_PI_MIN
+
+
+def test_table_persists_to_disk(tmp_path):
+    src = PrimeTable()
+    src.extend_to(10_000)
+    src.save(tmp_path / "primes.npz")
+
+    dst = PrimeTable()
+    dst.load(tmp_path / "primes.npz")
+    assert dst.limit == 10_000
+    assert np.array_equal(dst.upto(10_000), src.upto(10_000))
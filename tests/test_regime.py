@@ -0,0 +1,44 @@
+import numpy as np
+
+from umcp.contract import FrozenContract
+from umcp.frame import compute_tier1_frame
+from umcp.regime import COLLAPSE, REGIME_NAMES, STABLE, WATCH, RegimeTimeline, classify_regime, classify_regimes
+
+
+def test_vectorized_codes_match_row_classifier():
+    rng = np.random.default_rng(8)
+    calm = np.full((40, 4), 0.001)  # near a face: low S, no drift -> Stable
+    drift = 0.5 + 0.05 * rng.standard_normal((40, 4))  # Watch
+    jumps = rng.random((40, 4))  # Collapse-sized jumps
+    psi = np.clip(np.concatenate([calm, drift, calm, jumps]), 0.0, 1.0)
+    contract = FrozenContract()
+    frame = compute_tier1_frame(psi, contract)
+
+    codes = classify_regimes(frame, contract)
+    assert codes.dtype == np.uint8
+    assert [REGIME_NAMES[c] for c in codes] == [classify_regime(r, contract) for r in frame]
+    assert {STABLE, WATCH, COLLAPSE} <= set(codes.tolist())
+
+
+def test_timeline_queries():
+    #        t: 10 11 12 13 14 15 16 17
+    codes = np.array([0, 0, 1, 2, 2, 1, 2, 0], dtype=np.uint8)
+    tl = RegimeTimeline.from_codes(codes, t0=10)
+
+    assert len(tl) == 6
+    assert [tl.regime_at(t) for t in range(10, 18)] == [REGIME_NAMES[c] for c in codes]
+    assert tl.run_at(14) == (13, 15, "Collapse")
+
+    assert tl.next_transition(10) == 12
+    assert tl.next_transition(13) == 15
+    assert tl.next_transition(17) is None
+
+    assert tl.intervals("Collapse", 10, 18) == [(13, 15), (16, 17)]
+    assert tl.intervals("Collapse", 14, 17) == [(14, 15), (16, 17)]
+    assert tl.intervals("Collapse", 15, 16) == []
+    assert tl.intervals("Stable", 11, 18) == [(11, 12), (17, 18)]
+
+    t, frm, to = tl.transitions()
+    assert t.tolist() == [12, 13, 15, 16, 17]
+    assert frm.tolist() == [0, 1, 2, 1, 2]
+    assert to.tolist() == [1, 2, 1, 2, 0]
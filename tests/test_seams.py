@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from umcp.contract import FrozenContract
+from umcp.frame import Tier1Frame
+from umcp.seams import count_seams, find_seams
+from umcp.weld import evaluate_weld
+
+
+def _frame(T=160, seed=0):
+    rng = np.random.default_rng(seed)
+    omega = rng.uniform(0.0, 0.6, T)
+    kappa = rng.uniform(-4.0, 0.0, T)
+    tau = rng.choice([1.0, 2.0, 3.0, np.inf], size=T)
+    return Tier1Frame(
+        omega=omega,
+        F=np.clip(1.0 - omega, 0.0, 1.0),
+        S=rng.uniform(0.0, 1.0, T),
+        C=rng.uniform(0.0, 0.3, T),
+        tau_R=tau,
+        IC=np.exp(kappa),
+        kappa=kappa,
+        t0=100,
+    )
+
+
+def _brute(frame, contract, max_distance=None):
+    rows = frame.rows()
+    out = []
+    for j in range(len(rows)):
+        for i in range(j):
+            if max_distance is not None and j - i > max_distance:
+                continue
+            w = evaluate_weld(rows[i], rows[j], contract)
+            if w.passed:
+                out.append((rows[i].t, rows[j].t, w.seam_residual))
+    return out
+
+
+@pytest.mark.parametrize("max_distance", [None, 5, 40])
+def test_find_seams_matches_all_pairs(max_distance):
+    frame = _frame()
+    contract = FrozenContract(tol_seam=0.05, tol_id=1e-9)
+    expect = _brute(frame, contract, max_distance)
+    assert len(expect) > 5
+
+    got = find_seams(frame, contract, max_distance=max_distance)
+    assert list(zip(got.pre_t.tolist(), got.post_t.tolist())) == [(a, b) for a, b, _ in expect]
+    assert got.receipts.passed.all()
+    np.testing.assert_array_equal(got.receipts.seam_residual, [s for _, _, s in expect])
+    assert count_seams(frame, contract, max_distance=max_distance) == len(expect)
+
+
+def test_best_only_keeps_min_residual_per_post():
+    frame = _frame(seed=1)
+    contract = FrozenContract(tol_seam=0.2)
+    best = {}
+    for a, b, s in _brute(frame, contract):
+        if b not in best or abs(s) < best[b][1] or (abs(s) == best[b][1] and a > best[b][0]):
+            best[b] = (a, abs(s))
+    got = find_seams(frame, contract, best_only=True)
+    assert dict(zip(got.post_t.tolist(), got.pre_t.tolist())) == {b: a for b, (a, _) in best.items()}
+    assert np.all(np.diff(got.post_t) > 0)
+
+
+def test_rows_input_and_no_matches():
+    frame = _frame(20)
+    contract = FrozenContract(tol_seam=1e-12)
+    assert len(find_seams(frame.rows(), contract)) == len(_brute(frame, contract))
+    with pytest.raises(ValueError):
+        find_seams(frame, contract, max_distance=0)
+
+
+def test_search_uses_ln_IC_not_kappa_column():
+    # The ledger is ln(IC1/IC0); a κ column that disagrees (e.g. after IC is
+    # clipped) must not move the search.
+    frame = _frame(seed=2)
+    cols = {k: frame.column(k) for k in ("omega", "F", "S", "C", "tau_R", "IC")}
+    shifted = Tier1Frame(**cols, kappa=frame.kappa + np.linspace(0.0, 1.0, len(frame)), t0=100)
+    contract = FrozenContract(tol_seam=0.05, tol_id=1e-9)
+    expect = _brute(shifted, contract)
+    assert len(expect) > 5
+    got = find_seams(shifted, contract)
+    assert list(zip(got.pre_t.tolist(), got.post_t.tolist())) == [(a, b) for a, b, _ in expect]
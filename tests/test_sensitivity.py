@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from umcp.closures import GammaNegLogOneMinusOmega, GammaOmegaPower, closure_derivative
+from umcp.contract import FrozenContract
+from umcp.sensitivity import kappa_sensitivity, seam_sensitivity
+from umcp.synthetic import synthetic_trace
+
+
+def _close(a, b, rtol, atol):
+    return np.allclose(a, b, rtol=rtol, atol=atol, equal_nan=True)
+
+
+def test_closure_derivatives_match_finite_differences():
+    w = np.linspace(0.01, 0.95, 40)
+    h = 1e-6
+    for g in (GammaOmegaPower(p=3.0), GammaOmegaPower(p=2.5, epsilon=1e-3), GammaNegLogOneMinusOmega()):
+        num = (g.evaluate(w + h) - g.evaluate(w - h)) / (2 * h)
+        assert _close(g.derivative(w), num, 1e-6, 1e-9)
+
+    g = GammaOmegaPower(p=2.5, epsilon=1e-3)
+    d = g.param_derivatives(w)
+    num_p = (GammaOmegaPower(p=2.5 + h, epsilon=1e-3).evaluate(w) - GammaOmegaPower(p=2.5 - h, epsilon=1e-3).evaluate(w)) / (2 * h)
+    assert _close(d["p"], num_p, 1e-5, 1e-9)
+    assert np.array_equal(d["epsilon"], np.ones_like(w))
+    assert np.array_equal(g.derivative(np.array([-0.1, 0.0])), [0.0, 0.0])
+
+    # Plain scalar callables fall back to a central difference.
+    assert _close(closure_derivative(lambda v: v * v, w), 2 * w, 1e-6, 1e-9)
+
+
+def test_kappa_analytic_matches_fd():
+    psi = np.vstack([synthetic_trace("periodic", 60, 5, period=7), synthetic_trace("drifting", 60, 5)])
+    psi[3, 0] = 0.0  # exercise the ε-clip in S
+    c = FrozenContract(epsilon=1e-3, alpha=0.7, lam=0.3, p=2.5)
+    an = kappa_sensitivity(psi, c)
+    fd = kappa_sensitivity(psi, c, method="fd")
+    assert an.d_kappa.shape == (4, 120)
+    for k, name in enumerate(an.params):
+        assert _close(an.d_kappa[k], fd.d_kappa[k], 1e-5, 1e-7), name
+    assert np.array_equal(an["alpha"], -an.frame.C)
+    assert np.array_equal(an["lam"], -an.frame.S)
+    assert np.allclose(an.d_IC("p"), an.frame.IC * an["p"])
+
+    # The budget is NaN at τ_R = ∞_rec, so both methods leave it undefined.
+    tau_inf = ~np.isfinite(an.frame.tau_R)
+    assert tau_inf.any()
+    assert np.isnan(an.d_budget[:, tau_inf]).all() and np.isnan(fd.d_budget[:, tau_inf]).all()
+    assert _close(an.d_budget, fd.d_budget, 1e-5, 1e-7)
+
+    blocked = kappa_sensitivity(psi, c, block_rows=7)
+    assert np.allclose(blocked.d_kappa, an.d_kappa, rtol=1e-12, atol=1e-14)
+
+
+def test_seam_analytic_matches_fd_reweld():
+    psi = synthetic_trace("periodic", 90, 4, period=10)
+    c = FrozenContract(tol_id=1e-6, tau_lookback=30, p=3.0)
+    pre = np.arange(20, 70)
+    post = pre + 10
+    an = seam_sensitivity(psi, c, pre, post)
+    fd = seam_sensitivity(psi, c, pre, post, method="fd")
+    assert an.shape == (4, 50)
+    assert np.isfinite(an).any()
+    assert np.array_equal(np.isnan(an), np.isnan(fd))
+    # ε = 1e-8 steps by the FD_ABS_STEP floor, not 1e-12.
+    assert _close(an, fd, 1e-5, 1e-7)
+
+
+def test_sensitivity_validation():
+    with pytest.raises(ValueError):
+        kappa_sensitivity(np.zeros((4, 2)), FrozenContract(), params=["tol_seam"])
+    with pytest.raises(ValueError):
+        kappa_sensitivity(np.zeros((4, 2)), FrozenContract(), method="adjoint")
@@ -0,0 +1,190 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import json
+
+import numpy as np
+import pytest
+
+from umcp.contract import FrozenContract
+from umcp.kernel import compute_tier1_series
+from umcp.service import IngestService, start_tcp_server
+from umcp.synthetic import synthetic_trace
+from umcp.tier0.admit import admit_trace
+
+
+async def _drain(svc, sid):
+    out = []
+    while (b := await svc.next_batch(sid)) is not None:
+        out.append(b)
+    return out
+
+
+def test_streams_match_batch_kernel_per_contract():
+    contracts = {
+        "a": FrozenContract(tol_id=1e-6, tau_lookback=16),
+        "b": FrozenContract(p=2.0, lam=0.5),
+    }
+    raws = {
+        "a": synthetic_trace("periodic", 150, 4, period=5, oor_rate=0.02),
+        "b": synthetic_trace("drifting", 90, 3, oor_rate=0.02),
+    }
+
+    async def main():
+        async with IngestService(max_batch=16, max_delay=0.001) as svc:
+            for sid, c in contracts.items():
+                svc.register(sid, c)
+
+            async def produce(sid):
+                for x in raws[sid]:
+                    await svc.submit(sid, x)
+                await svc.close_stream(sid)
+
+            prod = [asyncio.create_task(produce(sid)) for sid in raws]
+            got = {sid: await _drain(svc, sid) for sid in raws}
+            await asyncio.gather(*prod)
+            return got, svc.metrics()
+
+    got, metrics = asyncio.run(main())
+    for sid, batches in got.items():
+        assert all(b.ok for b in batches)
+        assert [b.t0 for b in batches] == list(np.cumsum([0] + [len(b.rows) for b in batches[:-1]]))
+        assert max(len(b.rows) for b in batches) <= 16
+        rows = [r for b in batches for r in b.rows]
+        adm = admit_trace(raws[sid], contracts[sid])
+        assert rows == compute_tier1_series(adm.psi, contracts[sid])
+        assert np.array_equal(np.vstack([b.oor_mask for b in batches]), adm.oor_mask)
+        m = metrics[sid]
+        assert m["samples_in"] == m["samples_out"] == len(raws[sid])
+        assert m["oor"] == int(adm.oor_mask.sum())
+        assert m["batches"] == len(batches) and m["latency_max_s"] >= m["latency_mean_s"] > 0.0
+
+
+def test_backpressure_and_bad_samples():
+    async def main():
+        svc = IngestService(queue_size=4, max_batch=2)
+        svc.register("s", FrozenContract(), n=3)
+        accepted = [svc.try_submit("s", np.zeros(3)) for _ in range(6)]
+        assert accepted == [True] * 4 + [False] * 2
+
+        blocked = asyncio.create_task(svc.submit("s", np.zeros(3)))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()  # producer is held until the consumer runs
+
+        try:
+            svc.try_submit("s", np.zeros(2))
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("wrong-width sample accepted")
+
+        await svc.start()
+        await asyncio.wait_for(blocked, 1.0)
+        await svc.close_stream("s")
+        batches = await _drain(svc, "s")
+        assert sum(len(b.rows) for b in batches) == 5
+        assert svc.metrics()["s"]["max_queue_depth"] == 4
+        await svc.stop()
+
+    asyncio.run(main())
+
+
+def test_tcp_producer_with_sink():
+    raw = synthetic_trace("drifting", 40, 2)
+    contract = FrozenContract()
+
+    async def main():
+        seen = []
+
+        async def sink(batch):
+            seen.append(batch)
+
+        svc = IngestService(max_batch=8, sink=sink)
+        svc.register("tcp", contract)
+        await svc.start()
+        server = await start_tcp_server(svc)
+        port = server.sockets[0].getsockname()[1]
+
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        for x in raw:
+            writer.write((json.dumps({"stream": "tcp", "sample": x.tolist()}) + "\n").encode())
+        writer.write(b'{"stream": "nope", "sample": [0, 0]}\n')
+        await writer.drain()
+        assert (await reader.readline()).startswith(b"error KeyError")
+        writer.close()
+        await reader.read()
+
+        server.close()
+        await server.wait_closed()
+        await svc.stop()
+        return seen
+
+    seen = asyncio.run(main())
+    rows = [r for b in seen for r in b.rows]
+    assert rows == compute_tier1_series(admit_trace(raw, contract).psi, contract)
+
+
+def test_failing_sink_is_counted_and_never_blocks_producers():
+    async def main():
+        calls = []
+
+        async def sink(batch):
+            calls.append(len(batch.rows))
+            raise OSError("downstream unavailable")
+
+        svc = IngestService(queue_size=2, max_batch=1, max_delay=0.0, sink=sink)
+        svc.register("s", FrozenContract(), n=2)
+        await svc.start()
+        for _ in range(10):
+            await asyncio.wait_for(svc.submit("s", np.zeros(2)), 1.0)
+        await asyncio.wait_for(svc.stop(), 1.0)
+        m = svc.metrics()["s"]
+        assert m["sink_errors"] == len(calls) == 10 and m["samples_out"] == 10
+
+    asyncio.run(main())
+
+
+def test_dead_consumer_shuts_stream_down():
+    async def main():
+        svc = IngestService(queue_size=2, max_batch=1)
+
+        async def broken(s, items, loop):
+            raise RuntimeError("boom")
+
+        svc._emit = broken
+        svc.register("s", FrozenContract(), n=2)
+        producers = [asyncio.create_task(svc.submit("s", np.zeros(2))) for _ in range(6)]
+        await svc.start()
+        done, pending = await asyncio.wait(producers, timeout=1.0)
+        assert not pending
+        assert any(isinstance(t.exception(), RuntimeError) for t in done)
+        try:
+            await svc.submit("s", np.zeros(2))
+        except RuntimeError as exc:
+            assert "boom" in str(exc)
+        else:
+            raise AssertionError("submit to a failed stream succeeded")
+        assert await asyncio.wait_for(svc.next_batch("s"), 1.0) is None
+        await asyncio.wait_for(svc.stop(), 1.0)
+
+    asyncio.run(main())
+
+
+def test_executor_must_be_a_thread_pool():
+    # Kernels are updated in place; a process pool would update a copy.
+    with ProcessPoolExecutor(max_workers=1) as pool, pytest.raises(TypeError):
+        IngestService(executor=pool)
+
+    contract = FrozenContract()
+    raw = synthetic_trace("drifting", 40, 3)
+
+    async def main():
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            async with IngestService(max_batch=8, max_delay=0.001, executor=pool) as svc:
+                svc.register("s", contract)
+                for x in raw:
+                    await svc.submit("s", x)
+                await svc.close_stream("s")
+                return await _drain(svc, "s")
+
+    rows = [r for b in asyncio.run(main()) for r in b.rows]
+    assert rows == compute_tier1_series(admit_trace(raw, contract).psi, contract)
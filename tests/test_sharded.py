@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from umcp.contract import FrozenContract
+from umcp.frame import TIER1_COLUMNS, compute_tier1_frame
+from umcp.sharded import compute_tier1_sharded
+from umcp.synthetic import synthetic_trace
+
+
+def _same(a, b):
+    return all(np.array_equal(a.column(k), b.column(k)) for k in TIER1_COLUMNS)
+
+
+def test_sharded_equals_serial_for_any_workers_and_shards():
+    psi = np.vstack([synthetic_trace("periodic", 300, 5, period=13), synthetic_trace("drifting", 200, 5)])
+    contract = FrozenContract(tol_id=1e-6, tau_lookback=40)
+    ref = compute_tier1_frame(psi, contract)
+    assert np.isfinite(ref.tau_R).sum() > 100
+
+    for workers, shard_rows in ((1, 37), (2, 37), (3, 64), (2, 1), (2, 499)):
+        out = compute_tier1_sharded(psi, contract, max_workers=workers, shard_rows=shard_rows, block_rows=16)
+        assert _same(out, ref), (workers, shard_rows)
+
+
+def test_sharded_float32_and_edges():
+    contract = FrozenContract(precision="float32", tau_lookback=3)
+    psi = synthetic_trace("collapsing", 50, 4)
+    assert _same(compute_tier1_sharded(psi, contract, max_workers=2, shard_rows=4), compute_tier1_frame(psi, contract))
+
+    for T in (0, 1, 2):
+        out = compute_tier1_sharded(np.full((T, 3), 0.5), contract, max_workers=2, shard_rows=1)
+        assert len(out) == T
+    with pytest.raises(ValueError):
+        compute_tier1_sharded(np.zeros((4, 2)), contract, shard_rows=0)
+
+
+def test_sharded_maps_file_backed_traces(tmp_path):
+    psi = synthetic_trace("periodic", 240, 4, period=11)
+    contract = FrozenContract(tol_id=1e-6, tau_lookback=30)
+    ref = compute_tier1_frame(psi, contract)
+
+    np.save(tmp_path / "psi.npy", psi)
+    psi.astype(np.float32).tofile(tmp_path / "psi.f32")
+    raw = np.memmap(tmp_path / "psi.f32", dtype=np.float32, mode="r").reshape(-1, 4)
+
+    out = compute_tier1_sharded(tmp_path / "psi.npy", contract, max_workers=2, shard_rows=50)
+    assert _same(out, ref)
+    # A row slice of a memmap is mapped at its own file offset.
+    out = compute_tier1_sharded(raw[40:], contract, max_workers=2, shard_rows=50)
+    assert _same(out, compute_tier1_frame(raw[40:], contract))
+    out = compute_tier1_sharded(tmp_path / "psi.f32", contract, n=4, dtype=np.float32, max_workers=2, shard_rows=64)
+    assert _same(out, compute_tier1_frame(raw, contract))
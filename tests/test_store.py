@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from umcp.contract import FrozenContract
+from umcp.frame import TIER1_COLUMNS, compute_tier1_frame
+from umcp.kernel import compute_tier1_series
+from umcp.store import FORMAT_VERSION, read_tier1, read_welds, write_tier1, write_welds
+from umcp.synthetic import synthetic_trace
+from umcp.weld import WELD_COLUMNS, evaluate_weld, evaluate_welds
+
+
+def test_tier1_roundtrip_is_zero_copy(tmp_path):
+    contract = FrozenContract(tol_id=1e-6, tau_lookback=40, precision="float32")
+    frame = compute_tier1_frame(synthetic_trace("periodic", 300, 5, period=13), contract)
+    frame = frame.slice(20, 300)  # t0 = 20
+    path = tmp_path / "series.umcp"
+    write_tier1(path, frame, contract)
+
+    stored = read_tier1(path)
+    assert stored.version == FORMAT_VERSION
+    assert stored.contract == contract
+    assert len(stored) == 280 and stored.frame.t0 == 20
+    for name in TIER1_COLUMNS:
+        col = stored.frame.column(name)
+        assert isinstance(col.base, np.memmap) or isinstance(col, np.memmap)
+        assert not col.flags.writeable
+        assert col.ctypes.data % 64 == 0
+        np.testing.assert_array_equal(col, frame.column(name))
+
+    part = stored.between(100, 110)
+    assert part.t0 == 100 and len(part) == 10
+    assert part.row(0) == frame.row(80)
+
+
+def test_tier1_from_rows_and_empty(tmp_path):
+    contract = FrozenContract()
+    rows = compute_tier1_series(synthetic_trace("drifting", 50, 3), contract)
+    write_tier1(tmp_path / "rows.umcp", rows, contract)
+    assert read_tier1(tmp_path / "rows.umcp").frame.rows() == rows
+
+    write_tier1(tmp_path / "empty.umcp", [], contract)
+    assert len(read_tier1(tmp_path / "empty.umcp")) == 0
+
+
+def test_weld_roundtrip(tmp_path):
+    contract = FrozenContract(tol_seam=10.0)
+    frame = compute_tier1_frame(synthetic_trace("collapsing", 80, 4), contract)
+    idx = np.arange(79)
+    table = evaluate_welds(frame, frame, contract, pre_index=idx, post_index=idx + 1)
+    write_welds(tmp_path / "w.umcp", table, contract)
+    stored = read_welds(tmp_path / "w.umcp")
+    assert stored.contract == contract
+    for name in WELD_COLUMNS:
+        np.testing.assert_array_equal(getattr(stored.table, name), getattr(table, name))
+
+    receipts = [evaluate_weld(frame.row(0), frame.row(1), contract)]
+    write_welds(tmp_path / "w1.umcp", receipts, contract)
+    np.testing.assert_array_equal(read_welds(tmp_path / "w1.umcp").table.seam_residual, [receipts[0].seam_residual])
+
+
+def test_rejects_bad_files(tmp_path):
+    contract = FrozenContract()
+    bad = tmp_path / "bad.umcp"
+    bad.write_bytes(b"not a umcp file at all")
+    with pytest.raises(ValueError, match="bad magic"):
+        read_tier1(bad)
+
+    path = tmp_path / "s.umcp"
+    write_tier1(path, compute_tier1_frame(synthetic_trace("stable", 10, 2), contract), contract)
+    with pytest.raises(ValueError, match="expected a 'weld' file"):
+        read_welds(path)
+
+    data = bytearray(path.read_bytes())
+    data[8] = FORMAT_VERSION + 1
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError, match="unsupported columnar format version"):
+        read_tier1(path)
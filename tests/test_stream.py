@@ -0,0 +1,44 @@
+import numpy as np
+
+from umcp.closures import GammaNegLogOneMinusOmega
+from umcp.contract import FrozenContract
+from umcp.kernel import compute_tier1_series
+from umcp.stream import Tier1Stream
+
+
+def _trace(T=120, n=4, seed=3):
+    rng = np.random.default_rng(seed)
+    states = rng.random((5, n))
+    return states[rng.integers(0, 5, size=T)]
+
+
+def test_stream_is_bitwise_identical_to_batch():
+    psi = _trace()
+    for contract, closure in (
+        (FrozenContract(tol_id=1e-6, tau_lookback=8), None),
+        (FrozenContract(tol_id=1e-6, tau_lookback=1), GammaNegLogOneMinusOmega()),
+        (FrozenContract(), None),
+    ):
+        batch = compute_tier1_series(psi, contract, closure)
+
+        stream = Tier1Stream(contract, closure)
+        rows = [stream.push(psi[0])]
+        rows += stream.update(psi[1:5])
+        for x_t in psi[5:]:
+            rows.extend(stream.update(x_t))
+
+        assert rows == batch
+        if contract.tol_id > contract.epsilon:
+            assert any(r.tau_R < float("inf") for r in rows)
+        assert stream.t == psi.shape[0]
+
+
+def test_stream_rejects_dimension_change():
+    stream = Tier1Stream(FrozenContract())
+    stream.push(np.zeros(3))
+    try:
+        stream.push(np.zeros(4))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError")
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from umcp.contract import FrozenContract
+from umcp.frame import TIER1_COLUMNS, compute_tier1_frame
+from umcp.regime.classify import classify_regimes
+from umcp.sweep import contract_grid, sweep_contracts
+from umcp.synthetic import synthetic_trace
+
+
+def test_sweep_equals_independent_frames():
+    psi = np.vstack([synthetic_trace("periodic", 80, 6, period=9), synthetic_trace("collapsing", 80, 6)])
+    base = FrozenContract(tau_lookback=24)
+    contracts = (
+        contract_grid(base, alpha=[0.5, 1.0], lam=[0.1, 0.4], tol_id=[1e-9, 1e-6])
+        + contract_grid(base, p=[2.0], stable_omega_max=[0.02, 0.05], watch_omega_max=[0.2])
+        + [FrozenContract(epsilon=1e-6, tol_id=1e-5, tau_lookback=4)]
+    )
+    res = sweep_contracts(psi, contracts)
+    assert len(res) == len(contracts) == 11
+    assert len(res.shared) == 3
+
+    for k, c in enumerate(contracts):
+        ref = compute_tier1_frame(psi, c)
+        got = res.frame(k)
+        for name in TIER1_COLUMNS:
+            assert np.array_equal(got.column(name), ref.column(name)), (k, name)
+        assert np.array_equal(res.regime_codes[k], classify_regimes(ref, c))
+    assert any(np.isfinite(res.tau_R[k]).any() for k, c in enumerate(contracts) if c.tol_id == 1e-6)
+
+
+def test_contract_grid_and_validation():
+    grid = contract_grid(FrozenContract(), alpha=[1, 2], lam=[3, 4, 5])
+    assert [(c.alpha, c.lam) for c in grid][:4] == [(1, 3), (1, 4), (1, 5), (2, 3)]
+    with pytest.raises(ValueError):
+        contract_grid(FrozenContract(), gamma=[1])
+    with pytest.raises(ValueError):
+        sweep_contracts(np.zeros((3, 2)), [])
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from umcp.contract import FrozenContract
+from umcp.kernel import _return_lag
+from umcp.tau import lag_projections, return_lags
+
+
+def _brute(psi, contract, start=0, stop=None):
+    stop = psi.shape[0] if stop is None else stop
+    return np.array(
+        [
+            _return_lag(psi, t=t, tol_id=contract.tol_id, lookback=contract.tau_lookback, p=contract.p, eps=contract.epsilon)
+            for t in range(start, stop)
+        ]
+    )
+
+
+def _recurrent_trace(T=300, n=4, seed=1):
+    # Small state alphabet plus jitter: many near-returns, some exact ones.
+    rng = np.random.default_rng(seed)
+    states = rng.random((6, n))
+    psi = states[rng.integers(0, 6, size=T)]
+    psi = psi + 1e-7 * rng.standard_normal(psi.shape) * (rng.random((T, 1)) < 0.5)
+    return np.clip(psi, 0.0, 1.0)
+
+
+def test_return_lags_match_brute_force():
+    psi = _recurrent_trace()
+    for contract in (
+        FrozenContract(tol_id=1e-6, tau_lookback=32),
+        FrozenContract(tol_id=3e-7, tau_lookback=5, p=1.0),
+        FrozenContract(tol_id=1e-4, tau_lookback=64, p=0.5),
+        FrozenContract(tol_id=1e-6, tau_lookback=32, p=-1.0),  # no pruning bound: brute fallback
+    ):
+        fast = return_lags(psi, contract)
+        assert np.array_equal(fast, _brute(psi, contract))
+        assert np.isfinite(fast).any()
+
+        window = return_lags(psi, contract, start=100, stop=180)
+        assert np.array_equal(window, fast[100:180])
+
+
+def test_default_contract_never_returns():
+    # ε = 1e-8 > tol_id = 1e-9, so the ε-stabilized norm can never pass.
+    psi = np.zeros((50, 3))
+    assert np.isinf(return_lags(psi, FrozenContract())).all()
+    assert np.isinf(_brute(psi, FrozenContract())).all()
+
+
+def test_long_lookback_finds_distant_return():
+    rng = np.random.default_rng(2)
+    psi = rng.random((20_000, 8))
+    psi[-1] = psi[3]
+    contract = FrozenContract(tol_id=1e-6, tau_lookback=50_000)
+
+    tau = return_lags(psi, contract, start=19_990)
+    assert tau[-1] == 20_000 - 1 - 3
+    assert np.isinf(tau[:-1]).all()
+
+
+def test_shared_projections_give_same_lags():
+    rng = np.random.default_rng(7)
+    psi = np.clip(0.5 + 0.01 * rng.standard_normal((400, 6)).cumsum(axis=0), 0, 1)
+    psi[200:260] = psi[140:200]
+    contract = FrozenContract(tol_id=0.02, tau_lookback=64)
+    proj = lag_projections(psi, 36, 400)
+    for a, b in ((100, 164), (164, 400), (260, 261)):
+        assert np.array_equal(return_lags(psi, contract, start=a, stop=b, projections=proj), return_lags(psi, contract, start=a, stop=b))
+    with pytest.raises(ValueError):
+        return_lags(psi, contract, start=50, stop=60, projections=proj)
@@ -1,8 +1,12 @@
 import math
 
+import numpy as np
+
 from umcp.contract import FrozenContract
+from umcp.frame import compute_tier1_frame
+from umcp.instrument import collect
 from umcp.kernel import Tier1Row
-from umcp.weld import evaluate_weld
+from umcp.weld import evaluate_weld, evaluate_welds
 
 
 def test_weld_passes_when_budget_closes_ledger():
@@ -80,3 +84,47 @@ def test_weld_fails_if_seam_residual_exceeds_tolerance():
     weld = evaluate_weld(pre=pre, post=post, contract=contract)
     assert weld.passed is False
     assert abs(weld.seam_residual) > contract.tol_seam
+
+
+def test_evaluate_welds_matches_scalar_receipts():
+    rng = np.random.default_rng(7)
+    states = rng.random((4, 3))
+    psi = states[rng.integers(0, 4, size=40)]
+    contract = FrozenContract(tol_id=1e-6, tol_seam=1.0, tau_lookback=8)
+    frame = compute_tier1_frame(psi, contract)
+
+    i0, i1 = np.triu_indices(len(frame), k=1)
+    table = evaluate_welds(frame, frame, contract, pre_index=i0, post_index=i1)
+
+    assert len(table) == i0.size
+    assert table.passed.any() and not table.passed.all()
+    for k in range(0, i0.size, 7):
+        ref = evaluate_weld(frame.row(int(i0[k])), frame.row(int(i1[k])), contract)
+        got = table.receipt(k)
+        assert got.passed is ref.passed
+        if math.isfinite(ref.seam_residual):
+            assert math.isclose(got.seam_residual, ref.seam_residual, rel_tol=0.0, abs_tol=1e-12)
+
+    # Put the seam tolerance exactly on one pair's |s|: the decision must follow evaluate_weld.
+    k = int(np.flatnonzero(table.passed)[0])
+    ref = evaluate_weld(frame.row(int(i0[k])), frame.row(int(i1[k])), contract)
+    edge = FrozenContract(tol_id=1e-6, tol_seam=abs(ref.seam_residual), tau_lookback=8)
+    edge_table = evaluate_welds(frame, frame, edge, pre_index=i0[k:k + 1], post_index=i1[k:k + 1])
+    assert bool(edge_table.passed[0]) is evaluate_weld(frame.row(int(i0[k])), frame.row(int(i1[k])), edge).passed is True
+
+
+def test_evaluate_welds_counts_each_pair_once():
+    contract = FrozenContract(tol_id=1e-6, tau_lookback=8)
+    rng = np.random.default_rng(3)
+    frame = compute_tier1_frame(rng.random((4, 3))[rng.integers(0, 4, size=30)], contract)
+    i0, i1 = np.triu_indices(len(frame), k=1)
+    table = evaluate_welds(frame, frame, contract, pre_index=i0, post_index=i1)
+    # A tolerance exactly on one |s| forces a borderline re-check of that pair.
+    k = int(np.flatnonzero(np.isfinite(table.seam_residual))[0])
+    edge = FrozenContract(tol_id=1e-6, tol_seam=abs(float(table.seam_residual[k])), tau_lookback=8)
+
+    with collect() as c:
+        table = evaluate_welds(frame, frame, edge, pre_index=i0, post_index=i1)
+    assert c.count("weld.evaluated") == i0.size
+    assert c.count("weld.passed") == int(table.passed.sum())
+    assert c.count("weld.inf_rec") == int(np.count_nonzero(~np.isfinite(table.tau_R)))
@@ -0,0 +1,43 @@
+import numpy as np
+
+from umcp.contract import FrozenContract
+from umcp.frame import FRAME_ABS_TOL, TIER1_COLUMNS, compute_tier1_frame
+from umcp.instrument import collect
+from umcp.synthetic import synthetic_trace
+from umcp.wide import compute_tier1_wide
+
+
+def test_wide_matches_frame_and_is_thread_count_invariant():
+    contract = FrozenContract(tol_id=1e-6, tau_lookback=12)
+    psi = np.vstack([synthetic_trace("periodic", 40, 1000, period=6), synthetic_trace("drifting", 30, 1000)])
+    ref = compute_tier1_frame(psi, contract)
+
+    runs = [compute_tier1_wide(psi, contract, max_workers=w, coord_block=96, tile_rows=7) for w in (1, 3, 8)]
+    for out in runs[1:]:
+        for name in TIER1_COLUMNS:
+            assert np.array_equal(out.column(name), runs[0].column(name))
+
+    for name in TIER1_COLUMNS:
+        np.testing.assert_allclose(runs[0].column(name), ref.column(name), rtol=0, atol=FRAME_ABS_TOL)
+    assert np.array_equal(runs[0].tau_R, ref.tau_R)
+    assert np.isfinite(ref.tau_R).sum() > 20
+
+
+def test_wide_small_shapes():
+    contract = FrozenContract()
+    for T, n in ((1, 3), (2, 5), (5, 1)):
+        psi = synthetic_trace("drifting", T, n)
+        ref = compute_tier1_frame(psi, contract)
+        out = compute_tier1_wide(psi, contract, max_workers=2, coord_block=2, tile_rows=1)
+        for name in TIER1_COLUMNS:
+            np.testing.assert_allclose(out.column(name), ref.column(name), rtol=0, atol=FRAME_ABS_TOL)
+    assert len(compute_tier1_wide(np.zeros((0, 4)), contract)) == 0
+
+
+def test_wide_tau_counters_are_collected():
+    contract = FrozenContract(tol_id=1e-6, tau_lookback=12)
+    psi = synthetic_trace("periodic", 50, 200, period=6)
+    with collect() as c:
+        out = compute_tier1_wide(psi, contract, max_workers=3, coord_block=64, tile_rows=8)
+    assert c.count("tau.rows") == 50
+    assert c.count("tau.inf_rec") == int(np.count_nonzero(np.isinf(out.tau_R)))
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from umcp.contract import FrozenContract
+from umcp.frame import compute_tier1_frame
+from umcp.kernel import compute_tier1_series
+from umcp.regime.classify import STABLE, classify_regimes
+from umcp.synthetic import synthetic_trace
+from umcp.window import RollingTier1, rolling_window_stats
+
+
+def _series():
+    psi = np.vstack([synthetic_trace(r, 60, 5, seed=i) for i, r in enumerate(["stable", "drifting", "stable", "collapsing"])])
+    return psi
+
+
+def test_matches_naive_window_reductions():
+    contract = FrozenContract()
+    frame = compute_tier1_frame(_series(), contract)
+    codes = classify_regimes(frame, contract)
+    windows = (1, 7, 32, 500)
+    stats = rolling_window_stats(frame, contract, windows=windows)
+
+    for W in windows:
+        for i in range(len(frame)):
+            lo = max(0, i - W + 1)
+            assert stats[W]["mean_omega"][i] == pytest.approx(frame.omega[lo:i + 1].mean(), rel=1e-12, abs=1e-15)
+            assert stats[W]["min_IC"][i] == frame.IC[lo:i + 1].min()
+            assert stats[W]["max_C"][i] == frame.C[lo:i + 1].max()
+            assert stats[W]["frac_Stable"][i] == np.mean(codes[lo:i + 1] == STABLE)
+
+
+def test_row_by_row_equals_batch_and_custom_aggregates():
+    contract = FrozenContract()
+    rows = compute_tier1_series(_series(), contract)
+    aggs = [("max", "omega"), ("mean", "S"), ("frac", "Collapse")]
+    batch = rolling_window_stats(rows, contract, windows=(5, 20), aggregates=aggs)
+
+    roll = RollingTier1(contract, windows=(5, 20), aggregates=aggs)
+    for i, row in enumerate(rows):
+        out = roll.push(row)
+        for W in (5, 20):
+            assert set(out[W]) == {"max_omega", "mean_S", "frac_Collapse"}
+            for key, v in out[W].items():
+                assert batch[W][key][i] == v
+    assert roll.t == len(rows)
+    assert batch[20]["frac_Collapse"][-1] > 0.0
+
+
+def test_rejects_bad_specs():
+    c = FrozenContract()
+    with pytest.raises(ValueError):
+        RollingTier1(c, windows=(0,))
+    with pytest.raises(ValueError):
+        RollingTier1(c, aggregates=[("median", "omega")])
+    with pytest.raises(ValueError):
+        RollingTier1(c, aggregates=[("mean", "t")])
+    with pytest.raises(ValueError):
+        RollingTier1(c, aggregates=[("frac", "Calm")])